@@ -5,12 +5,18 @@ from datetime import datetime, time
 from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 from typing import Optional
+from alertbot.utils import config
+from alertbot.utils import clock
+from alertbot.alerts.delivery import discord_delivery
+from alertbot.utils.metrics import metrics
+from alertbot.utils.event_trace import event_traces
+from alertbot.alerts.context import SessionContext
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
 class Base:
-    def __init__(self, product_name: Optional[str] = None, variables: Optional[str] = None, files: Optional[str] = None):
+    def __init__(self, product_name: Optional[str] = None, variables: Optional[str] = None, files: Optional[str] = None, context: Optional[SessionContext] = None):
         self.discord_webhooks_playbook = {
             'ES': os.getenv("DISCORD_PLAYBOOK_ES_WEBHOOK"),
             'NQ': os.getenv("DISCORD_PLAYBOOK_NQ_WEBHOOK"),
@@ -32,10 +38,14 @@ class Base:
         self.product_name = product_name
         self.variables = variables
         self.files = files
+        # Derived session metrics, shared with the product's other playbooks when handed in
+        if context is None and product_name is not None and variables is not None:
+            context = SessionContext(product_name, variables)
+        self.context = context
         
         # TimeZone Setup
         self.est = ZoneInfo('America/New_York')
-        self.current_datetime = datetime.now(self.est)
+        self.current_datetime = clock.now(self.est)
         self.current_time = self.current_datetime.time()
         
         # Time Regulations for Equity Products
@@ -56,19 +66,46 @@ class Base:
         self.crude_dogw_start = time(9, 10)
         self.equity_dogw_start = time(9, 40)
 
-    def fetch_latest_variables(self, product_name):
+    def product_files(self, product_name):
+        return [task for task in self.files if task["name"].split('_')[0] == product_name]
+
+    def fetch_snapshot(self, product_names):
+        from alertbot.source.startup import Initialization
+        snapshot = {}
+        for product_name in product_names:
+            try:
+                snapshot.update(Initialization.prep_data(self.product_files(product_name)))
+            except Exception as e:
+                logger.error(f" Base | fetch_snapshot | Product: {product_name} | Note: Failed to load variables: {e}")
+        return snapshot
+
+    def fetch_latest_variables(self, product_name, snapshot=None):
+        if snapshot is not None:
+            return snapshot.get(product_name)
         from alertbot.source.startup import Initialization
-        all_variables = Initialization.prep_data(self.files)
+        all_variables = Initialization.prep_data(self.product_files(product_name))
         return all_variables.get(product_name)
 
+    def build_embed(self):
+        with metrics.stage("embed", self.product_name):
+            return self.discord_message()
+
     def send_discord_embed(self, webhook_url, embed, username=None, avatar_url=None):
-        if webhook_url:
+        if webhook_url and config.async_discord:
+            # Handed to the background sender; the condition thread never waits on Discord
+            discord_delivery.submit(webhook_url, embed, username=username, avatar_url=avatar_url)
+        elif webhook_url:
+            trace = event_traces.submitted()
             try:
                 webhook = DiscordWebhook(url=webhook_url, username=username, avatar_url=avatar_url)
                 webhook.add_embed(embed)
-                response = webhook.execute()
+                with metrics.stage("send", self.product_name):
+                    response = webhook.execute()
+                metrics.webhook_response(response.status_code, self.product_name, metrics.labels()[1])
+                event_traces.delivered(trace, response.status_code)
                 logger.info(f"Message sent to Discord webhook: {webhook_url} | Response Code: {response.status_code}")
             except Exception as e:
+                event_traces.delivered(trace, "error")
                 logger.error(f"Failed to send message to Discord webhook: {e}")
         else:
             logger.warning(f"No Discord webhook URL configured for the product '{self.product_name}'.")
@@ -3,21 +3,22 @@ import threading
 from datetime import datetime
 from alertbot.alerts.base import Base
 from discord_webhook import DiscordEmbed
+from alertbot.utils import clock
 logger = logging.getLogger(__name__)
 
 last_alerts = {}
 last_alerts_lock = threading.Lock()
 
 class NEUTRAL(Base):
-    def __init__(self, product_name, variables):    
-        super().__init__(product_name=product_name, variables=variables)
+    def __init__(self, product_name, variables, context=None):    
+        super().__init__(product_name=product_name, variables=variables, context=context)
         
         # Variables (Round All Variables)
-        self.cpl = round(self.variables.get(f'{self.product_name}_CPL'), 2)
-        self.ib_high = round(self.variables.get(f'{product_name}_IB_HIGH'), 2)
-        self.ib_low = round(self.variables.get(f'{product_name}_IB_LOW'), 2)
-        self.day_high = round(self.variables.get(f'{product_name}_DAY_HIGH'), 2)
-        self.day_low = round(self.variables.get(f'{product_name}_DAY_LOW'), 2)
+        self.cpl = round(self.variables.cpl, 2)
+        self.ib_high = round(self.variables.ib_high, 2)
+        self.ib_low = round(self.variables.ib_low, 2)
+        self.day_high = round(self.variables.day_high, 2)
+        self.day_low = round(self.variables.day_low, 2)
         
 # ---------------------------------- Driving Input Logic ------------------------------------ #      
     def input(self, last_state):
@@ -31,7 +32,7 @@ class NEUTRAL(Base):
         # Check if both IBH and IBL have been extended
         if self.day_high > self.ib_high and self.day_low < self.ib_low:
             # Both sides have been extended, do not send an alert
-            logger.debug(f" NEUTRAL | input | Product: {self.product_name} | Note: Both IBH and IBL have been extended, no alert will be sent")
+            logger.debug(" NEUTRAL | input | Product: %s | Note: Both IBH and IBL have been extended, no alert will be sent", self.product_name)
             return False
 
         logic = False
@@ -42,7 +43,7 @@ class NEUTRAL(Base):
                 logic = True
                 self.neutral_type = 'Lower'
                 last_state['has_alerted_neutral_lower'] = True
-                logger.debug(f" NEUTRAL | input | Product: {self.product_name} | Note: Neutral Lower detected")
+                logger.debug(" NEUTRAL | input | Product: %s | Note: Neutral Lower detected", self.product_name)
 
         # Check for Neutral Higher scenario
         elif self.day_low < self.ib_low and not has_alerted_neutral_higher:
@@ -50,35 +51,35 @@ class NEUTRAL(Base):
                 logic = True
                 self.neutral_type = 'Higher'
                 last_state['has_alerted_neutral_higher'] = True
-                logger.debug(f" NEUTRAL | input | Product: {self.product_name} | Note: Neutral Higher detected")
+                logger.debug(" NEUTRAL | input | Product: %s | Note: Neutral Higher detected", self.product_name)
 
         return logic
 # ---------------------------------- Opportunity Window ------------------------------------ #   
     def time_window(self):
         
         # Update current time
-        self.current_datetime = datetime.now(self.est)
+        self.current_datetime = clock.now(self.est)
         self.current_time = self.current_datetime.time()
         
         # Define time windows based on product type
         if self.product_name == 'CL':
             start_time = self.crude_ib
             end_time = self.crude_close
-            logger.debug(f" NEUTRAL | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug(" NEUTRAL | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         elif self.product_name in ['ES', 'RTY', 'NQ']:
             start_time = self.equity_ib
             end_time = self.equity_close
-            logger.debug(f" NEUTRAL | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug(" NEUTRAL | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         else:
             logger.warning(f" NEUTRAL | time_window | Product: {self.product_name} | No time window defined.")
             return False  
         
         # Check if current time is within the window
         if start_time <= self.current_time <= end_time:
-            logger.debug(f" NEUTRAL | time_window | Product: {self.product_name} | Within Window: {self.current_time}.")
+            logger.debug(" NEUTRAL | time_window | Product: %s | Within Window: %s.", self.product_name, self.current_time)
             return True
         else:
-            logger.debug(f" NEUTRAL | time_window | Product: {self.product_name} | Outside Window {self.current_time}.")
+            logger.debug(" NEUTRAL | time_window | Product: %s | Outside Window %s.", self.product_name, self.current_time)
             return False
 # ---------------------------------- Main Function ------------------------------------ #      
     def check(self):
@@ -93,7 +94,7 @@ class NEUTRAL(Base):
                     'has_alerted_neutral_higher': False
                 }
                 last_alerts[self.product_name] = last_state
-                logger.debug(f" NEUTRAL | check | Product: {self.product_name} | Note: Initialized last_state")
+                logger.debug(" NEUTRAL | check | Product: %s | Note: Initialized last_state", self.product_name)
 
             # Evaluate the input
             logic = self.input(last_state)
@@ -107,7 +108,7 @@ class NEUTRAL(Base):
             except Exception as e:
                 logger.error(f" NEUTRAL | check | Product: {self.product_name} | Note: Failed to send Slack alert: {e}")
         else:
-            logger.debug(f" NEUTRAL | check | Product: {self.product_name} | Note: No alert sent")
+            logger.debug(" NEUTRAL | check | Product: %s | Note: No alert sent", self.product_name)
 # ---------------------------------- Alert Preparation------------------------------------ # 
     def discord_message(self):
         color_name = self.product_color.get(self.product_name, ":black_large_square:")   # Default to grey if not found
@@ -132,7 +133,7 @@ class NEUTRAL(Base):
         return embed 
     
     def execute(self):
-        embed = self.discord_message()
+        embed = self.build_embed()
         
         try:
             # Send the embed using the alert webhook
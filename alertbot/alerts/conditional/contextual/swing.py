@@ -2,6 +2,7 @@ import logging
 import math
 from datetime import datetime
 from alertbot.utils import config
+from alertbot.utils import clock
 from alertbot.alerts.base import Base
 from discord_webhook import DiscordEmbed, DiscordWebhook
 import threading
@@ -12,15 +13,15 @@ last_alerts = {}
 last_alerts_lock = threading.Lock()
 
 class SWING_BIAS(Base):
-    def __init__(self, product_name, variables):    
-        super().__init__(product_name=product_name, variables=variables)
+    def __init__(self, product_name, variables, context=None):    
+        super().__init__(product_name=product_name, variables=variables, context=context)
         
         # Variables
         self.es_bias = config.es_swing_bias
         self.nq_bias = config.nq_swing_bias
         self.rty_bias = config.rty_swing_bias
         self.cl_bias = config.cl_swing_bias
-        self.cpl = round(self.variables.get(f'{self.product_name}_CPL'), 2)
+        self.cpl = round(self.variables.cpl, 2)
         
 # ---------------------------------- Driving Input Logic ------------------------------------ #         
     def input(self):
@@ -77,7 +78,7 @@ class SWING_BIAS(Base):
         )    
 
         logger.debug(
-            f" SWING | input | Product: {self.product_name} | Bias_Symbol: {self.bias_char} | Bias_Price: {self.price} | Last_Price: {self.cpl} | LOGIC: {logic}"
+            " SWING | input | Product: %s | Bias_Symbol: %s | Bias_Price: %s | Last_Price: %s | LOGIC: %s", self.product_name, self.bias_char, self.price, self.cpl, logic
         )
         
         return logic
@@ -85,28 +86,28 @@ class SWING_BIAS(Base):
     def time_window(self):
         
         # Update current time
-        self.current_datetime = datetime.now(self.est)
+        self.current_datetime = clock.now(self.est)
         self.current_time = self.current_datetime.time()
         
         # Define time windows based on product type
         if self.product_name == 'CL':
             start_time = self.crude_open
             end_time = self.crude_close
-            logger.debug(f" SWING | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug(" SWING | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         elif self.product_name in ['ES', 'RTY', 'NQ']:
             start_time = self.equity_open
             end_time = self.equity_close
-            logger.debug(f" SWING | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug(" SWING | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         else:
             logger.warning(f" SWING | time_window | Product: {self.product_name} | No time window defined.")
             return False  
         
         # Check if current time is within the window
         if start_time <= self.current_time <= end_time:
-            logger.debug(f" SWING | time_window | Product: {self.product_name} | Within Window: {self.current_time}.")
+            logger.debug(" SWING | time_window | Product: %s | Within Window: %s.", self.product_name, self.current_time)
             return True
         else:
-            logger.debug(f" SWING | time_window | Product: {self.product_name} | Outside Window {self.current_time}.")
+            logger.debug(" SWING | time_window | Product: %s | Outside Window %s.", self.product_name, self.current_time)
             return False   
 # ---------------------------------- Main Function ------------------------------------ #                  
     def check(self):
@@ -116,8 +117,8 @@ class SWING_BIAS(Base):
             
             with last_alerts_lock:
                 last_alert = last_alerts.get(self.product_name)   
-                current_date = datetime.now().date()
-                logger.debug(f" SWING | check | Product: {self.product_name} | Current Alert: {self.direction} | Last Alert: {last_alert}")
+                current_date = clock.now().date()
+                logger.debug(" SWING | check | Product: %s | Current Alert: %s | Last Alert: %s", self.product_name, self.direction, last_alert)
                 
                 if last_alert != current_date: 
                     logger.info(f" SWING | check | Product: {self.product_name} | Note: Condition Met")
@@ -127,9 +128,9 @@ class SWING_BIAS(Base):
                     except Exception as e:
                         logger.error(f" SWING | check | Product: {self.product_name} | Note: Failed to send Discord alert: {e}")
                 else:
-                    logger.debug(f" SWING | check | Product: {self.product_name} | Note: Alert Already Sent Today")
+                    logger.debug(" SWING | check | Product: %s | Note: Alert Already Sent Today", self.product_name)
         else:
-            logger.debug(f" SWING | check | Product: {self.product_name} | Note: Condition Not Met Or No Bias")
+            logger.debug(" SWING | check | Product: %s | Note: Condition Not Met Or No Bias", self.product_name)
 # ---------------------------------- Alert Preparation------------------------------------ #  
     def discord_message(self):
         
@@ -165,7 +166,7 @@ class SWING_BIAS(Base):
     
     def execute(self):
         
-        embed = self.discord_message()
+        embed = self.build_embed()
         
         try:
             # Send the embed using the alert webhook
@@ -1,10 +1,11 @@
 import logging
-import math
 import threading
 from datetime import datetime, time
 from alertbot.utils import config
+from alertbot.utils import clock
 from discord_webhook import DiscordEmbed
 from alertbot.alerts.base import Base
+from alertbot.utils.trace import decision_trace
 from zoneinfo import ZoneInfo
 logger = logging.getLogger(__name__)
 
@@ -12,43 +13,39 @@ last_alerts = {}
 last_alerts_lock = threading.Lock()
 
 class IBGW(Base):
-    def __init__(self, product_name, variables):    
-        super().__init__(product_name=product_name, variables=variables)
+    def __init__(self, product_name, variables, context=None):    
+        super().__init__(product_name=product_name, variables=variables, context=context)
         
         # Variables (Round All Variables)
-        self.prior_vpoc = self.safe_round(variables.get(f'{self.product_name}_PRIOR_VPOC'))
-        self.day_open = self.safe_round(variables.get(f'{self.product_name}_DAY_OPEN'))
-        self.prior_high = self.safe_round(variables.get(f'{self.product_name}_PRIOR_HIGH'))
-        self.prior_low = self.safe_round(variables.get(f'{self.product_name}_PRIOR_LOW'))
-        self.ib_atr = self.safe_round(variables.get(f'{self.product_name}_IB_ATR'))
-        self.euro_ibh = self.safe_round(variables.get(f'{self.product_name}_EURO_IBH'))
-        self.euro_ibl = self.safe_round(variables.get(f'{self.product_name}_EURO_IBL'))
-        self.cpl = self.safe_round(variables.get(f'{self.product_name}_CPL'))
-        self.prior_close = self.safe_round(variables.get(f'{self.product_name}_PRIOR_CLOSE'))
-        self.prior_ibh = self.safe_round(variables.get(f'{self.product_name}_PRIOR_IB_HIGH'))
-        self.prior_ibl = self.safe_round(variables.get(f'{self.product_name}_PRIOR_IB_LOW'))                
-        self.ib_high = self.safe_round(variables.get(f'{product_name}_IB_HIGH'))
-        self.ib_low = self.safe_round(variables.get(f'{product_name}_IB_LOW'))     
-        self.day_high = self.safe_round(variables.get(f'{product_name}_DAY_HIGH'))
-        self.day_low = self.safe_round(variables.get(f'{product_name}_DAY_LOW'))             
-        self.a_high = self.safe_round(variables.get(f'{product_name}_A_HIGH'))
-        self.a_low = self.safe_round(variables.get(f'{product_name}_A_LOW'))
-        self.orh = self.safe_round(variables.get(f'{self.product_name}_ORH'))
-        self.orl = self.safe_round(variables.get(f'{self.product_name}_ORL'))        
-        self.b_high = self.safe_round(variables.get(f'{product_name}_B_HIGH'))
-        self.b_low = self.safe_round(variables.get(f'{product_name}_B_LOW')) 
-        self.vwap_slope = variables.get(f'{product_name}_VWAP_SLOPE')  
-        self.fd_vpoc = self.safe_round(variables.get(f'{product_name}_5D_VPOC'))
-        self.td_vpoc = self.safe_round(variables.get(f'{product_name}_20D_VPOC'))
-        self.overnight_high = self.safe_round(variables.get(f'{product_name}_OVNH'))
-        self.overnight_low = self.safe_round(variables.get(f'{product_name}_OVNL'))                     
-        self.day_vpoc = self.safe_round(variables.get(f'{product_name}_DAY_VPOC')) 
-        self.es_impvol = config.es_impvol
-        self.nq_impvol = config.nq_impvol
-        self.rty_impvol = config.rty_impvol
-        self.cl_impvol = config.cl_impvol 
+        self.prior_vpoc = self.safe_round(variables.prior_vpoc)
+        self.day_open = self.safe_round(variables.day_open)
+        self.prior_high = self.safe_round(variables.prior_high)
+        self.prior_low = self.safe_round(variables.prior_low)
+        self.ib_atr = self.safe_round(variables.ib_atr)
+        self.euro_ibh = self.safe_round(variables.euro_ibh)
+        self.euro_ibl = self.safe_round(variables.euro_ibl)
+        self.cpl = self.safe_round(variables.cpl)
+        self.prior_close = self.safe_round(variables.prior_close)
+        self.prior_ibh = self.safe_round(variables.prior_ib_high)
+        self.prior_ibl = self.safe_round(variables.prior_ib_low)                
+        self.ib_high = self.safe_round(variables.ib_high)
+        self.ib_low = self.safe_round(variables.ib_low)     
+        self.day_high = self.safe_round(variables.day_high)
+        self.day_low = self.safe_round(variables.day_low)             
+        self.a_high = self.safe_round(variables.period("period_high", "A"))
+        self.a_low = self.safe_round(variables.period("period_low", "A"))
+        self.orh = self.safe_round(variables.orh)
+        self.orl = self.safe_round(variables.orl)        
+        self.b_high = self.safe_round(variables.period("period_high", "B"))
+        self.b_low = self.safe_round(variables.period("period_low", "B")) 
+        self.vwap_slope = variables.vwap_slope  
+        self.fd_vpoc = self.safe_round(variables.vpoc_5d)
+        self.td_vpoc = self.safe_round(variables.vpoc_20d)
+        self.overnight_high = self.safe_round(variables.ovnh)
+        self.overnight_low = self.safe_round(variables.ovnl)                     
+        self.day_vpoc = self.safe_round(variables.day_vpoc) 
         
-        self.exp_rng = self.exp_range() 
+        self.exp_rng = self.context.exp_range()[0] 
         
     def safe_round(self, value, digits=2):
         if value is None:
@@ -61,237 +58,36 @@ class IBGW(Base):
             return 0 
 # ---------------------------------- Specific Calculations ------------------------------------ #   
     def prior_day(self):
-        if self.prior_high <= self.prior_ibh and self.prior_low >= self.prior_ibl:
-            day_type = "Rotational"
-        elif (self.prior_low < self.prior_ibl and self.prior_high > self.prior_ibh and 
-            self.prior_close >= self.prior_ibh + 0.5 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Directional"
-        elif (self.prior_low < self.prior_ibl and self.prior_high > self.prior_ibh and 
-            self.prior_close <= self.prior_ibl - 0.5 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Directional"
-        elif (self.prior_high > self.prior_ibh and self.prior_low < self.prior_ibl and
-            self.prior_close >= (self.prior_ibl - 0.5 * (self.prior_ibh - self.prior_ibl)) and
-            self.prior_close <= (self.prior_ibh + 0.5 * (self.prior_ibh - self.prior_ibl))):
-            day_type = "Rotational"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and 
-            self.prior_high <= self.prior_ibh + 0.5 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Rotational"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and 
-            self.prior_low >= self.prior_ibl - 0.5 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Rotational"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and
-            self.prior_high >= self.prior_ibh + (self.prior_ibh - self.prior_ibl) and
-            self.prior_close >= self.prior_ibh + (self.prior_ibh - self.prior_ibl)):
-            day_type = "Directional"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and
-            self.prior_close <= self.prior_ibh + (self.prior_ibh - self.prior_ibl) and
-            self.prior_high >= self.prior_ibh + 1.25 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Directional"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and
-            self.prior_low <= self.prior_ibl - (self.prior_ibh - self.prior_ibl) and
-            self.prior_close <= self.prior_ibl - (self.prior_ibh - self.prior_ibl)):
-            day_type = "Directional"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and
-            self.prior_close >= self.prior_ibl - (self.prior_ibh - self.prior_ibl) and
-            self.prior_low <= self.prior_ibl - 1.25 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Directional"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and
-            self.prior_high >= self.prior_ibh + 0.5 * (self.prior_ibh - self.prior_ibl) and
-            self.prior_high <= self.prior_ibh + (self.prior_ibh - self.prior_ibl)):
-            day_type = "Semi-Rotational"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and
-            self.prior_high >= self.prior_ibh + (self.prior_ibh - self.prior_ibl) and
-            self.prior_close <= self.prior_ibh + (self.prior_ibh - self.prior_ibl)):
-            day_type = "Semi-Directional"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and  
-            self.prior_low <= self.prior_ibl - 0.5 * (self.prior_ibh - self.prior_ibl) and 
-            self.prior_low >= self.prior_ibl - (self.prior_ibh - self.prior_ibl)): 
-            day_type = "Semi-Rotational"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and 
-            self.prior_low <= self.prior_ibl - (self.prior_ibh - self.prior_ibl) and 
-            self.prior_close >= self.prior_ibl - (self.prior_ibh - self.prior_ibl)): 
-            day_type = "Semi-Directional"
-        else:
-            day_type = "Other"
-        logger.debug(f" IBGW | prior_day | Product: {self.product_name} | Prior Day Type: {day_type}")
-        return day_type
-    
+        return self.context.prior_day()
     def open_type(self):
-        a_period_mid = round(((self.a_high + self.a_low) / 2), 2)
-        current_sub_low = min(self.a_low, self.b_low)
-        current_sub_high = max(self.a_high, self.b_high)
-        overlap = max(0, min(current_sub_high, self.prior_high) - max(current_sub_low, self.prior_low))
-        total_range = self.day_high - self.day_low
-        if self.day_open == self.a_high and (self.b_high < a_period_mid):
-            open_type = "OD v"
-        elif self.day_open == self.a_low and (self.b_low > a_period_mid):
-            open_type = "OD ^"
-        elif (self.day_open > a_period_mid) and (self.b_high < a_period_mid):
-            open_type = "OTD v"
-        elif (self.day_open < a_period_mid) and (self.b_low > a_period_mid):
-            open_type = "OTD ^"
-        elif (self.day_open > a_period_mid) and (self.b_low > a_period_mid) and (self.b_high > self.orh):
-            open_type = "ORR ^"
-        elif (self.day_open < a_period_mid) and (self.b_high < a_period_mid) and (self.b_low < self.orl):
-            open_type = "ORR v"
-        elif overlap >= 0.5 * total_range:
-            open_type = "OAIR"
-        elif (overlap < 0.5 * total_range) and (self.day_open >= self.prior_high):
-            open_type = "OAOR ^"
-        elif (overlap < 0.5 * total_range) and (self.day_open <= self.prior_low):
-            open_type = "OAOR v"
-        else:
-            open_type = "Other"
-        logger.debug(f"IBGW | open_type | Product {self.product_name} | Open Type: {open_type}")              
-        return open_type 
-    
-    def exp_range(self):
-        if not self.prior_close:
-            logger.error(f" IBGW | exp_range | Product: {self.product_name} | Note: No Close Found")
-            raise ValueError(f" IBGW | exp_range | Product: {self.product_name} | Note: Need Close For Calculation!")
-        impvol = {
-            'ES': self.es_impvol,
-            'NQ': self.nq_impvol,
-            'RTY': self.rty_impvol,
-            'CL': self.cl_impvol
-        }.get(self.product_name)
-        if impvol is None:
-            raise ValueError(f" IBGW | exp_range | Product: {self.product_name} | Note: Unknown Product")
-        exp_range = self.safe_round(((self.prior_close * (impvol / 100)) * math.sqrt(1/252)))
-        logger.debug(f" IBGW | exp_range | Product: {self.product_name} | EXP_RNG: {exp_range}")
-        return exp_range
-    
+        return self.context.open_type()
     def one_time_framing(self):
-        if self.product_name == "CL":
-            period_times = {
-                'A': time(9, 0), 'B': time(9, 30), 'C': time(10, 0),
-                'D': time(10, 30), 'E': time(11, 0), 'F': time(11, 30),
-                'G': time(12, 0), 'H': time(12, 30), 'I': time(13, 0),
-                'J': time(13, 30), 'K': time(14, 0),
-            }
-            logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Using CL period times.")
-        else:
-            period_times = {
-                'A': time(9, 30), 'B': time(10, 0), 'C': time(10, 30),
-                'D': time(11, 0), 'E': time(11, 30), 'F': time(12, 0),
-                'G': time(12, 30), 'H': time(13, 0), 'I': time(13, 30),
-                'J': time(14, 0), 'K': time(14, 30), 'L': time(15, 0),
-                'M': time(15, 30),
-            }
-            logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Using non-CL period times.")
-
-        now = datetime.now(self.est).time()
-        logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Current time: {now}")
-        
-        sorted_periods = sorted(period_times.items(), key=lambda x: x[1])
-        current_period = None
-        finished_periods = []
-        
-        for i, (period, start_time) in enumerate(sorted_periods):
-            if i < len(sorted_periods) - 1:
-                next_start = sorted_periods[i + 1][1]
-                if start_time <= now < next_start:
-                    current_period = period
-                    finished_periods = [p for p, t in sorted_periods[:i]]
-                    break
-            else:
-                if now >= start_time:
-                    current_period = period
-                    finished_periods = [p for p, t in sorted_periods[:i]]
-                    break
-                    
-        logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Current Period: {current_period}")
-        logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Finished periods: {finished_periods}")
-        
-        if len(finished_periods) < 2:
-            logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Not enough finished periods. Returning False.")
-            return False
-
-        period1, period2 = finished_periods[-2], finished_periods[-1]
-        logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Last two periods selected: {period1}, {period2}")
-        
-        p1_high = self.variables.get(f"{self.product_name}_{period1}_HIGH")
-        p1_low = self.variables.get(f"{self.product_name}_{period1}_LOW")
-        p2_high = self.variables.get(f"{self.product_name}_{period2}_HIGH")
-        p2_low = self.variables.get(f"{self.product_name}_{period2}_LOW")
-        logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Prior Two Period Raw values: {period1} HIGH={p1_high}, LOW={p1_low}; {period2} HIGH={p2_high}, LOW={p2_low}")
-        
-        if None in (p1_high, p1_low, p2_high, p2_low):
-            logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | One or more period values missing. Returning False.")
-            return False
-            
-        p1_high = self.safe_round(p1_high)
-        p1_low = self.safe_round(p1_low)
-        p2_high = self.safe_round(p2_high)
-        p2_low = self.safe_round(p2_low)
-        logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Prior Two Period Rounded values: {period1} HIGH={p1_high}, LOW={p1_low}; {period2} HIGH={p2_high}, LOW={p2_low}")
-        
-        current_period_high = self.variables.get(f"{self.product_name}_{current_period}_HIGH")
-        current_period_low = self.variables.get(f"{self.product_name}_{current_period}_LOW")
-        if current_period_high is None or current_period_low is None:
-            logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Current period values not found. Returning False.")
-            return False
-        current_period_high = self.safe_round(current_period_high)
-        current_period_low = self.safe_round(current_period_low)
-        logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Current period {current_period} HIGH={current_period_high}, LOW={current_period_low}")
-        
-        if self.direction == "long":
-            if p2_high > p1_high and p2_low > p1_low:
-                logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Direction: {self.direction} | Upward one time framing detected for prior periods.")
-                if current_period_low >= p2_low:
-                    logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Direction: {self.direction} | Current period acceptable (inside or extending upward). Returning True.")
-                    return True
-                else:
-                    logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Direction: {self.direction} | Current period low {current_period_low} is below prior low {p2_low}. Returning False.")
-                    return False
-            else:
-                logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Direction: {self.direction} | Prior periods are not upward one time framing. Returning False.")
-                return False
-                
-        elif self.direction == "short":
-            if p2_high < p1_high and p2_low < p1_low:
-                logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Direction: {self.direction} | Downward one time framing detected for prior periods.")
-                if current_period_high <= p2_high:
-                    logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Direction: {self.direction} | Current period acceptable (inside or extending downward). Returning True.")
-                    return True
-                else:
-                    logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Direction: {self.direction} | Current period high {current_period_high} is above prior high {p2_high}. Returning False.")
-                    return False
-            else:
-                logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Direction: {self.direction} | Prior periods are not downward one time framing. Returning False.")
-                return False
-                
-        else:
-            logger.debug(f"IBGW | one_time_framing | Product: {self.product_name} | Invalid direction specified. Returning False.")
-            return False
+        return self.context.one_time_framing() == ("^" if self.direction == "long" else "v")
 
 # ---------------------------------- Driving Input Logic ------------------------------------ #   
     def input(self):
-        def log_condition(condition, description):
-            logger.debug(f"IBGW | input | Product: {self.product_name} | Direction: {self.direction} | {description} --> {condition}")
-            return condition
+        log_condition = decision_trace.start("IBGW", self.product_name, self.direction)
         if self.direction == "short":
             self.crit1 = log_condition(
                 self.day_low >= self.ib_low - 0.5 * (self.ib_high - self.ib_low),
-                f"CRITICAL1: day_low({self.day_low}) >= ib_low({self.ib_low}) - 0.5*(ib_high({self.ib_high}) - ib_low({self.ib_low}))"
+                "CRITICAL1: day_low(%s) >= ib_low(%s) - 0.5*(ib_high(%s) - ib_low(%s))", self.day_low, self.ib_low, self.ib_high, self.ib_low
             )
         elif self.direction == "long":
             self.crit1 = log_condition(
                 self.day_high <= self.ib_high + 0.5 * (self.ib_high - self.ib_low),
-                f"CRITICAL1: day_high({self.day_high}) <= ib_high({self.ib_high}) + 0.5*(ib_high({self.ib_high}) - ib_low({self.ib_low}))"
+                "CRITICAL1: day_high(%s) <= ib_high(%s) + 0.5*(ib_high(%s) - ib_low(%s))", self.day_high, self.ib_high, self.ib_high, self.ib_low
             )
         crit2 = log_condition(
             (self.ib_high - self.ib_low) / self.ib_atr <= 0.85,
-            f"CRITICAL2: ((ib_high({self.ib_high}) - ib_low({self.ib_low}))/ib_atr({self.ib_atr})) <= 0.85"
+            "CRITICAL2: ((ib_high(%s) - ib_low(%s))/ib_atr(%s)) <= 0.85", self.ib_high, self.ib_low, self.ib_atr
         )
         logic = self.crit1 and crit2
-        logger.debug(f"IBGW | input | Product: {self.product_name} | Direction: {self.direction} | FINAL_LOGIC: {logic} | "
-                    f"CRITICAL1: {self.crit1} | CRITICAL2: {crit2}")
+        logger.debug("IBGW | input | Product: %s | Direction: %s | FINAL_LOGIC: %s | CRITICAL1: %s | CRITICAL2: %s", self.product_name, self.direction, logic, self.crit1, crit2)
         return logic
     
 # ---------------------------------- Opportunity Window ------------------------------------ #   
     def time_window(self):
-        self.current_datetime = datetime.now(self.est)
+        self.current_datetime = clock.now(self.est)
         self.current_time = self.current_datetime.time()
         if self.product_name in ['ES', 'RTY', 'NQ']:
             start_time = self.equity_ib
@@ -300,17 +96,17 @@ class IBGW(Base):
             close_time = self.equity_close
             if (start_time <= self.current_time <= lunch_start) or \
             (lunch_end <= self.current_time <= close_time):
-                logger.debug(f"IBGW | time_window | Product: {self.product_name} | Within equity alert window: {self.current_time}")
+                logger.debug("IBGW | time_window | Product: %s | Within equity alert window: %s", self.product_name, self.current_time)
                 return True
             else:
-                logger.debug(f"IBGW | time_window | Product: {self.product_name} | Outside equity alert window: {self.current_time}")
+                logger.debug("IBGW | time_window | Product: %s | Outside equity alert window: %s", self.product_name, self.current_time)
                 return False
         elif self.product_name == 'CL':
             if self.crude_ib <= self.current_time <= self.crude_close:
-                logger.debug(f"IBGW | time_window | Product: {self.product_name} | Within crude alert window: {self.current_time}")
+                logger.debug("IBGW | time_window | Product: %s | Within crude alert window: %s", self.product_name, self.current_time)
                 return True
             else:
-                logger.debug(f"IBGW | time_window | Product: {self.product_name} | Outside crude alert window: {self.current_time}")
+                logger.debug("IBGW | time_window | Product: %s | Outside crude alert window: %s", self.product_name, self.current_time)
                 return False
         else:
             logger.warning(f"IBGW | time_window | Product: {self.product_name} | No time window defined for product")
@@ -321,29 +117,29 @@ class IBGW(Base):
         if self.day_high > self.ib_high and self.day_low < self.ib_low:
             if self.cpl < self.ib_low:
                 self.direction = "short"
-                logger.debug(f" IBGW | check | Product: {self.product_name} | DIR_LOGIC: self.cpl({self.cpl}) < self.ib_low({self.ib_low}) -> short")
+                logger.debug(" IBGW | check | Product: %s | DIR_LOGIC: self.cpl(%s) < self.ib_low(%s) -> short", self.product_name, self.cpl, self.ib_low)
             elif self.cpl > self.ib_high:
                 self.direction = "long"
-                logger.debug(f" IBGW | check | Product: {self.product_name} | DIR_LOGIC: self.cpl({self.cpl}) > self.ib_high({self.ib_high}) -> long")
+                logger.debug(" IBGW | check | Product: %s | DIR_LOGIC: self.cpl(%s) > self.ib_high(%s) -> long", self.product_name, self.cpl, self.ib_high)
             else:
-                logger.debug(f" IBGW | check | Product: {self.product_name} | Note: In Middle Of IB Range While Neutral, Returning.")
+                logger.debug(" IBGW | check | Product: %s | Note: In Middle Of IB Range While Neutral, Returning.", self.product_name)
                 return False  # In Middle Of IB Range While Neutral
         else:
             if self.day_low < self.ib_low:
                 self.direction = "short"
-                logger.debug(f" IBGW | check | Product: {self.product_name} | DIR_LOGIC: self.day_low({self.day_low}) < self.ib_low({self.ib_low}) -> short")
+                logger.debug(" IBGW | check | Product: %s | DIR_LOGIC: self.day_low(%s) < self.ib_low(%s) -> short", self.product_name, self.day_low, self.ib_low)
             elif self.day_high > self.ib_high:
                 self.direction = "long"
-                logger.debug(f" IBGW | check | Product: {self.product_name} | DIR_LOGIC: self.day_high({self.day_high}) > self.ib_high({self.ib_high}) -> long")
+                logger.debug(" IBGW | check | Product: %s | DIR_LOGIC: self.day_high(%s) > self.ib_high(%s) -> long", self.product_name, self.day_high, self.ib_high)
             else:
-                logger.debug(f" IBGW | check | Product: {self.product_name} | Note: No IB Extension, Returning.")
+                logger.debug(" IBGW | check | Product: %s | Note: No IB Extension, Returning.", self.product_name)
                 return False  # No IB Extension
 
         # Driving Input Check with Detailed Logging
         if self.time_window() and self.input():
             with last_alerts_lock:
                 last_alert = last_alerts.get(self.product_name)
-                logger.debug(f" IBGW | check | Product: {self.product_name} | Current Alert: {self.direction} | Last Alert: {last_alert}")
+                logger.debug(" IBGW | check | Product: %s | Current Alert: %s | Last Alert: %s", self.product_name, self.direction, last_alert)
                 if self.direction != last_alert:
                     logger.info(f" IBGW | check | Product: {self.product_name} | Note: Condition Met")
                     
@@ -351,25 +147,25 @@ class IBGW(Base):
                     if self.direction == "short":
                         if self.open_type() in ["OD v", "OTD v", "ORR v", "OAOR v"]:
                             self.c_directional_open = "x"
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_1: open_type() returned {self.open_type()} -> [{self.c_directional_open}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_1: open_type() returned %s -> [%s]", self.product_name, self.direction, self.open_type(), self.c_directional_open)
                         else:
                             self.c_directional_open = "  "
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_1: open_type() returned {self.open_type()} -> [{self.c_directional_open}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_1: open_type() returned %s -> [%s]", self.product_name, self.direction, self.open_type(), self.c_directional_open)
                     elif self.direction == "long":
                         if self.open_type() in ["OD ^", "OTD ^", "ORR ^", "OAOR ^"]:
                             self.c_directional_open = "x"
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_1: open_type() returned {self.open_type()} -> [{self.c_directional_open}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_1: open_type() returned %s -> [%s]", self.product_name, self.direction, self.open_type(), self.c_directional_open)
                         else:
                             self.c_directional_open = "  "
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_1: open_type() returned {self.open_type()} -> [{self.c_directional_open}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_1: open_type() returned %s -> [%s]", self.product_name, self.direction, self.open_type(), self.c_directional_open)
                     
                     # CRITERIA 2: One Time Framing (past 3)
                     if self.one_time_framing():
                         self.c_otf = "x"
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_2: one_time_framing() True -> [{self.c_otf}]")
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_2: one_time_framing() True -> [%s]", self.product_name, self.direction, self.c_otf)
                     else:
                         self.c_otf = "  "
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_2: one_time_framing() False -> [{self.c_otf}]")
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_2: one_time_framing() False -> [%s]", self.product_name, self.direction, self.c_otf)
                     
                     # CRITERIA 3: Clear Magnet
                     if self.direction == "short":
@@ -377,114 +173,114 @@ class IBGW(Base):
                             (self.ib_low - (self.ib_high - self.ib_low)) <= self.td_vpoc < self.ib_low  or
                             (self.ib_low - (self.ib_high - self.ib_low)) <= self.prior_vpoc < self.ib_low):
                             self.c_magnet = "x"
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: One of (fd_vpoc({self.fd_vpoc}), td_vpoc({self.td_vpoc}), prior_vpoc({self.prior_vpoc})) >= (ib_low({self.ib_low}) - IB_range({self.ib_high - self.ib_low})) -> [{self.c_magnet}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_3: One of (fd_vpoc(%s), td_vpoc(%s), prior_vpoc(%s)) >= (ib_low(%s) - IB_range(%s)) -> [%s]", self.product_name, self.direction, self.fd_vpoc, self.td_vpoc, self.prior_vpoc, self.ib_low, self.ib_high - self.ib_low, self.c_magnet)
                         else:
                             self.c_magnet = "  "
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: Clear magnet criteria not met -> [{self.c_magnet}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_3: Clear magnet criteria not met -> [%s]", self.product_name, self.direction, self.c_magnet)
                     elif self.direction == "long":
                         if ((self.ib_high + (self.ib_high - self.ib_low)) >= self.fd_vpoc > self.ib_high or
                             (self.ib_high + (self.ib_high - self.ib_low)) >= self.td_vpoc > self.ib_high or
                             (self.ib_high + (self.ib_high - self.ib_low)) >= self.prior_vpoc > self.ib_high):
                             self.c_magnet = "x"
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: One of (fd_vpoc({self.fd_vpoc}), td_vpoc({self.td_vpoc}), prior_vpoc({self.prior_vpoc})) <= (ib_high({self.ib_high}) + IB_range({self.ib_high - self.ib_low})) -> [{self.c_magnet}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_3: One of (fd_vpoc(%s), td_vpoc(%s), prior_vpoc(%s)) <= (ib_high(%s) + IB_range(%s)) -> [%s]", self.product_name, self.direction, self.fd_vpoc, self.td_vpoc, self.prior_vpoc, self.ib_high, self.ib_high - self.ib_low, self.c_magnet)
                         else:
                             self.c_magnet = "  "
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: Clear magnet criteria not met -> [{self.c_magnet}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_3: Clear magnet criteria not met -> [%s]", self.product_name, self.direction, self.c_magnet)
                     
                     # CRITERIA 4: Not Hit 1.5x IB
                     if self.crit1:
                         self.c_ib_ext_half = "x"
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: crit1 is True -> [{self.c_ib_ext_half}]")
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_4: crit1 is True -> [%s]", self.product_name, self.direction, self.c_ib_ext_half)
                     else:
                         self.c_ib_ext_half = "  "
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: crit1 is False -> [{self.c_ib_ext_half}]")
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_4: crit1 is False -> [%s]", self.product_name, self.direction, self.c_ib_ext_half)
                     
                     # CRITERIA 5: IB Narrow to Average
                     self.ib_range = round((self.ib_high - self.ib_low), 2)
                     self.ib_vatr = round((self.ib_range / self.ib_atr), 2)
                     if self.ib_vatr <= 0.85:
                         self.c_narrow_ib = "x"
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: (ib_high({self.ib_high}) - ib_low({self.ib_low})/ib_atr({self.ib_atr})) <= 0.85 -> [{self.c_narrow_ib}]")
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_5: (ib_high(%s) - ib_low(%s)/ib_atr(%s)) <= 0.85 -> [%s]", self.product_name, self.direction, self.ib_high, self.ib_low, self.ib_atr, self.c_narrow_ib)
                     else:
                         self.c_narrow_ib = "  "
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: (ib_high({self.ib_high}) - ib_low({self.ib_low})/ib_atr({self.ib_atr})) > 0.85 -> [{self.c_narrow_ib}]")
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_5: (ib_high(%s) - ib_low(%s)/ib_atr(%s)) > 0.85 -> [%s]", self.product_name, self.direction, self.ib_high, self.ib_low, self.ib_atr, self.c_narrow_ib)
                     
                     # CRITERIA 6: Less than 50% expected range used
                     self.day_range_used = max(self.overnight_high, self.day_high) - min(self.overnight_low, self.day_low)
                     self.range_used = round((self.day_range_used / self.exp_rng),2)
                     if self.range_used > 0.5:
                         self.c_exp_rng = "  "
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6: remaining_range({self.range_used}) >= 0.5 -> [{self.c_exp_rng}]")
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_6: remaining_range(%s) >= 0.5 -> [%s]", self.product_name, self.direction, self.range_used, self.c_exp_rng)
                     else:
                         self.c_exp_rng = "x"
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6: remaining_range({self.range_used}) < 0.5 -> [{self.c_exp_rng}]")
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_6: remaining_range(%s) < 0.5 -> [%s]", self.product_name, self.direction, self.range_used, self.c_exp_rng)
                     
                     # CRITERIA 7: c_euro IB
                     if self.direction == "short":
                         if self.cpl < self.euro_ibl:
                             self.c_euro_ib = "x"
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_7: self.cpl({self.cpl}) < euro_ibl({self.euro_ibl}) -> [{self.c_euro_ib}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_7: self.cpl(%s) < euro_ibl(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.euro_ibl, self.c_euro_ib)
                         else:
                             self.c_euro_ib = "  "
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_7: self.cpl({self.cpl}) >= euro_ibl({self.euro_ibl}) -> [{self.c_euro_ib}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_7: self.cpl(%s) >= euro_ibl(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.euro_ibl, self.c_euro_ib)
                     elif self.direction == "long":
                         if self.cpl > self.euro_ibh:
                             self.c_euro_ib = "x"
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_7: self.cpl({self.cpl}) > euro_ibh({self.euro_ibh}) -> [{self.c_euro_ib}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_7: self.cpl(%s) > euro_ibh(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.euro_ibh, self.c_euro_ib)
                         else:
                             self.c_euro_ib = "  "
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_7: self.cpl({self.cpl}) <= euro_ibh({self.euro_ibh}) -> [{self.c_euro_ib}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_7: self.cpl(%s) <= euro_ibh(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.euro_ibh, self.c_euro_ib)
                     
                     # CRITERIA 8: Skew in Profile Toward IB Extreme
                     if self.direction == "short":
                         if self.day_vpoc <= self.ib_low + round(0.33 * (self.ib_high - self.ib_low), 2):
                             self.c_skew = "x"
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_8: day_vpoc({self.day_vpoc}) <= ib_low({self.ib_low}) + 0.33*(ib_range) -> [{self.c_skew}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_8: day_vpoc(%s) <= ib_low(%s) + 0.33*(ib_range) -> [%s]", self.product_name, self.direction, self.day_vpoc, self.ib_low, self.c_skew)
                         else:
                             self.c_skew = "  "
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_8: day_vpoc({self.day_vpoc}) > ib_low({self.ib_low}) + 0.33*(ib_range) -> [{self.c_skew}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_8: day_vpoc(%s) > ib_low(%s) + 0.33*(ib_range) -> [%s]", self.product_name, self.direction, self.day_vpoc, self.ib_low, self.c_skew)
                     elif self.direction == "long":
                         if self.day_vpoc >= self.ib_high - round(0.33 * (self.ib_high - self.ib_low), 2):
                             self.c_skew = "x"
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_8: day_vpoc({self.day_vpoc}) >= ib_high({self.ib_high}) - 0.33*(ib_range) -> [{self.c_skew}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_8: day_vpoc(%s) >= ib_high(%s) - 0.33*(ib_range) -> [%s]", self.product_name, self.direction, self.day_vpoc, self.ib_high, self.c_skew)
                         else:
                             self.c_skew = "  "
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_8: day_vpoc({self.day_vpoc}) < ib_high({self.ib_high}) - 0.33*(ib_range) -> [{self.c_skew}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_8: day_vpoc(%s) < ib_high(%s) - 0.33*(ib_range) -> [%s]", self.product_name, self.direction, self.day_vpoc, self.ib_high, self.c_skew)
                     
                     # CRITERIA 9: IB Broke from Composite Reference (5d, 20d for now)
                     if (self.ib_low < self.fd_vpoc < self.ib_high) or (self.ib_low < self.td_vpoc < self.ib_high):
                         self.c_composite_ref = "x"
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_9: fd_vpoc({self.fd_vpoc}) or td_vpoc({self.td_vpoc}) within IB range ({self.ib_low}-{self.ib_high}) -> [{self.c_composite_ref}]")
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_9: fd_vpoc(%s) or td_vpoc(%s) within IB range (%s-%s) -> [%s]", self.product_name, self.direction, self.fd_vpoc, self.td_vpoc, self.ib_low, self.ib_high, self.c_composite_ref)
                     else:
                         self.c_composite_ref = "  "
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_9: Composite reference criteria not met -> [{self.c_composite_ref}]")
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_9: Composite reference criteria not met -> [%s]", self.product_name, self.direction, self.c_composite_ref)
                     
                     # CRITERIA 10: Prior Session Balanced (Rotational)
                     if self.prior_day() in ["Rotational", "Semi-Rotational"] and self.cpl < self.prior_vpoc and self.day_low < self.ib_low:
                         self.c_rotational = "x"
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_10: self.prior_day() in ['Rotational', 'Semi-Rotational'] and self.cpl < self.prior_vpoc and self.day_low < self.ib_low -> [{self.c_rotational}]")
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_10: self.prior_day() in ['Rotational', 'Semi-Rotational'] and self.cpl < self.prior_vpoc and self.day_low < self.ib_low -> [%s]", self.product_name, self.direction, self.c_rotational)
                     elif self.prior_day() in ["Rotational", "Semi-Rotational"] and self.cpl > self.prior_vpoc and self.day_high > self.ib_high:
                         self.c_rotational = "x"
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_10:self.prior_day() in ['Rotational', 'Semi-Rotational'] and self.cpl > self.prior_vpoc and self.day_high > self.ib_high -> [{self.c_rotational}]")                    
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_10:self.prior_day() in ['Rotational', 'Semi-Rotational'] and self.cpl > self.prior_vpoc and self.day_high > self.ib_high -> [%s]", self.product_name, self.direction, self.c_rotational)                    
                     else:
                         self.c_rotational = "  "
-                        logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_10: prior_day() did not return Rotational or Semi-Rotational -> [{self.c_rotational}]")
+                        logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_10: prior_day() did not return Rotational or Semi-Rotational -> [%s]", self.product_name, self.direction, self.c_rotational)
                     
                     # CRITERIA 11: Noticeable Slope to VWAP
                     if self.direction == "short":
                         if self.vwap_slope < -0.06:
                             self.c_vwap_slope = "x"
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_11: vwap_slope({self.vwap_slope}) < -0.05 -> [{self.c_vwap_slope}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_11: vwap_slope(%s) < -0.05 -> [%s]", self.product_name, self.direction, self.vwap_slope, self.c_vwap_slope)
                         else:
                             self.c_vwap_slope = "  "
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_11: vwap_slope({self.vwap_slope}) >= -0.05 -> [{self.c_vwap_slope}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_11: vwap_slope(%s) >= -0.05 -> [%s]", self.product_name, self.direction, self.vwap_slope, self.c_vwap_slope)
                     elif self.direction == "long":
                         if self.vwap_slope > 0.06:
                             self.c_vwap_slope = "x"
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_11: vwap_slope({self.vwap_slope}) > 0.05 -> [{self.c_vwap_slope}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_11: vwap_slope(%s) > 0.05 -> [%s]", self.product_name, self.direction, self.vwap_slope, self.c_vwap_slope)
                         else:
                             self.c_vwap_slope = "  "
-                            logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_11: vwap_slope({self.vwap_slope}) <= 0.05 -> [{self.c_vwap_slope}]")
+                            logger.debug(" IBGW | check | Product: %s | Direction: %s | CRITERIA_11: vwap_slope(%s) <= 0.05 -> [%s]", self.product_name, self.direction, self.vwap_slope, self.c_vwap_slope)
                     
                     # Score Calculation Logging
                     self.score = sum(1 for condition in [
@@ -492,7 +288,7 @@ class IBGW(Base):
                         self.c_narrow_ib, self.c_exp_rng, self.c_skew, self.c_composite_ref, self.c_rotational,
                         self.c_vwap_slope
                     ] if condition == "x")
-                    logger.debug(f" IBGW | check | Product: {self.product_name} | Direction: {self.direction} | SCORE: {self.score}/11")
+                    logger.debug(" IBGW | check | Product: %s | Direction: %s | SCORE: %s/11", self.product_name, self.direction, self.score)
                     
                     try:
                         last_alerts[self.product_name] = self.direction
@@ -500,9 +296,9 @@ class IBGW(Base):
                     except Exception as e:
                         logger.error(f" IBGW | check | Product: {self.product_name} | Note: Failed to send Slack alert: {e}")
                 else:
-                    logger.debug(f" IBGW | check | Product: {self.product_name} | Note: Alert: {self.direction} Is Same")
+                    logger.debug(" IBGW | check | Product: %s | Note: Alert: %s Is Same", self.product_name, self.direction)
         else:
-            logger.debug(f" IBGW | check | Product: {self.product_name} | Note: Condition(s) Not Met")
+            logger.debug(" IBGW | check | Product: %s | Note: Condition(s) Not Met", self.product_name)
 
 # ---------------------------------- Alert Preparation------------------------------------ #  
     def discord_message(self):
@@ -595,6 +391,6 @@ class IBGW(Base):
         return embed 
     
     def execute(self):
-        embed = self.discord_message()
+        embed = self.build_embed()
         self.send_playbook_embed(embed, username=None, avatar_url=None)
         logger.info(f"IBGW | execute | Product: {self.product_name} | Note: Alert Sent To Playbook Webhook")
\ No newline at end of file
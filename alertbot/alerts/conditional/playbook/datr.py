@@ -1,36 +1,33 @@
 import logging
-import math
 import threading
 from datetime import datetime
 from alertbot.utils import config
+from alertbot.utils import clock
 from discord_webhook import DiscordEmbed
 from alertbot.alerts.base import Base
+from alertbot.utils.trace import decision_trace
 logger = logging.getLogger(__name__)
 
 last_alerts = {}
 last_alerts_lock = threading.Lock()
 
 class DATR(Base):
-    def __init__(self, product_name, variables):    
-        super().__init__(product_name=product_name, variables=variables)
-        self.prior_close = self.safe_round(variables.get(f'{self.product_name}_PRIOR_CLOSE'))
-        self.day_open = self.safe_round(variables.get(f'{self.product_name}_DAY_OPEN'))
-        self.prior_high = self.safe_round(variables.get(f'{self.product_name}_PRIOR_HIGH'))
-        self.prior_low = self.safe_round(variables.get(f'{self.product_name}_PRIOR_LOW'))
-        self.prior_ibh = self.safe_round(variables.get(f'{self.product_name}_PRIOR_IB_HIGH'))
-        self.prior_ibl = self.safe_round(variables.get(f'{self.product_name}_PRIOR_IB_LOW'))
-        self.total_ovn_delta = self.safe_round(variables.get(f'{self.product_name}_TOTAL_OVN_DELTA'))
-        self.total_rth_delta = self.safe_round(variables.get(f'{self.product_name}_TOTAL_RTH_DELTA'))
-        self.prior_vpoc = self.safe_round(variables.get(f'{self.product_name}_PRIOR_VPOC'))  
-        self.eth_vwap = variables.get(f'{self.product_name}_ETH_VWAP')       
-        self.cpl = self.safe_round(variables.get(f'{self.product_name}_CPL'))
-        self.es_impvol = config.es_impvol
-        self.nq_impvol = config.nq_impvol
-        self.rty_impvol = config.rty_impvol
-        self.cl_impvol = config.cl_impvol 
-        self.delta = self.total_delta()
-        self.exp_rng = self.exp_range()
-        self.prior_day_type = self.prior_day()
+    def __init__(self, product_name, variables, context=None):    
+        super().__init__(product_name=product_name, variables=variables, context=context)
+        self.prior_close = self.safe_round(variables.prior_close)
+        self.day_open = self.safe_round(variables.day_open)
+        self.prior_high = self.safe_round(variables.prior_high)
+        self.prior_low = self.safe_round(variables.prior_low)
+        self.prior_ibh = self.safe_round(variables.prior_ib_high)
+        self.prior_ibl = self.safe_round(variables.prior_ib_low)
+        self.total_ovn_delta = self.safe_round(variables.total_ovn_delta)
+        self.total_rth_delta = self.safe_round(variables.total_rth_delta)
+        self.prior_vpoc = self.safe_round(variables.prior_vpoc)  
+        self.eth_vwap = variables.eth_vwap       
+        self.cpl = self.safe_round(variables.cpl)
+        self.delta = self.context.total_delta()
+        self.exp_rng = self.context.exp_range()[0]
+        self.prior_day_type = self.context.prior_day_profile()
         self.prior_mid = ((self.prior_high + self.prior_low) / 2)
         
     def safe_round(self, value, digits=2):
@@ -42,123 +39,46 @@ class DATR(Base):
         except Exception as e:
             logger.error(f"DATR | safe_round | Product: {self.product_name} | Error rounding value {value}: {e}")
             return 0
-# ---------------------------------- Specific Calculations ------------------------------------ #   
-    def exp_range(self):
-        if not self.prior_close:
-            logger.error(f" DATR | exp_range | Product: {self.product_name} | Note: No Close Found")
-            raise ValueError(f" DATR | exp_range | Product: {self.product_name} | Note: Need Close For Calculation!")
-        impvol = {
-            'ES': self.es_impvol,
-            'NQ': self.nq_impvol,
-            'RTY': self.rty_impvol,
-            'CL': self.cl_impvol
-        }.get(self.product_name)
-        if impvol is None:
-            raise ValueError(f" DATR | exp_range | Product: {self.product_name} | Note: Unknown Product")
-        exp_range = self.safe_round(((self.prior_close * (impvol / 100)) * math.sqrt(1/252)))
-        logger.debug(f" DATR | exp_range | Product: {self.product_name} | EXP_RNG: {exp_range}")
-        return exp_range
-    def total_delta(self):      
-        total_delta = self.total_ovn_delta + self.total_rth_delta
-        logger.debug(f" DATR | total_delta | Product: {self.product_name} | TOTAL_DELTA: {total_delta}")
-        return total_delta 
-    def prior_day(self):
-        if self.prior_high <= self.prior_ibh and self.prior_low >= self.prior_ibl:
-            day_type = "Non-Trend"
-        elif (self.prior_low < self.prior_ibl and self.prior_high > self.prior_ibh and 
-            self.prior_close >= self.prior_ibh + 0.5 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Neutral Extreme ^"
-        elif (self.prior_low < self.prior_ibl and self.prior_high > self.prior_ibh and 
-            self.prior_close <= self.prior_ibl - 0.5 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Neutral Extreme v"
-        elif (self.prior_high > self.prior_ibh and self.prior_low < self.prior_ibl and
-            self.prior_close >= (self.prior_ibl - 0.5 * (self.prior_ibh - self.prior_ibl)) and
-            self.prior_close <= (self.prior_ibh + 0.5 * (self.prior_ibh - self.prior_ibl))):
-            day_type = "Neutral Center"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and 
-            self.prior_high <= self.prior_ibh + 0.5 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Normal Day ^"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and 
-            self.prior_low >= self.prior_ibl - 0.5 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Normal Day v"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and
-            self.prior_high >= self.prior_ibh + (self.prior_ibh - self.prior_ibl) and
-            self.prior_close >= self.prior_ibh + (self.prior_ibh - self.prior_ibl)):
-            day_type = "Trend ^"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and
-            self.prior_close <= self.prior_ibh + (self.prior_ibh - self.prior_ibl) and
-            self.prior_high >= self.prior_ibh + 1.25 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Trend ^"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and
-            self.prior_low <= self.prior_ibl - (self.prior_ibh - self.prior_ibl) and
-            self.prior_close <= self.prior_ibl - (self.prior_ibh - self.prior_ibl)):
-            day_type = "Trend v"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and
-            self.prior_close >= self.prior_ibl - (self.prior_ibh - self.prior_ibl) and
-            self.prior_low <= self.prior_ibl - 1.25 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Trend v"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and
-            self.prior_high >= self.prior_ibh + 0.5 * (self.prior_ibh - self.prior_ibl) and
-            self.prior_high <= self.prior_ibh + (self.prior_ibh - self.prior_ibl)):
-            day_type = "Normal Var ^"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and
-            self.prior_high >= self.prior_ibh + (self.prior_ibh - self.prior_ibl) and
-            self.prior_close <= self.prior_ibh + (self.prior_ibh - self.prior_ibl)):
-            day_type = "Normal Var ^"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and
-            self.prior_low <= self.prior_ibl - 0.5 * (self.prior_ibh - self.prior_ibl) and
-            self.prior_low >= self.prior_ibl - (self.prior_ibh - self.prior_ibl)):
-            day_type = "Normal Var v"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and
-            self.prior_low <= self.prior_ibl - (self.prior_ibh - self.prior_ibl) and
-            self.prior_close >= self.prior_ibl - (self.prior_ibh - self.prior_ibl)):
-            day_type = "Normal Var v"
-        else:
-            day_type = "Other"
-        logger.debug(f" DATR | prior_day | Product: {self.product_name} | Prior Day: {day_type}")
-        return day_type
 # ---------------------------------- Driving Input Logic ------------------------------------ #   
     def input(self):
-        def log_condition(condition, description):
-            logger.debug(f"DATR | input | Product: {self.product_name} | Direction: {self.direction} | {description} --> {condition}")
-            return condition
+        log_condition = decision_trace.start("DATR", self.product_name, self.direction)
         tolerance = self.exp_rng * 0.15
         prior_mid = (self.prior_high + self.prior_low) / 2
         logic = False
         crit2 = False
         crit3 = False
-        crit1 = log_condition((self.prior_high - tolerance) > self.day_open > (self.prior_low + tolerance), f"CRITICAL1: (self.prior_high({self.prior_high}) - tolerance({tolerance})) > self.day_open({self.day_open}) > (self.prior_low({self.prior_low}) + tolerance({tolerance}))")
+        crit1 = log_condition((self.prior_high - tolerance) > self.day_open > (self.prior_low + tolerance), "CRITICAL1: (self.prior_high(%s) - tolerance(%s)) > self.day_open(%s) > (self.prior_low(%s) + tolerance(%s))", self.prior_high, tolerance, self.day_open, self.prior_low, tolerance)
         if crit1:
             if self.direction == 'Higher':
-                crit2 = log_condition(self.cpl > prior_mid, f"CRITICAL2: self.cpl({self.cpl}) > prior_mid({self.prior_mid})")
-                crit3 = log_condition(self.day_open >= prior_mid, f"CRITICAL3: self.day_open({self.day_open}) >= prior_mid({self.prior_mid})")
+                crit2 = log_condition(self.cpl > prior_mid, "CRITICAL2: self.cpl(%s) > prior_mid(%s)", self.cpl, self.prior_mid)
+                crit3 = log_condition(self.day_open >= prior_mid, "CRITICAL3: self.day_open(%s) >= prior_mid(%s)", self.day_open, self.prior_mid)
                 logic = crit2 and crit3
             elif self.direction == 'Lower':
-                crit2 = log_condition(self.cpl < prior_mid, f"CRITICAL2: self.cpl({self.cpl}) < prior_mid({self.prior_mid})")
-                crit3 = log_condition(self.day_open <= prior_mid, f"CRITICAL3: self.day_open({self.day_open}) <= prior_mid({self.prior_mid})")
+                crit2 = log_condition(self.cpl < prior_mid, "CRITICAL2: self.cpl(%s) < prior_mid(%s)", self.cpl, self.prior_mid)
+                crit3 = log_condition(self.day_open <= prior_mid, "CRITICAL3: self.day_open(%s) <= prior_mid(%s)", self.day_open, self.prior_mid)
                 logic = crit2 and crit3
-        logger.debug(f"DATR | input | Product: {self.product_name} | Direction: {self.direction} | FINAL_LOGIC: {logic} | CRITICAL1: {crit1} | CRITICAL2: {crit2} | CRITICAL3: {crit3}")
+        logger.debug("DATR | input | Product: %s | Direction: %s | FINAL_LOGIC: %s | CRITICAL1: %s | CRITICAL2: %s | CRITICAL3: %s", self.product_name, self.direction, logic, crit1, crit2, crit3)
         return logic
 # ---------------------------------- Opportunity Window ------------------------------------ #   
     def time_window(self):
-        self.current_datetime = datetime.now(self.est)
+        self.current_datetime = clock.now(self.est)
         self.current_time = self.current_datetime.time()
         if self.product_name == 'CL':
             start_time = self.crude_open
             end_time = self.crude_close
-            logger.debug(f" DATR | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug(" DATR | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         elif self.product_name in ['ES', 'RTY', 'NQ']:
             start_time = self.equity_open
             end_time = self.equity_close
-            logger.debug(f" DATR | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug(" DATR | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         else:
             logger.warning(f" DATR | time_window | Product: {self.product_name} | No time window defined.")
             return False  
         if start_time <= self.current_time <= end_time:
-            logger.debug(f" DATR | time_window | Product: {self.product_name} | Within Window: {self.current_time}.")
+            logger.debug(" DATR | time_window | Product: %s | Within Window: %s.", self.product_name, self.current_time)
             return True
         else:
-            logger.debug(f" DATR | time_window | Product: {self.product_name} | Outside Window {self.current_time}.")
+            logger.debug(" DATR | time_window | Product: %s | Outside Window %s.", self.product_name, self.current_time)
             return False
 # ---------------------------------- Calculate Criteria ------------------------------------ #      
     def check(self):
@@ -166,12 +86,12 @@ class DATR(Base):
         self.direction = None
         if self.prior_day_type == 'Trend ^':
             self.direction = 'Higher'
-            logger.debug(f"DATR | check | Product: {self.product_name} | DIR_LOGIC: prior_day_type({self.prior_day_type}) == 'Trend ^' -> Direction: {self.direction}")
+            logger.debug("DATR | check | Product: %s | DIR_LOGIC: prior_day_type(%s) == 'Trend ^' -> Direction: %s", self.product_name, self.prior_day_type, self.direction)
         elif self.prior_day_type == 'Trend v':
             self.direction = 'Lower'
-            logger.debug(f"DATR | check | Product: {self.product_name} | DIR_LOGIC: prior_day_type({self.prior_day_type}) == 'Trend v' -> Direction: {self.direction}")
+            logger.debug("DATR | check | Product: %s | DIR_LOGIC: prior_day_type(%s) == 'Trend v' -> Direction: %s", self.product_name, self.prior_day_type, self.direction)
         else:
-            logger.debug(f"DATR | check | Product: {self.product_name} | Note: No Prior Trend Day; Returning.")
+            logger.debug("DATR | check | Product: %s | Note: No Prior Trend Day; Returning.", self.product_name)
             return False
 
         self.color = "red" if self.direction == "Lower" else "green"
@@ -180,60 +100,60 @@ class DATR(Base):
         if self.time_window() and self.input():
             with last_alerts_lock:
                 last_alert = last_alerts.get(self.product_name)
-                logger.debug(f"DATR | check | Product: {self.product_name} | Current Alert: {self.direction} | Last Alert: {last_alert}")
+                logger.debug("DATR | check | Product: %s | Current Alert: %s | Last Alert: %s", self.product_name, self.direction, last_alert)
                 if self.direction != last_alert:
                     logger.info(f"DATR | check | Product: {self.product_name} | Note: Condition Met")
                     
                     # CRITERIA 1: Trend Criterion (c_trend)
                     self.c_trend = "x"
-                    logger.debug(f"DATR | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_1: prior_day_type({self.prior_day_type}) in ['Trend ^','Trend v'] -> [{self.c_trend}]")
+                    logger.debug("DATR | check | Product: %s | Direction: %s | CRITERIA_1: prior_day_type(%s) in ['Trend ^','Trend v'] -> [%s]", self.product_name, self.direction, self.prior_day_type, self.c_trend)
                     
                     # CRITERIA 2: Open Range Criterion (c_open)
                     if self.prior_low < self.day_open < self.prior_high:
                         self.c_open = "x"
                     else:
                         self.c_open = "  "
-                    logger.debug(f"DATR | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_2: prior_low({self.prior_low}) < day_open({self.day_open}) < prior_high({self.prior_high}) -> [{self.c_open}]")
+                    logger.debug("DATR | check | Product: %s | Direction: %s | CRITERIA_2: prior_low(%s) < day_open(%s) < prior_high(%s) -> [%s]", self.product_name, self.direction, self.prior_low, self.day_open, self.prior_high, self.c_open)
                     
                     # CRITERIA 3: Orderflow Criterion (c_orderflow)
                     self.c_orderflow = "  "
                     if self.direction == "Lower" and self.delta < 0:
                         self.c_orderflow = "x"
-                        logger.debug(f"DATR | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: delta({self.delta}) < 0 for Lower -> [{self.c_orderflow}]")
+                        logger.debug("DATR | check | Product: %s | Direction: %s | CRITERIA_3: delta(%s) < 0 for Lower -> [%s]", self.product_name, self.direction, self.delta, self.c_orderflow)
                     elif self.direction == "Higher" and self.delta > 0:
                         self.c_orderflow = "x"
-                        logger.debug(f"DATR | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: delta({self.delta}) > 0 for Higher -> [{self.c_orderflow}]")
+                        logger.debug("DATR | check | Product: %s | Direction: %s | CRITERIA_3: delta(%s) > 0 for Higher -> [%s]", self.product_name, self.direction, self.delta, self.c_orderflow)
                     
                     # CRITERIA 4: VWAP Criterion (c_vwap)
                     self.c_vwap = "  "
                     if self.direction == "Lower" and self.cpl < self.eth_vwap:
                         self.c_vwap = "x"
-                        logger.debug(f"DATR | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: cpl({self.cpl}) < eth_vwap({self.eth_vwap}) for Lower -> [{self.c_vwap}]")
+                        logger.debug("DATR | check | Product: %s | Direction: %s | CRITERIA_4: cpl(%s) < eth_vwap(%s) for Lower -> [%s]", self.product_name, self.direction, self.cpl, self.eth_vwap, self.c_vwap)
                     elif self.direction == "Higher" and self.cpl > self.eth_vwap:
                         self.c_vwap = "x"
-                        logger.debug(f"DATR | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: cpl({self.cpl}) > eth_vwap({self.eth_vwap}) for Higher -> [{self.c_vwap}]")
+                        logger.debug("DATR | check | Product: %s | Direction: %s | CRITERIA_4: cpl(%s) > eth_vwap(%s) for Higher -> [%s]", self.product_name, self.direction, self.cpl, self.eth_vwap, self.c_vwap)
                     
                     # CRITERIA 5: Prior VPOC Criterion (c_prior_vpoc)
                     self.c_prior_vpoc = "  "
                     if self.direction == "Lower" and self.prior_vpoc < self.prior_mid:
                         self.c_prior_vpoc = "x"
-                        logger.debug(f"DATR | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: prior_vpoc({self.prior_vpoc}) < prior_mid({self.prior_mid}) for Lower -> [{self.c_prior_vpoc}]")
+                        logger.debug("DATR | check | Product: %s | Direction: %s | CRITERIA_5: prior_vpoc(%s) < prior_mid(%s) for Lower -> [%s]", self.product_name, self.direction, self.prior_vpoc, self.prior_mid, self.c_prior_vpoc)
                     elif self.direction == "Higher" and self.prior_vpoc > self.prior_mid:
                         self.c_prior_vpoc = "x"
-                        logger.debug(f"DATR | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: prior_vpoc({self.prior_vpoc}) > prior_mid({self.prior_mid}) for Higher -> [{self.c_prior_vpoc}]")
+                        logger.debug("DATR | check | Product: %s | Direction: %s | CRITERIA_5: prior_vpoc(%s) > prior_mid(%s) for Higher -> [%s]", self.product_name, self.direction, self.prior_vpoc, self.prior_mid, self.c_prior_vpoc)
                     
                     # CRITERIA 6: HWB Criterion (c_hwb)
                     self.c_hwb = "  "
                     if self.direction == "Lower" and self.cpl < self.prior_mid:
                         self.c_hwb = "x"
-                        logger.debug(f"DATR | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6: cpl({self.cpl}) < prior_mid({self.prior_mid}) for Lower -> [{self.c_hwb}]")
+                        logger.debug("DATR | check | Product: %s | Direction: %s | CRITERIA_6: cpl(%s) < prior_mid(%s) for Lower -> [%s]", self.product_name, self.direction, self.cpl, self.prior_mid, self.c_hwb)
                     elif self.direction == "Higher" and self.cpl > self.prior_mid:
                         self.c_hwb = "x"
-                        logger.debug(f"DATR | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6: cpl({self.cpl}) > prior_mid({self.prior_mid}) for Higher -> [{self.c_hwb}]")
+                        logger.debug("DATR | check | Product: %s | Direction: %s | CRITERIA_6: cpl(%s) > prior_mid(%s) for Higher -> [%s]", self.product_name, self.direction, self.cpl, self.prior_mid, self.c_hwb)
                     
                     # Score Calculation Logging
                     self.score = sum(1 for condition in [self.c_trend, self.c_orderflow, self.c_open, self.c_vwap, self.c_prior_vpoc, self.c_hwb] if condition == "x")
-                    logger.debug(f"DATR | check | Product: {self.product_name} | Direction: {self.direction} | SCORE: {self.score}/6")
+                    logger.debug("DATR | check | Product: %s | Direction: %s | SCORE: %s/6", self.product_name, self.direction, self.score)
                     
                     try:
                         last_alerts[self.product_name] = self.direction
@@ -241,9 +161,9 @@ class DATR(Base):
                     except Exception as e:
                         logger.error(f"DATR | check | Product: {self.product_name} | Note: Failed to send Slack alert: {e}")
                 else:
-                    logger.debug(f"DATR | check | Product: {self.product_name} | Note: Alert: {self.direction} is Same")
+                    logger.debug("DATR | check | Product: %s | Note: Alert: %s is Same", self.product_name, self.direction)
         else:
-            logger.debug(f"DATR | check | Product: {self.product_name} | Note: Condition(s) Not Met")
+            logger.debug("DATR | check | Product: %s | Note: Condition(s) Not Met", self.product_name)
 
 # ---------------------------------- Alert Preparation------------------------------------ #  
     def discord_message(self):
@@ -300,7 +220,7 @@ class DATR(Base):
 
         return embed   
     def execute(self):
-        embed = self.discord_message()
+        embed = self.build_embed()
         self.send_playbook_embed(embed, username=None, avatar_url=None)
         logger.info(f"DATR | execute | Product: {self.product_name} | Note: Alert Sent To Playbook Webhook")
                 
\ No newline at end of file
@@ -1,63 +1,60 @@
 import logging
-import math
 import threading
 from datetime import datetime, time, timedelta
 from alertbot.utils import config
+from alertbot.utils import clock
 from discord_webhook import DiscordEmbed
 from alertbot.alerts.base import Base
+from alertbot.utils.trace import decision_trace
 logger = logging.getLogger(__name__)
 
 last_alerts = {}
 last_alerts_lock = threading.Lock()
 
 class DOGW(Base):
-    def __init__(self, product_name, variables):    
-        super().__init__(product_name=product_name, variables=variables)
+    def __init__(self, product_name, variables, context=None):    
+        super().__init__(product_name=product_name, variables=variables, context=context)
  
         # Variables (Round All Variables)
-        self.day_open = self.safe_round(variables.get(f'{self.product_name}_DAY_OPEN'))
-        self.prior_high = self.safe_round(variables.get(f'{self.product_name}_PRIOR_HIGH'))
-        self.prior_low = self.safe_round(variables.get(f'{self.product_name}_PRIOR_LOW'))
-        self.ib_atr = self.safe_round(variables.get(f'{self.product_name}_IB_ATR'))
-        self.euro_ibh = self.safe_round(variables.get(f'{self.product_name}_EURO_IBH'))
-        self.euro_ibl = self.safe_round(variables.get(f'{self.product_name}_EURO_IBL'))
-        self.orh = self.safe_round(variables.get(f'{self.product_name}_ORH'))
-        self.orl = self.safe_round(variables.get(f'{self.product_name}_ORL'))
-        self.a_high = self.safe_round(variables.get(f'{product_name}_A_HIGH'))
-        self.a_low = self.safe_round(variables.get(f'{product_name}_A_LOW'))
+        self.day_open = self.safe_round(variables.day_open)
+        self.prior_high = self.safe_round(variables.prior_high)
+        self.prior_low = self.safe_round(variables.prior_low)
+        self.ib_atr = self.safe_round(variables.ib_atr)
+        self.euro_ibh = self.safe_round(variables.euro_ibh)
+        self.euro_ibl = self.safe_round(variables.euro_ibl)
+        self.orh = self.safe_round(variables.orh)
+        self.orl = self.safe_round(variables.orl)
+        self.a_high = self.safe_round(variables.period("period_high", "A"))
+        self.a_low = self.safe_round(variables.period("period_low", "A"))
         
         # Conditionally round B period data only if the current time is at or past the B period start
         if self.product_name == 'CL':
             b_period_start_time = time(9, 30, 5)
         else:
             b_period_start_time = time(10, 0, 5)
-        current_time = datetime.now(self.est).time()
+        current_time = clock.now(self.est).time()
         if current_time >= b_period_start_time:
-            self.b_high = self.safe_round(variables.get(f'{product_name}_B_HIGH'))
-            self.b_low = self.safe_round(variables.get(f'{product_name}_B_LOW'))
+            self.b_high = self.safe_round(variables.period("period_high", "B"))
+            self.b_low = self.safe_round(variables.period("period_low", "B"))
         else:
             self.b_high = 0
             self.b_low = 0
 
-        self.cpl = self.safe_round(variables.get(f'{self.product_name}_CPL'))
-        self.total_ovn_delta = self.safe_round(variables.get(f'{self.product_name}_TOTAL_OVN_DELTA'))
-        self.total_rth_delta = self.safe_round(variables.get(f'{self.product_name}_TOTAL_RTH_DELTA'))
-        self.prior_close = self.safe_round(variables.get(f'{self.product_name}_PRIOR_CLOSE'))
-        self.ib_high = self.safe_round(variables.get(f'{product_name}_IB_HIGH'))
-        self.ib_low = self.safe_round(variables.get(f'{product_name}_IB_LOW'))
-        self.rvol = self.safe_round(variables.get(f'{product_name}_RVOL'))
-        self.day_high = self.safe_round(variables.get(f'{product_name}_DAY_HIGH'))
-        self.day_low = self.safe_round(variables.get(f'{product_name}_DAY_LOW'))        
-        self.vwap_slope = variables.get(f'{product_name}_VWAP_SLOPE')
-        self.overnight_high = self.safe_round(variables.get(f'{product_name}_OVNH'))
-        self.overnight_low = self.safe_round(variables.get(f'{product_name}_OVNL')) 
-        self.eth_vwap = self.variables.get(f'{self.product_name}_ETH_VWAP')  
-        self.es_impvol = config.es_impvol
-        self.nq_impvol = config.nq_impvol
-        self.rty_impvol = config.rty_impvol
-        self.cl_impvol = config.cl_impvol 
-        self.delta = self.total_delta()
-        self.exp_rng, self.exp_hi, self.exp_lo = self.exp_range() 
+        self.cpl = self.safe_round(variables.cpl)
+        self.total_ovn_delta = self.safe_round(variables.total_ovn_delta)
+        self.total_rth_delta = self.safe_round(variables.total_rth_delta)
+        self.prior_close = self.safe_round(variables.prior_close)
+        self.ib_high = self.safe_round(variables.ib_high)
+        self.ib_low = self.safe_round(variables.ib_low)
+        self.rvol = self.safe_round(variables.rvol)
+        self.day_high = self.safe_round(variables.day_high)
+        self.day_low = self.safe_round(variables.day_low)        
+        self.vwap_slope = variables.vwap_slope
+        self.overnight_high = self.safe_round(variables.ovnh)
+        self.overnight_low = self.safe_round(variables.ovnl) 
+        self.eth_vwap = self.variables.eth_vwap  
+        self.delta = self.context.total_delta()
+        self.exp_rng, self.exp_hi, self.exp_lo = self.context.exp_range() 
         self.opentype = self.open_type_algorithm()
         
     def safe_round(self, value, digits=2):
@@ -90,14 +87,14 @@ class DOGW(Base):
     def open_type_algorithm(self):
         # Compute thresholds from A period
         thresholds = self.compute_a_thresholds()
-        logger.debug(f"Computed A thresholds: {thresholds}")
+        logger.debug("Computed A thresholds: %s", thresholds)
 
         # Get current time and determine if B period is active
-        self.current_datetime = datetime.now(self.est)
+        self.current_datetime = clock.now(self.est)
         self.current_time = self.current_datetime.time()
         b_period_start = time(9, 30) if self.product_name == 'CL' else time(10, 0)
         b_active = self.current_time >= b_period_start
-        logger.debug(f"B period active: {b_active} (current_time={self.current_time}, start={b_period_start})")
+        logger.debug("B period active: %s (current_time=%s, start=%s)", b_active, self.current_time, b_period_start)
 
         # Calculate overlap percentage if B period is active and data is available
         overlap_pct = 0
@@ -105,11 +102,11 @@ class DOGW(Base):
             overlap = max(0, min(self.day_high, self.prior_high) - max(self.day_low, self.prior_low))
             total_range = self.day_high - self.day_low
             overlap_pct = overlap / total_range if total_range > 0 else 0
-            logger.debug(f"Overlap %: {overlap_pct}")
+            logger.debug("Overlap %%: %s", overlap_pct)
 
         # Evaluate conditions when B period is not active (using only A period data)
         if not b_active:
-            logger.debug(f"Evaluating A period conditions with day_open={self.day_open}")
+            logger.debug("Evaluating A period conditions with day_open=%s", self.day_open)
             if thresholds["top_5"] <= self.day_open <= thresholds["top_0"]:
                 return "OD v"
             elif thresholds["bottom_0"] <= self.day_open <= thresholds["bottom_5"]:
@@ -121,7 +118,7 @@ class DOGW(Base):
             else:
                 return "Wait"
         else:
-            logger.debug(f"Evaluating B period conditions with day_open={self.day_open}")
+            logger.debug("Evaluating B period conditions with day_open=%s", self.day_open)
             if self.b_high == 0 and self.b_low == 0:
                 return "Wait"
             if thresholds["top_5"] <= self.day_open <= thresholds["top_0"]:
@@ -150,81 +147,51 @@ class DOGW(Base):
                         return "OAOR v"
                     else:
                         return "OAIR"
-    def exp_range(self):
-
-        if not self.prior_close:
-            logger.error(f" DOGW | exp_range | Product: {self.product_name} | Note: No Close Found")
-            raise ValueError(f" DOGW | exp_range | Product: {self.product_name} | Note: Need Close For Calculation!")
-        
-        impvol = {
-            'ES': self.es_impvol,
-            'NQ': self.nq_impvol,
-            'RTY': self.rty_impvol,
-            'CL': self.cl_impvol
-        }.get(self.product_name)
-
-        if impvol is None:
-            raise ValueError(f" DOGW | exp_range | Product: {self.product_name} | Note: Unknown Product")
-
-        exp_range = self.safe_round(((self.prior_close * (impvol / 100)) * math.sqrt(1/252)))
-        exp_hi = self.safe_round(self.prior_close + exp_range)
-        exp_lo = self.safe_round(self.prior_close - exp_range)
-        
-        logger.debug(f" DOGW | exp_range | Product: {self.product_name} | EXP_RNG: {exp_range} | EXP_HI: {exp_hi} | EXP_LO: {exp_lo}")
-        return exp_range, exp_hi, exp_lo
-      
-    def total_delta(self):
-        total_delta = self.total_ovn_delta + self.total_rth_delta   
-        logger.debug(f"DOGW | total_delta | Product: {self.product_name} | TOTAL_DELTA: {total_delta}")
-        return total_delta   
-        
     # ---------------------------------- Driving Input Logic ------------------------------------ #   
     def input(self):
-        def log_condition(condition, description):
-            logger.debug(f"DOGW | input | Product: {self.product_name} | Direction: {self.direction} | {description} --> {condition}")
-            return condition
+        log_condition = decision_trace.start("DOGW", self.product_name, self.direction)
 
         if self.direction == "long":
             self.target = self.ib_low + self.ib_atr
-            crit1 = log_condition(self.cpl > self.orh, f"CRITICAL1: self.cpl({self.cpl}) > self.orh({self.orh})")
-            crit2 = log_condition(self.opentype in ["OD ^", "OTD ^", "ORR ^", "OAOR ^"] and self.cpl > self.eth_vwap, f"CRITICAL2: self.opentype in ['OD ^', 'OTD ^', 'ORR ^', 'OAOR ^'] and self.cpl({self.cpl}) > self.eth_vwap({self.eth_vwap})")
+            crit1 = log_condition(self.cpl > self.orh, "CRITICAL1: self.cpl(%s) > self.orh(%s)", self.cpl, self.orh)
+            crit2 = log_condition(self.opentype in ["OD ^", "OTD ^", "ORR ^", "OAOR ^"] and self.cpl > self.eth_vwap, "CRITICAL2: self.opentype in ['OD ^', 'OTD ^', 'ORR ^', 'OAOR ^'] and self.cpl(%s) > self.eth_vwap(%s)", self.cpl, self.eth_vwap)
         elif self.direction == "short":
             self.target = self.ib_high - self.ib_atr
-            crit1 = log_condition(self.cpl < self.orl, f"CRITICAL1: self.cpl({self.cpl}) < self.orl({self.orl})")
-            crit2 = log_condition(self.opentype in ["OD v", "OTD v", "ORR v", "OAOR v"] and self.cpl < self.eth_vwap, f"CRITICAL2: self.opentype in ['OD v', 'OTD v', 'ORR v', 'OAOR v'] and self.cpl({self.cpl}) < self.eth_vwap({self.eth_vwap})")
+            crit1 = log_condition(self.cpl < self.orl, "CRITICAL1: self.cpl(%s) < self.orl(%s)", self.cpl, self.orl)
+            crit2 = log_condition(self.opentype in ["OD v", "OTD v", "ORR v", "OAOR v"] and self.cpl < self.eth_vwap, "CRITICAL2: self.opentype in ['OD v', 'OTD v', 'ORR v', 'OAOR v'] and self.cpl(%s) < self.eth_vwap(%s)", self.cpl, self.eth_vwap)
 
         crit3 = log_condition(
             self.opentype in ["OD v", "OD ^", "OTD v", "OTD ^", "ORR ^", "ORR v", "OAOR ^", "OAOR v"],
-            f"CRITICAL3: self.opentype({self.opentype}) in ['OD v', 'OD ^', 'OTD v', 'OTD ^', 'ORR ^', 'ORR v', 'OAOR ^', 'OAOR v']"
+            "CRITICAL3: self.opentype(%s) in ['OD v', 'OD ^', 'OTD v', 'OTD ^', 'ORR ^', 'ORR v', 'OAOR ^', 'OAOR v']", self.opentype
         )
         crit4 = log_condition(
             (self.day_high <= self.ib_high and self.day_low >= self.ib_low),
-            f"CRITICAL4: day_high({self.day_high}) <= ib_high({self.ib_high}) and day_low({self.day_low}) >= ib_low({self.ib_low})"
+            "CRITICAL4: day_high(%s) <= ib_high(%s) and day_low(%s) >= ib_low(%s)", self.day_high, self.ib_high, self.day_low, self.ib_low
         )
         logic = crit1 and crit2 and crit3 and crit4
-        logger.debug(f"DOGW | input | Product: {self.product_name} | Direction: {self.direction} | FINAL_LOGIC: {logic} | CRITICAL1: {crit1} | CRITICAL2: {crit2} | CRITICAL3: {crit3} | CRITICAL4: {crit4}")
+        logger.debug("DOGW | input | Product: %s | Direction: %s | FINAL_LOGIC: %s | CRITICAL1: %s | CRITICAL2: %s | CRITICAL3: %s | CRITICAL4: %s", self.product_name, self.direction, logic, crit1, crit2, crit3, crit4)
         return logic
     
     # ---------------------------------- Opportunity Window ------------------------------------ #   
     def time_window(self):
-        self.current_datetime = datetime.now(self.est)
+        self.current_datetime = clock.now(self.est)
         self.current_time = self.current_datetime.time()
         if self.product_name == 'CL':
             start_time = self.crude_dogw_start
             end_time = self.crude_ib
-            logger.debug(f"DOGW | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug("DOGW | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         elif self.product_name in ['ES', 'RTY', 'NQ']:
             start_time = self.equity_dogw_start
             end_time = self.equity_ib
-            logger.debug(f"DOGW | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug("DOGW | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         else:
             logger.warning(f"DOGW | time_window | Product: {self.product_name} | No time window defined.")
             return False  
         if start_time <= self.current_time <= end_time:
-            logger.debug(f"DOGW | time_window | Product: {self.product_name} | Within Window: {self.current_time}.")
+            logger.debug("DOGW | time_window | Product: %s | Within Window: %s.", self.product_name, self.current_time)
             return True
         else:
-            logger.debug(f"DOGW | time_window | Product: {self.product_name} | Outside Window {self.current_time}.")
+            logger.debug("DOGW | time_window | Product: %s | Outside Window %s.", self.product_name, self.current_time)
             return False
     
     # ---------------------------------- Calculate Criteria ------------------------------------ #      
@@ -232,16 +199,16 @@ class DOGW(Base):
         
         # Determine Direction based on Open Type with Detailed Logging
         if self.opentype == "OAIR":
-            logger.debug(f"DOGW | check | Product: {self.product_name} | Open type is OAIR; returning False.")
+            logger.debug("DOGW | check | Product: %s | Open type is OAIR; returning False.", self.product_name)
             return False
         elif self.opentype in ["OD v", "OTD v", "OAOR v", "ORR v"]:
             self.direction = "short"
-            logger.debug(f"DOGW | check | Product: {self.product_name} | DIR_LOGIC: opentype({self.opentype}) indicates short")
+            logger.debug("DOGW | check | Product: %s | DIR_LOGIC: opentype(%s) indicates short", self.product_name, self.opentype)
         elif self.opentype in ["OD ^", "OTD ^", "OAOR ^", "ORR ^"]:
             self.direction = "long"
-            logger.debug(f"DOGW | check | Product: {self.product_name} | DIR_LOGIC: opentype({self.opentype}) indicates long")
+            logger.debug("DOGW | check | Product: %s | DIR_LOGIC: opentype(%s) indicates long", self.product_name, self.opentype)
         else:
-            logger.debug(f"DOGW | check | Product: {self.product_name} | Open type is WAIT; returning False.")
+            logger.debug("DOGW | check | Product: %s | Open type is WAIT; returning False.", self.product_name)
             return False
 
         self.color = "red" if self.direction == "short" else "green"
@@ -250,7 +217,7 @@ class DOGW(Base):
         if self.time_window() and self.input():
             with last_alerts_lock:
                 last_alert = last_alerts.get(self.product_name)
-                logger.debug(f"DOGW | check | Product: {self.product_name} | Current Alert: {self.direction} | Last Alert: {last_alert}")
+                logger.debug("DOGW | check | Product: %s | Current Alert: %s | Last Alert: %s", self.product_name, self.direction, last_alert)
                 if self.direction != last_alert:
                     logger.info(f"DOGW | check | Product: {self.product_name} | Note: Condition Met")
                     self.used_atr = ((self.ib_high - self.ib_low) / self.ib_atr)
@@ -258,20 +225,20 @@ class DOGW(Base):
                     # CRITERIA 1: 40% ATR Left
                     if self.used_atr <= 0.60:
                         self.c_within_atr = "x"
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_1 met -> [{self.c_within_atr}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_1 met -> [%s]", self.product_name, self.direction, self.c_within_atr)
                     else:
                         self.c_within_atr = "  "
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_1 not met -> [{self.c_within_atr}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_1 not met -> [%s]", self.product_name, self.direction, self.c_within_atr)
                     
                     # CRITERIA 2: 50% of ETH Expected Range Left
                     self.day_range_used = max(self.overnight_high, self.day_high) - min(self.overnight_low, self.day_low)
                     self.range_used = round((self.day_range_used / self.exp_rng), 2)
                     if self.range_used <= 0.5:
                         self.c_exp_rng = "x"
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_2 met -> [{self.c_exp_rng}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_2 met -> [%s]", self.product_name, self.direction, self.c_exp_rng)
                     else:
                         self.c_exp_rng = "  "
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_2 not met -> [{self.c_exp_rng}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_2 not met -> [%s]", self.product_name, self.direction, self.c_exp_rng)
                     
                     # Determine if we are within the first 30 minutes of the DOGW period
                     if self.product_name == 'CL':
@@ -280,7 +247,7 @@ class DOGW(Base):
                         period_start_dt = datetime.combine(self.current_datetime.date(), self.equity_open, tzinfo=self.est)
                     if self.current_datetime < period_start_dt + timedelta(minutes=30):
                         self.in_first_30 = True
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Within first 30 minutes. Skipping VWAP slope check.")
+                        logger.debug("DOGW | check | Product: %s | Within first 30 minutes. Skipping VWAP slope check.", self.product_name)
                         self.c_vwap_slope = "  "  # Do not mark VWAP slope
                     else:
                         self.in_first_30 = False
@@ -288,64 +255,64 @@ class DOGW(Base):
                         self.c_vwap_slope = "  "
                         if self.direction == "short" and self.vwap_slope < -0.10:
                             self.c_vwap_slope = "x"
-                            logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3 met: vwap_slope({self.vwap_slope}) < -0.10 -> [{self.c_vwap_slope}]")
+                            logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_3 met: vwap_slope(%s) < -0.10 -> [%s]", self.product_name, self.direction, self.vwap_slope, self.c_vwap_slope)
                         elif self.direction == "long" and self.vwap_slope > 0.10:
                             self.c_vwap_slope = "x"
-                            logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3 met: vwap_slope({self.vwap_slope}) > 0.10 -> [{self.c_vwap_slope}]")
+                            logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_3 met: vwap_slope(%s) > 0.10 -> [%s]", self.product_name, self.direction, self.vwap_slope, self.c_vwap_slope)
                         else:
-                            logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3 not met -> [{self.c_vwap_slope}]")
+                            logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_3 not met -> [%s]", self.product_name, self.direction, self.c_vwap_slope)
                     
                     # CRITERIA 4: Orderflow
                     self.c_orderflow = "  "
                     if self.direction == "short" and self.delta < 0:
                         self.c_orderflow = "x"
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4 met: delta({self.delta}) < 0 -> [{self.c_orderflow}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_4 met: delta(%s) < 0 -> [%s]", self.product_name, self.direction, self.delta, self.c_orderflow)
                     elif self.direction == "long" and self.delta > 0:
                         self.c_orderflow = "x"
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4 met: delta({self.delta}) > 0 -> [{self.c_orderflow}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_4 met: delta(%s) > 0 -> [%s]", self.product_name, self.direction, self.delta, self.c_orderflow)
                     else:
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4 not met -> [{self.c_orderflow}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_4 not met -> [%s]", self.product_name, self.direction, self.c_orderflow)
                     
                     # CRITERIA 5: Euro IB
                     self.c_euro_ib = "  "
                     if self.direction == "short" and self.cpl < self.euro_ibl:
                         self.c_euro_ib = "x"
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5 met: cpl({self.cpl}) < euro_ibl({self.euro_ibl}) -> [{self.c_euro_ib}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_5 met: cpl(%s) < euro_ibl(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.euro_ibl, self.c_euro_ib)
                     elif self.direction == "long" and self.cpl > self.euro_ibh:
                         self.c_euro_ib = "x"
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5 met: cpl({self.cpl}) > euro_ibh({self.euro_ibh}) -> [{self.c_euro_ib}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_5 met: cpl(%s) > euro_ibh(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.euro_ibh, self.c_euro_ib)
                     else:
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5 not met -> [{self.c_euro_ib}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_5 not met -> [%s]", self.product_name, self.direction, self.c_euro_ib)
                     
                     # CRITERIA 6: Above / Below Opening Range
                     self.c_or = "  "
                     if self.direction == "short" and self.cpl < self.orl:
                         self.c_or = "x"
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6 met: cpl({self.cpl}) < orl({self.orl}) -> [{self.c_or}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_6 met: cpl(%s) < orl(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.orl, self.c_or)
                     elif self.direction == "long" and self.cpl > self.orh:
                         self.c_or = "x"
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6 met: cpl({self.cpl}) > orh({self.orh}) -> [{self.c_or}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_6 met: cpl(%s) > orh(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.orh, self.c_or)
                     else:
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6 not met -> [{self.c_or}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_6 not met -> [%s]", self.product_name, self.direction, self.c_or)
                     
                     # CRITERIA 7: RVOL
                     if self.rvol > 100:
                         self.c_rvol = "x"
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_7 met: rvol({self.rvol}) > 100 -> [{self.c_rvol}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_7 met: rvol(%s) > 100 -> [%s]", self.product_name, self.direction, self.rvol, self.c_rvol)
                     else:
                         self.c_rvol = "  "
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_7 not met: rvol({self.rvol}) <= 100 -> [{self.c_rvol}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_7 not met: rvol(%s) <= 100 -> [%s]", self.product_name, self.direction, self.rvol, self.c_rvol)
                     
                     # CRITERIA 8: ETH VWAP
                     self.c_eth_vwap = "  "
                     if self.direction == "short" and self.cpl < self.eth_vwap:
                         self.c_eth_vwap = "x"
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_8 met: cpl({self.cpl}) < eth_vwap({self.eth_vwap}) -> [{self.c_eth_vwap}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_8 met: cpl(%s) < eth_vwap(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.eth_vwap, self.c_eth_vwap)
                     elif self.direction == "long" and self.cpl > self.eth_vwap:
                         self.c_eth_vwap = "x"
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_8 met: cpl({self.cpl}) > eth_vwap({self.eth_vwap}) -> [{self.c_eth_vwap}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_8 met: cpl(%s) > eth_vwap(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.eth_vwap, self.c_eth_vwap)
                     else:
-                        logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_8 not met -> [{self.c_eth_vwap}]")
+                        logger.debug("DOGW | check | Product: %s | Direction: %s | CRITERIA_8 not met -> [%s]", self.product_name, self.direction, self.c_eth_vwap)
                                 
                     # Score Calculation
                     if self.in_first_30:
@@ -358,7 +325,7 @@ class DOGW(Base):
                             self.c_orderflow, self.c_euro_ib, self.c_or, self.c_rvol, self.c_exp_rng, self.c_vwap_slope, self.c_within_atr, self.c_eth_vwap
                         ] if condition == "x")
                         max_score = 8
-                    logger.debug(f"DOGW | check | Product: {self.product_name} | Direction: {self.direction} | SCORE: {self.score} / {max_score}")
+                    logger.debug("DOGW | check | Product: %s | Direction: %s | SCORE: %s / %s", self.product_name, self.direction, self.score, max_score)
                     
                     try:
                         last_alerts[self.product_name] = self.direction
@@ -366,9 +333,9 @@ class DOGW(Base):
                     except Exception as e:
                         logger.error(f"DOGW | check | Product: {self.product_name} | Note: Failed to send Slack alert: {e}")
                 else:
-                    logger.debug(f"DOGW | check | Product: {self.product_name} | Note: Alert: {self.direction} Is Same")
+                    logger.debug("DOGW | check | Product: %s | Note: Alert: %s Is Same", self.product_name, self.direction)
         else:
-            logger.debug(f"DOGW | check | Product: {self.product_name} | Note: Condition(s) Not Met")
+            logger.debug("DOGW | check | Product: %s | Note: Condition(s) Not Met", self.product_name)
 
 
     # ---------------------------------- Alert Preparation------------------------------------ #  
@@ -441,6 +408,6 @@ class DOGW(Base):
         return embed 
     
     def execute(self):
-        embed = self.discord_message()
+        embed = self.build_embed()
         self.send_playbook_embed(embed, username=None, avatar_url=None)
         logger.info(f"DOGW | execute | Product: {self.product_name} | Note: Alert Sent To Playbook Webhook")
@@ -1,44 +1,41 @@
 import logging
-import math
 import threading
 from datetime import datetime
 from alertbot.utils import config
+from alertbot.utils import clock
 from discord_webhook import DiscordEmbed, DiscordWebhook
 from alertbot.alerts.base import Base
+from alertbot.utils.trace import decision_trace
 logger = logging.getLogger(__name__)
 
 last_alerts = {}
 last_alerts_lock = threading.Lock()
 
 class PVAT(Base):
-    def __init__(self, product_name, variables):    
-        super().__init__(product_name=product_name, variables=variables)
+    def __init__(self, product_name, variables, context=None):    
+        super().__init__(product_name=product_name, variables=variables, context=context)
         
         # Variables (Round All Variables)
-        self.p_vpoc = self.safe_round(self.variables.get(f'{self.product_name}_PRIOR_VPOC'))
-        self.day_open = self.safe_round(self.variables.get(f'{self.product_name}_DAY_OPEN'))
-        self.p_high = self.safe_round(self.variables.get(f'{self.product_name}_PRIOR_HIGH'))
-        self.p_low = self.safe_round(self.variables.get(f'{self.product_name}_PRIOR_LOW'))
-        self.ib_atr = self.safe_round(self.variables.get(f'{self.product_name}_IB_ATR'))
-        self.euro_ibh = self.safe_round(self.variables.get(f'{self.product_name}_EURO_IBH'))
-        self.euro_ibl = self.safe_round(self.variables.get(f'{self.product_name}_EURO_IBL'))
-        self.orh = self.safe_round(self.variables.get(f'{self.product_name}_ORH'))
-        self.orl = self.safe_round(self.variables.get(f'{self.product_name}_ORL'))
-        self.eth_vwap = self.variables.get(f'{self.product_name}_ETH_VWAP')
-        self.cpl = self.safe_round(self.variables.get(f'{self.product_name}_CPL'), 2)
-        self.total_ovn_delta = self.safe_round(self.variables.get(f'{self.product_name}_TOTAL_OVN_DELTA'))
-        self.total_rth_delta = self.safe_round(self.variables.get(f'{self.product_name}_TOTAL_RTH_DELTA'))
-        self.prior_close = self.safe_round(self.variables.get(f'{self.product_name}_PRIOR_CLOSE'))
-        self.ib_high = self.safe_round(self.variables.get(f'{product_name}_IB_HIGH'))
-        self.ib_low = self.safe_round(self.variables.get(f'{product_name}_IB_LOW'))
+        self.p_vpoc = self.safe_round(self.variables.prior_vpoc)
+        self.day_open = self.safe_round(self.variables.day_open)
+        self.p_high = self.safe_round(self.variables.prior_high)
+        self.p_low = self.safe_round(self.variables.prior_low)
+        self.ib_atr = self.safe_round(self.variables.ib_atr)
+        self.euro_ibh = self.safe_round(self.variables.euro_ibh)
+        self.euro_ibl = self.safe_round(self.variables.euro_ibl)
+        self.orh = self.safe_round(self.variables.orh)
+        self.orl = self.safe_round(self.variables.orl)
+        self.eth_vwap = self.variables.eth_vwap
+        self.cpl = self.safe_round(self.variables.cpl, 2)
+        self.total_ovn_delta = self.safe_round(self.variables.total_ovn_delta)
+        self.total_rth_delta = self.safe_round(self.variables.total_rth_delta)
+        self.prior_close = self.safe_round(self.variables.prior_close)
+        self.ib_high = self.safe_round(self.variables.ib_high)
+        self.ib_low = self.safe_round(self.variables.ib_low)
         
-        self.es_impvol = config.es_impvol
-        self.nq_impvol = config.nq_impvol
-        self.rty_impvol = config.rty_impvol
-        self.cl_impvol = config.cl_impvol 
         
-        self.delta = self.total_delta()
-        self.exp_rng, self.exp_hi, self.exp_lo = self.exp_range() 
+        self.delta = self.context.total_delta()
+        self.exp_rng, self.exp_hi, self.exp_lo = self.context.exp_range() 
         
     def safe_round(self, value, digits=2):
         if value is None:
@@ -49,37 +46,9 @@ class PVAT(Base):
         except Exception as e:
             logger.error(f"PVAT | safe_round | Product: {self.product_name} | Error rounding value {value}: {e}")
             return 0  
-# ---------------------------------- Specific Calculations ------------------------------------ #   
-    def exp_range(self):
-        if not self.prior_close:
-            logger.error(f" PVAT | exp_range | Product: {self.product_name} | Note: No Close Found")
-            raise ValueError(f" PVAT | exp_range | Product: {self.product_name} | Note: Need Close For Calculation!")
-        impvol = {
-            'ES': self.es_impvol,
-            'NQ': self.nq_impvol,
-            'RTY': self.rty_impvol,
-            'CL': self.cl_impvol
-        }.get(self.product_name)
-        if impvol is None:
-            raise ValueError(f" PVAT | exp_range | Product: {self.product_name} | Note: Unknown Product")
-        exp_range = self.safe_round(((self.prior_close * (impvol / 100)) * math.sqrt(1/252)))
-        exp_hi = self.safe_round(self.prior_close + exp_range)
-        exp_lo = self.safe_round(self.prior_close - exp_range)
-        
-        logger.debug(f" PVAT | exp_range | Product: {self.product_name} | EXP_RNG: {exp_range} | EXP_HI: {exp_hi} | EXP_LO: {exp_lo}")
-        return exp_range, exp_hi, exp_lo
-        
-    def total_delta(self):       
-        total_delta = self.total_ovn_delta + self.total_rth_delta
-        
-        logger.debug(f" PVAT | total_delta | Product: {self.product_name} | TOTAL_DELTA: {total_delta}")
-        return total_delta   
-    
 # ---------------------------------- Driving Input Logic ------------------------------------ #   
     def input(self):
-        def log_condition(condition, description):
-            logger.debug(f" PVAT | input | Product: {self.product_name} | Direction: {self.direction} | {description} --> {condition}")
-            return condition
+        log_condition = decision_trace.start("PVAT", self.product_name, self.direction)
 
         self.used_atr = self.ib_high - self.ib_low
         self.remaining_atr = max((self.ib_atr - self.used_atr), 0)
@@ -87,54 +56,53 @@ class PVAT(Base):
         # Direction Based Logic
         if self.direction == "short":
             crit1 = log_condition(abs(self.ib_low - self.p_vpoc) <= self.remaining_atr,
-                                                f"CRITICAL1: abs(ib_low({self.ib_low}) - p_vpoc({self.p_vpoc})) <= self.remaining_atr({self.remaining_atr})")
+                                                "CRITICAL1: abs(ib_low(%s) - p_vpoc(%s)) <= self.remaining_atr(%s)", self.ib_low, self.p_vpoc, self.remaining_atr)
             crit2 = log_condition(self.cpl < self.orl,
-                                            f"CRITICAL2: cpl({self.cpl}) < orl({self.orl})")
+                                            "CRITICAL2: cpl(%s) < orl(%s)", self.cpl, self.orl)
         elif self.direction == "long":
             crit1 = log_condition(abs(self.ib_high - self.p_vpoc) <= self.remaining_atr,
-                                                f"CRITICAL1: abs(ib_high({self.ib_high}) - p_vpoc({self.p_vpoc})) <= self.remaining_atr({self.remaining_atr})")
+                                                "CRITICAL1: abs(ib_high(%s) - p_vpoc(%s)) <= self.remaining_atr(%s)", self.ib_high, self.p_vpoc, self.remaining_atr)
             crit2 = log_condition(self.cpl > self.orh,
-                                            f"CRITICAL2: cpl({self.cpl}) > orh({self.orh})")
+                                            "CRITICAL2: cpl(%s) > orh(%s)", self.cpl, self.orh)
 
         # Driving Input Logic
         crit3 = log_condition(self.p_low - (self.exp_rng * 0.15) <= self.day_open <= self.p_high + (self.exp_rng * 0.15),
-                            f"CRITICAL3: p_low({self.p_low}) - (exp_rng({self.exp_rng})*0.15) <= day_open({self.day_open}) <= p_high({self.p_high}) + (exp_rng({self.exp_rng})*0.15)")
+                            "CRITICAL3: p_low(%s) - (exp_rng(%s)*0.15) <= day_open(%s) <= p_high(%s) + (exp_rng(%s)*0.15)", self.p_low, self.exp_rng, self.day_open, self.p_high, self.exp_rng)
         crit4 = log_condition(self.p_low + (self.exp_rng * 0.10) <= self.cpl <= self.p_high - (self.exp_rng * 0.10),
-                            f"CRITICAL4: p_low({self.p_low}) + (exp_rng({self.exp_rng})*0.10) <= cpl({self.cpl}) <= p_high({self.p_high}) - (exp_rng({self.exp_rng})*0.10)")
+                            "CRITICAL4: p_low(%s) + (exp_rng(%s)*0.10) <= cpl(%s) <= p_high(%s) - (exp_rng(%s)*0.10)", self.p_low, self.exp_rng, self.cpl, self.p_high, self.exp_rng)
         crit5 = log_condition(abs(self.cpl - self.p_vpoc) > self.exp_rng * 0.1,
-                            f"CRITICAL5: abs(cpl({self.cpl}) - p_vpoc({self.p_vpoc})) > (exp_rng){self.exp_rng})*0.1)")
+                            "CRITICAL5: abs(cpl(%s) - p_vpoc(%s)) > (exp_rng)%s)*0.1)", self.cpl, self.p_vpoc, self.exp_rng)
         logic = crit1 and crit2 and crit3 and crit4 and crit5
 
-        logger.debug(f" PVAT | input | Product: {self.product_name} | Direction: {self.direction} | FINAL_LOGIC: {logic} | "
-                    f"CRITICAL1: {crit1} | CRITICAL2: {crit2} | CRITICAL3: {crit3} | CRITICAL4: {crit4} | CRITICAL5: {crit5}")
+        logger.debug(" PVAT | input | Product: %s | Direction: %s | FINAL_LOGIC: %s | CRITICAL1: %s | CRITICAL2: %s | CRITICAL3: %s | CRITICAL4: %s | CRITICAL5: %s", self.product_name, self.direction, logic, crit1, crit2, crit3, crit4, crit5)
         return logic
     
 # ---------------------------------- Opportunity Window ------------------------------------ #   
     def time_window(self):
         
         # Update current time
-        self.current_datetime = datetime.now(self.est)
+        self.current_datetime = clock.now(self.est)
         self.current_time = self.current_datetime.time()
         
         # Define time windows based on product type
         if self.product_name == 'CL':
             start_time = self.crude_pvat_start
             end_time = self.crude_ib
-            logger.debug(f" PVAT | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug(" PVAT | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         elif self.product_name in ['ES', 'RTY', 'NQ']:
             start_time = self.equity_pvat_start
             end_time = self.equity_ib
-            logger.debug(f" PVAT | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug(" PVAT | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         else:
             logger.warning(f" PVAT | time_window | Product: {self.product_name} | No time window defined.")
             return False  
         
         # Check if current time is within the window
         if start_time <= self.current_time <= end_time:
-            logger.debug(f" PVAT | time_window | Product: {self.product_name} | Within Window: {self.current_time}.")
+            logger.debug(" PVAT | time_window | Product: %s | Within Window: %s.", self.product_name, self.current_time)
             return True
         else:
-            logger.debug(f" PVAT | time_window | Product: {self.product_name} | Outside Window {self.current_time}.")
+            logger.debug(" PVAT | time_window | Product: %s | Outside Window %s.", self.product_name, self.current_time)
             return False
 # ---------------------------------- Calculate Criteria ------------------------------------ #      
     def check(self):
@@ -142,10 +110,10 @@ class PVAT(Base):
         # Define Direction with Detailed Logging
         if self.cpl > self.p_vpoc:
             self.direction = "short"
-            logger.debug(f" PVAT | check | Product: {self.product_name} | DIR_LOGIC: self.cpl({self.cpl}) > self.p_vpoc({self.p_vpoc}) -> short")
+            logger.debug(" PVAT | check | Product: %s | DIR_LOGIC: self.cpl(%s) > self.p_vpoc(%s) -> short", self.product_name, self.cpl, self.p_vpoc)
         else:
             self.direction = "long"
-            logger.debug(f" PVAT | check | Product: {self.product_name} | DIR_LOGIC: self.cpl({self.cpl}) <= self.p_vpoc({self.p_vpoc}) -> long")
+            logger.debug(" PVAT | check | Product: %s | DIR_LOGIC: self.cpl(%s) <= self.p_vpoc(%s) -> long", self.product_name, self.cpl, self.p_vpoc)
         
         self.color = "red" if self.direction == "short" else "green"
         
@@ -153,7 +121,7 @@ class PVAT(Base):
         if self.time_window() and self.input():
             with last_alerts_lock:
                 last_alert = last_alerts.get(self.product_name)
-                logger.debug(f" PVAT | check | Product: {self.product_name} | Current Alert: {self.direction} | Last Alert: {last_alert}")
+                logger.debug(" PVAT | check | Product: %s | Current Alert: %s | Last Alert: %s", self.product_name, self.direction, last_alert)
                 
                 if self.direction != last_alert:
                     logger.info(f" PVAT | check | Product: {self.product_name} | Note: Condition Met")
@@ -162,63 +130,63 @@ class PVAT(Base):
                     
                     # CRITERIA 1: c_within_atr
                     self.c_within_atr = "x"
-                    logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_1: Set c_within_atr -> [{self.c_within_atr}]")
+                    logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_1: Set c_within_atr -> [%s]", self.product_name, self.direction, self.c_within_atr)
                     
                     # CRITERIA 2: c_orderflow
                     self.c_orderflow = "  "
                     if self.direction == "short" and self.delta < 0:
                         self.c_orderflow = "x"
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_2: self.delta({self.delta}) < 0 for short -> [{self.c_orderflow}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_2: self.delta(%s) < 0 for short -> [%s]", self.product_name, self.direction, self.delta, self.c_orderflow)
                     elif self.direction == "long" and self.delta > 0:
                         self.c_orderflow = "x"
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_2: self.delta({self.delta}) > 0 for long -> [{self.c_orderflow}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_2: self.delta(%s) > 0 for long -> [%s]", self.product_name, self.direction, self.delta, self.c_orderflow)
                     else:
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_2: Orderflow criteria not met -> [{self.c_orderflow}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_2: Orderflow criteria not met -> [%s]", self.product_name, self.direction, self.c_orderflow)
                     
                     # CRITERIA 3: c_euro_ib
                     self.c_euro_ib = "  "
                     if self.direction == "short" and self.cpl < self.euro_ibl:
                         self.c_euro_ib = "x"
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: self.cpl({self.cpl}) < self.euro_ibl({self.euro_ibl}) for short -> [{self.c_euro_ib}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_3: self.cpl(%s) < self.euro_ibl(%s) for short -> [%s]", self.product_name, self.direction, self.cpl, self.euro_ibl, self.c_euro_ib)
                     elif self.direction == "long" and self.cpl > self.euro_ibh:
                         self.c_euro_ib = "x"
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: self.cpl({self.cpl}) > self.euro_ibh({self.euro_ibh}) for long -> [{self.c_euro_ib}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_3: self.cpl(%s) > self.euro_ibh(%s) for long -> [%s]", self.product_name, self.direction, self.cpl, self.euro_ibh, self.c_euro_ib)
                     else:
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: Euro IB criteria not met -> [{self.c_euro_ib}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_3: Euro IB criteria not met -> [%s]", self.product_name, self.direction, self.c_euro_ib)
                     
                     # CRITERIA 4: c_or
                     self.c_or = "  "
                     if self.direction == "short" and self.cpl < self.orl:
                         self.c_or = "x"
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: self.cpl({self.cpl}) < self.orl({self.orl}) for short -> [{self.c_or}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_4: self.cpl(%s) < self.orl(%s) for short -> [%s]", self.product_name, self.direction, self.cpl, self.orl, self.c_or)
                     elif self.direction == "long" and self.cpl > self.orh:
                         self.c_or = "x"
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: self.cpl({self.cpl}) > self.orh({self.orh}) for long -> [{self.c_or}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_4: self.cpl(%s) > self.orh(%s) for long -> [%s]", self.product_name, self.direction, self.cpl, self.orh, self.c_or)
                     else:
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: OR criteria not met -> [{self.c_or}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_4: OR criteria not met -> [%s]", self.product_name, self.direction, self.c_or)
                     
                     # CRITERIA 5: c_between
                     self.c_between = "  "
                     if self.direction == "short" and self.p_vpoc < self.cpl < self.eth_vwap:
                         self.c_between = "x"
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: self.p_vpoc({self.p_vpoc}) < self.cpl({self.cpl}) < self.eth_vwap({self.eth_vwap}) for short -> [{self.c_between}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_5: self.p_vpoc(%s) < self.cpl(%s) < self.eth_vwap(%s) for short -> [%s]", self.product_name, self.direction, self.p_vpoc, self.cpl, self.eth_vwap, self.c_between)
                     elif self.direction == "long" and self.eth_vwap < self.cpl < self.p_vpoc:
                         self.c_between = "x"
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: self.eth_vwap({self.eth_vwap}) < self.cpl({self.cpl}) < self.p_vpoc({self.p_vpoc}) for long -> [{self.c_between}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_5: self.eth_vwap(%s) < self.cpl(%s) < self.p_vpoc(%s) for long -> [%s]", self.product_name, self.direction, self.eth_vwap, self.cpl, self.p_vpoc, self.c_between)
                     else:
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: Between criteria not met -> [{self.c_between}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_5: Between criteria not met -> [%s]", self.product_name, self.direction, self.c_between)
                     
                     # CRITERIA 6: c_align
                     if abs(self.eth_vwap - self.p_vpoc) <= (self.exp_rng * 0.05):
                         self.c_align = "x"
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6: abs(self.eth_vwap({self.eth_vwap}) - self.p_vpoc({self.p_vpoc})) <= {self.exp_rng * 0.05} -> [{self.c_align}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_6: abs(self.eth_vwap(%s) - self.p_vpoc(%s)) <= %s -> [%s]", self.product_name, self.direction, self.eth_vwap, self.p_vpoc, self.exp_rng * 0.05, self.c_align)
                     else:
                         self.c_align = "  "
-                        logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6: abs(self.eth_vwap({self.eth_vwap}) - self.p_vpoc({self.p_vpoc})) > {self.exp_rng * 0.05} -> [{self.c_align}]")
+                        logger.debug(" PVAT | check | Product: %s | Direction: %s | CRITERIA_6: abs(self.eth_vwap(%s) - self.p_vpoc(%s)) > %s -> [%s]", self.product_name, self.direction, self.eth_vwap, self.p_vpoc, self.exp_rng * 0.05, self.c_align)
                     
                     # Score Calculation Logging
                     self.score = sum(1 for condition in [self.c_within_atr, self.c_orderflow, self.c_euro_ib, self.c_or, self.c_between, self.c_align] if condition == "x")
-                    logger.debug(f" PVAT | check | Product: {self.product_name} | Direction: {self.direction} | SCORE: {self.score}/6")
+                    logger.debug(" PVAT | check | Product: %s | Direction: %s | SCORE: %s/6", self.product_name, self.direction, self.score)
                     
                     try:
                         last_alerts[self.product_name] = self.direction
@@ -226,9 +194,9 @@ class PVAT(Base):
                     except Exception as e:
                         logger.error(f" PVAT | check | Product: {self.product_name} | Note: Failed to send Slack alert: {e}")
                 else:
-                    logger.debug(f" PVAT | check | Product: {self.product_name} | Note: Alert: {self.direction} Is Same")
+                    logger.debug(" PVAT | check | Product: %s | Note: Alert: %s Is Same", self.product_name, self.direction)
         else:
-            logger.debug(f" PVAT | check | Product: {self.product_name} | Note: Condition(s) Not Met")
+            logger.debug(" PVAT | check | Product: %s | Note: Condition(s) Not Met", self.product_name)
 
 # ---------------------------------- Alert Preparation------------------------------------ #  
     def discord_message(self):
@@ -290,6 +258,6 @@ class PVAT(Base):
         return embed 
     
     def execute(self):
-        embed = self.discord_message()
+        embed = self.build_embed()
         self.send_playbook_embed(embed, username=None, avatar_url=None)
         logger.info(f"PVAT | execute | Product: {self.product_name} | Note: Alert Sent To Playbook Webhook")
\ No newline at end of file
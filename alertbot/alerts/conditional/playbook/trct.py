@@ -1,13 +1,14 @@
 import logging
-import math
 import threading
 from datetime import datetime
 from alertbot.utils import config
+from alertbot.utils import clock
 from discord_webhook import DiscordEmbed
 from alertbot.alerts.base import Base
-from datetime import datetime, time
+from alertbot.utils.trace import decision_trace
+from alertbot.source.extraction import product_periods
 from zoneinfo import ZoneInfo
-from collections import defaultdict
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -15,28 +16,24 @@ last_alerts = {}
 last_alerts_lock = threading.Lock()
 
 class TRCT(Base):
-    def __init__(self, product_name, variables):    
-        super().__init__(product_name=product_name, variables=variables)
+    def __init__(self, product_name, variables, context=None):    
+        super().__init__(product_name=product_name, variables=variables, context=context)
         
         # Variables (Round All Variables)
-        self.day_high = self.safe_round(variables.get(f'{product_name}_DAY_HIGH'))
-        self.day_low = self.safe_round(variables.get(f'{product_name}_DAY_LOW'))           
-        self.prior_high = self.safe_round(variables.get(f'{self.product_name}_PRIOR_HIGH'))
-        self.prior_low = self.safe_round(variables.get(f'{self.product_name}_PRIOR_LOW'))
-        self.cpl = self.safe_round(variables.get(f'{self.product_name}_CPL'))
-        self.prior_close = self.safe_round(variables.get(f'{self.product_name}_PRIOR_CLOSE'))
-        self.ib_high = self.safe_round(variables.get(f'{product_name}_IB_HIGH'))
-        self.ib_low = self.safe_round(variables.get(f'{product_name}_IB_LOW'))
-        self.prior_ibh = self.safe_round(variables.get(f'{self.product_name}_PRIOR_IB_HIGH'))
-        self.prior_ibl = self.safe_round(variables.get(f'{self.product_name}_PRIOR_IB_LOW'))          
-        self.day_vpoc = self.safe_round(variables.get(f'{product_name}_DAY_VPOC')) 
-        self.vwap_slope = variables.get(f'{product_name}_VWAP_SLOPE')
-        self.fd_vpoc = self.safe_round(variables.get(f'{product_name}_5D_VPOC'))
-        self.es_impvol = config.es_impvol
-        self.nq_impvol = config.nq_impvol
-        self.rty_impvol = config.rty_impvol
-        self.cl_impvol = config.cl_impvol 
-        self.exp_rng = self.exp_range() 
+        self.day_high = self.safe_round(variables.day_high)
+        self.day_low = self.safe_round(variables.day_low)           
+        self.prior_high = self.safe_round(variables.prior_high)
+        self.prior_low = self.safe_round(variables.prior_low)
+        self.cpl = self.safe_round(variables.cpl)
+        self.prior_close = self.safe_round(variables.prior_close)
+        self.ib_high = self.safe_round(variables.ib_high)
+        self.ib_low = self.safe_round(variables.ib_low)
+        self.prior_ibh = self.safe_round(variables.prior_ib_high)
+        self.prior_ibl = self.safe_round(variables.prior_ib_low)          
+        self.day_vpoc = self.safe_round(variables.day_vpoc) 
+        self.vwap_slope = variables.vwap_slope
+        self.fd_vpoc = self.safe_round(variables.vpoc_5d)
+        self.exp_rng = self.context.exp_range()[0] 
         
     def safe_round(self, value, digits=2):
         if value is None:
@@ -50,77 +47,7 @@ class TRCT(Base):
 
 # ---------------------------------- Specific Calculations ------------------------------------ #   
     def prior_day(self):
-        if self.prior_high <= self.prior_ibh and self.prior_low >= self.prior_ibl:
-            day_type = "Rotational"
-        elif (self.prior_low < self.prior_ibl and self.prior_high > self.prior_ibh and 
-            self.prior_close >= self.prior_ibh + 0.5 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Directional"
-        elif (self.prior_low < self.prior_ibl and self.prior_high > self.prior_ibh and 
-            self.prior_close <= self.prior_ibl - 0.5 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Directional"
-        elif (self.prior_high > self.prior_ibh and self.prior_low < self.prior_ibl and
-            self.prior_close >= (self.prior_ibl - 0.5 * (self.prior_ibh - self.prior_ibl)) and
-            self.prior_close <= (self.prior_ibh + 0.5 * (self.prior_ibh - self.prior_ibl))):
-            day_type = "Rotational"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and 
-            self.prior_high <= self.prior_ibh + 0.5 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Rotational"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and 
-            self.prior_low >= self.prior_ibl - 0.5 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Rotational"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and
-            self.prior_high >= self.prior_ibh + (self.prior_ibh - self.prior_ibl) and
-            self.prior_close >= self.prior_ibh + (self.prior_ibh - self.prior_ibl)):
-            day_type = "Directional"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and
-            self.prior_close <= self.prior_ibh + (self.prior_ibh - self.prior_ibl) and
-            self.prior_high >= self.prior_ibh + 1.25 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Directional"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and
-            self.prior_low <= self.prior_ibl - (self.prior_ibh - self.prior_ibl) and
-            self.prior_close <= self.prior_ibl - (self.prior_ibh - self.prior_ibl)):
-            day_type = "Directional"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and
-            self.prior_close >= self.prior_ibl - (self.prior_ibh - self.prior_ibl) and
-            self.prior_low <= self.prior_ibl - 1.25 * (self.prior_ibh - self.prior_ibl)):
-            day_type = "Directional"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and
-            self.prior_high >= self.prior_ibh + 0.5 * (self.prior_ibh - self.prior_ibl) and
-            self.prior_high <= self.prior_ibh + (self.prior_ibh - self.prior_ibl)):
-            day_type = "Semi-Rotational"
-        elif (self.prior_high > self.prior_ibh and self.prior_low >= self.prior_ibl and
-            self.prior_high >= self.prior_ibh + (self.prior_ibh - self.prior_ibl) and
-            self.prior_close <= self.prior_ibh + (self.prior_ibh - self.prior_ibl)):
-            day_type = "Semi-Directional"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and  # IB EXTENSION DOWN
-            self.prior_low <= self.prior_ibl - 0.5 * (self.prior_ibh - self.prior_ibl) and # LOW IS BELOW 1.5x IB
-            self.prior_low >= self.prior_ibl - (self.prior_ibh - self.prior_ibl)): # LOW IS ABOVE 2x IB
-            day_type = "Semi-Rotational"
-        elif (self.prior_low < self.prior_ibl and self.prior_high <= self.prior_ibh and # IB EXTENSION DOWN
-            self.prior_low <= self.prior_ibl - (self.prior_ibh - self.prior_ibl) and # LOW IS BELOW 2x IB
-            self.prior_close >= self.prior_ibl - (self.prior_ibh - self.prior_ibl)): # CLOSE IS WITHIN 2x IB
-            day_type = "Semi-Directional"
-        else:
-            day_type = "Other"
-        logger.debug(f" TRCT | prior_day | Product: {self.product_name} | Prior Day Type: {day_type}")
-        return day_type
-    
-    def exp_range(self):
-        if not self.prior_close:
-            logger.error(f" TRCT | exp_range | Product: {self.product_name} | Note: No Close Found")
-            raise ValueError(f" TRCT | exp_range | Product: {self.product_name} | Note: Need Close For Calculation!")
-        impvol = {
-            'ES': self.es_impvol,
-            'NQ': self.nq_impvol,
-            'RTY': self.rty_impvol,
-            'CL': self.cl_impvol
-        }.get(self.product_name)
-        if impvol is None:
-            raise ValueError(f" TRCT | exp_range | Product: {self.product_name} | Note: Unknown Product")
-        exp_range = self.safe_round(((self.prior_close * (impvol / 100)) * math.sqrt(1/252)))
-        logger.debug(f" TRCT | exp_range | Product: {self.product_name} | EXP_RNG: {exp_range}")
-        return exp_range 
-    
+        return self.context.prior_day()
 # ---------------------------------- Driving Input Logic ------------------------------------ #   
     def trend_day(self):
         """
@@ -146,33 +73,17 @@ class TRCT(Base):
         7) RTH VPOC within the last/current period range.
         """
         ib_range = self.ib_high - self.ib_low
-        if self.product_name == "CL":
-            period_times = {
-                'A': time(9, 0), 'B': time(9, 30), 'C': time(10, 0),
-                'D': time(10, 30), 'E': time(11, 0), 'F': time(11, 30),
-                'G': time(12, 0), 'H': time(12, 30), 'I': time(13, 0),
-                'J': time(13, 30), 'K': time(14, 0),
-            }
-        else:
-            period_times = {
-                'A': time(9, 30), 'B': time(10, 0), 'C': time(10, 30),
-                'D': time(11, 0), 'E': time(11, 30), 'F': time(12, 0),
-                'G': time(12, 30), 'H': time(13, 0), 'I': time(13, 30),
-                'J': time(14, 0), 'K': time(14, 30), 'L': time(15, 0),
-                'M': time(15, 30),
-            }
+        # Periods are contiguous from A, so the started ones are a prefix of the product's period table
+        now = clock.now(ZoneInfo('America/New_York')).time()
+        finished_periods = list(product_periods[self.product_name])[:self.variables.started_periods(now)]
 
-        now = datetime.now(ZoneInfo('America/New_York')).time()
-        sorted_periods = sorted(period_times.items(), key=lambda x: x[1])
-        finished_periods = [p for p, t in sorted_periods if t <= now]
-
-        logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | TPO Periods: {finished_periods}")
+        logger.debug("TRCT | trend_day | Product: %s | Direction: %s | TPO Periods: %s", self.product_name, self.direction, finished_periods)
 
         # --- LONG DIRECTION ---
         if self.direction == "long":
             # CRITICAL1: Day high must exceed IB_high + 0.5 * IB_range.
             condition1 = self.day_high > self.ib_high + 0.5 * ib_range
-            logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL1: day_high({self.day_high}) > ib_high({self.ib_high}) + 0.5*ib_range --> {condition1}")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL1: day_high(%s) > ib_high(%s) + 0.5*ib_range --> %s", self.product_name, self.direction, self.day_high, self.ib_high, condition1)
 
             # CRITICAL2: Acceptance Outside IB Range.
             acceptance = True
@@ -180,88 +91,58 @@ class TRCT(Base):
             extension_found = False
             for period in finished_periods:
                 # Check for IB extension using HIGH
-                var_name_high = f"{self.product_name}_{period}_HIGH"
-                period_high = self.variables.get(var_name_high)
+                period_high = self.variables.period("period_high", period)
                 if period_high is None:
                     continue
                 period_high = self.safe_round(period_high)
                 if not extension_found and period_high > self.ib_high:
                     extension_found = True
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | Found IB extension at period {period} with high({period_high}). Skipping acceptance check for this period.")
+                    logger.debug("TRCT | trend_day | Product: %s | Direction: %s | Found IB extension at period %s with high(%s). Skipping acceptance check for this period.", self.product_name, self.direction, period, period_high)
                     continue
                 if not extension_found:
                     continue  # Only check acceptance after IB extension is found.
-                var_name = f"{self.product_name}_{period}_LOW"
-                period_low = self.variables.get(var_name)
+                period_low = self.variables.period("period_low", period)
                 if period_low is None:
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | Acceptance: No LOW data for period {period}. Skipping.")
+                    logger.debug("TRCT | trend_day | Product: %s | Direction: %s | Acceptance: No LOW data for period %s. Skipping.", self.product_name, self.direction, period)
                     continue
                 period_low = self.safe_round(period_low)
                 if prior_low is not None:
                     if period_low < prior_low and self.ib_low <= period_low <= self.ib_high:
-                        logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL2: Acceptance Failed: period {period} low({period_low}) < prior_low({prior_low}) inside IB.")
+                        logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL2: Acceptance Failed: period %s low(%s) < prior_low(%s) inside IB.", self.product_name, self.direction, period, period_low, prior_low)
                         acceptance = False
                         break
                 if self.ib_low <= period_low <= self.ib_high:
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | Acceptance: Updating prior_low => {period_low}")
+                    logger.debug("TRCT | trend_day | Product: %s | Direction: %s | Acceptance: Updating prior_low => %s", self.product_name, self.direction, period_low)
                     prior_low = period_low
 
             # CRITICAL3: Day_VPOC must be greater than IB_high.
             condition3 = self.day_vpoc > self.ib_high
-            logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL3: day_vpoc({self.day_vpoc}) > ib_high({self.ib_high}) --> {condition3}")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL3: day_vpoc(%s) > ib_high(%s) --> %s", self.product_name, self.direction, self.day_vpoc, self.ib_high, condition3)
 
             # CRITICAL4: Prior session must be rotational.
             prior_day_type = self.prior_day()
             condition4 = (prior_day_type in ["Rotational", "Semi-Rotational"])
-            logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL4: prior_day({prior_day_type}) == 'Rotational' or 'Semi-Rotational' --> {condition4}")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL4: prior_day(%s) == 'Rotational' or 'Semi-Rotational' --> %s", self.product_name, self.direction, prior_day_type, condition4)
 
             # CRITICAL5: self.cpl must be greater than current session MID.
             current_mid = (self.day_high + self.day_low) / 2
             condition5 = self.cpl > current_mid
-            logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL5: cpl({self.cpl}) > current_mid({round(current_mid, 2)}) --> {condition5}")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL5: cpl(%s) > current_mid(%s) --> %s", self.product_name, self.direction, self.cpl, round(current_mid, 2), condition5)
 
             # CRITICAL6: After IB extension, no subsequent period low can be <= its period ETH VWAP.
-            extension_found = False
-            condition6 = True
-            ib_extension_period = None
-            for period in finished_periods:
-                var_name_high = f"{self.product_name}_{period}_HIGH"
-                period_high = self.variables.get(var_name_high)
-                if period_high is None:
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL6: No HIGH data for period {period}. Skipping.")
-                    continue
-                period_high = round(period_high, 2)
-                if not extension_found and period_high > self.ib_high:
-                    extension_found = True
-                    ib_extension_period = period
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL6: Found IB extension at period {period} with high({period_high}).")
-                    continue
-                if extension_found:
-                    var_name_low = f"{self.product_name}_{period}_LOW"
-                    period_low = self.variables.get(var_name_low)
-                    if period_low is None:
-                        logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL6: No LOW data for period {period}. Skipping.")
-                        continue
-                    period_low = self.safe_round(period_low)
-                    vwap_var = f"{self.product_name}_ETH_VWAP_{period}"
-                    period_vwap = self.variables.get(vwap_var)
-                    if period_vwap is None:
-                        logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL6: No VWAP data for period {period}. Skipping.")
-                        continue
-                    period_vwap = self.safe_round(period_vwap)
-                    if period_low <= period_vwap:
-                        logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL6: Failed at period {period}: low({period_low}) <= vwap({period_vwap}).")
-                        condition6 = False
-                        break
+            finished = len(finished_periods)
+            ext_index = self.variables.extension_period(finished, ib_high=self.ib_high)
+            condition6 = ext_index is None or not self.variables.vwap_touched(ext_index + 1, finished, "low")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL6: IB extension index %s, no low <= vwap after it --> %s", self.product_name, self.direction, ext_index, condition6)
 
             # CRITICAL7: RTH VPOC must be within the range of the last finished or current period.
             if len(finished_periods) >= 2:
                 period1 = finished_periods[-2]
                 period2 = finished_periods[-1]
-                period1_high = self.variables.get(f"{self.product_name}_{period1}_HIGH")
-                period1_low = self.variables.get(f"{self.product_name}_{period1}_LOW")
-                period2_high = self.variables.get(f"{self.product_name}_{period2}_HIGH")
-                period2_low = self.variables.get(f"{self.product_name}_{period2}_LOW")
+                period1_high = self.variables.period("period_high", period1)
+                period1_low = self.variables.period("period_low", period1)
+                period2_high = self.variables.period("period_high", period2)
+                period2_low = self.variables.period("period_low", period2)
                 if None not in (period1_high, period1_low, period2_high, period2_low):
                     period1_high = self.safe_round(period1_high)
                     period1_low = self.safe_round(period1_low)
@@ -270,16 +151,16 @@ class TRCT(Base):
                     high_range = max(period1_high, period2_high)
                     low_range = min(period1_low, period2_low)
                     condition7 = (low_range < self.day_vpoc < high_range)
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL7: Day VPOC ({self.day_vpoc}) within range ({low_range} - {high_range}) --> {condition7}")
+                    logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL7: Day VPOC (%s) within range (%s - %s) --> %s", self.product_name, self.direction, self.day_vpoc, low_range, high_range, condition7)
                 else:
                     condition7 = False
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL7: Insufficient period data for VPOC range check --> {condition7}")
+                    logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL7: Insufficient period data for VPOC range check --> %s", self.product_name, self.direction, condition7)
             else:
                 condition7 = False
-                logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL7: Not enough finished periods for VPOC range check --> {condition7}")
+                logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL7: Not enough finished periods for VPOC range check --> %s", self.product_name, self.direction, condition7)
 
             final_logic = condition1 and acceptance and condition3 and condition4 and condition5 and condition6 and condition7
-            logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | FINAL_LOGIC: {final_logic} | CRITICAL1: {condition1} | CRITICAL2: {acceptance} | CRITICAL3: {condition3} | CRITICAL4: {condition4} | CRITICAL5: {condition5} | CRITICAL6: {condition6} | CRITICAL7: {condition7}")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | FINAL_LOGIC: %s | CRITICAL1: %s | CRITICAL2: %s | CRITICAL3: %s | CRITICAL4: %s | CRITICAL5: %s | CRITICAL6: %s | CRITICAL7: %s", self.product_name, self.direction, final_logic, condition1, acceptance, condition3, condition4, condition5, condition6, condition7)
             
             self.value_following_price = condition7
             self.ib_acceptance_l = acceptance  # For Check Method.
@@ -289,7 +170,7 @@ class TRCT(Base):
         elif self.direction == "short":
             # CRITICAL1: Day low must be below IB_low - 0.5 * IB_range.
             condition1 = self.day_low < self.ib_low - 0.5 * ib_range
-            logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL1: day_low({self.day_low}) < ib_low({self.ib_low}) - 0.5*ib_range --> {condition1}")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL1: day_low(%s) < ib_low(%s) - 0.5*ib_range --> %s", self.product_name, self.direction, self.day_low, self.ib_low, condition1)
 
             # CRITICAL2: Acceptance Outside IB Range.
             acceptance = True
@@ -297,88 +178,58 @@ class TRCT(Base):
             extension_found = False
             for period in finished_periods:
                 # Check for IB extension for short (using LOW)
-                var_name_low = f"{self.product_name}_{period}_LOW"
-                period_low = self.variables.get(var_name_low)
+                period_low = self.variables.period("period_low", period)
                 if period_low is None:
                     continue
                 period_low = self.safe_round(period_low)
                 if not extension_found and period_low < self.ib_low:
                     extension_found = True
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | Found IB extension at period {period} with low({period_low}). Skipping acceptance check for this period.")
+                    logger.debug("TRCT | trend_day | Product: %s | Direction: %s | Found IB extension at period %s with low(%s). Skipping acceptance check for this period.", self.product_name, self.direction, period, period_low)
                     continue
                 if not extension_found:
                     continue  # Only check after IB extension.
-                var_name = f"{self.product_name}_{period}_HIGH"
-                period_high = self.variables.get(var_name)
+                period_high = self.variables.period("period_high", period)
                 if period_high is None:
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | Acceptance: No HIGH data for period {period}. Skipping.")
+                    logger.debug("TRCT | trend_day | Product: %s | Direction: %s | Acceptance: No HIGH data for period %s. Skipping.", self.product_name, self.direction, period)
                     continue
                 period_high = self.safe_round(period_high)
                 if prior_high is not None:
                     if period_high > prior_high and self.ib_low <= period_high <= self.ib_high:
-                        logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL2: Acceptance Failed: period {period} high({period_high}) > prior_high({prior_high}) inside IB.")
+                        logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL2: Acceptance Failed: period %s high(%s) > prior_high(%s) inside IB.", self.product_name, self.direction, period, period_high, prior_high)
                         acceptance = False
                         break
                 if self.ib_low <= period_high <= self.ib_high:
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | Acceptance: Updating prior_high => {period_high}")
+                    logger.debug("TRCT | trend_day | Product: %s | Direction: %s | Acceptance: Updating prior_high => %s", self.product_name, self.direction, period_high)
                     prior_high = period_high
 
             # CRITICAL3: Day_VPOC must be less than IB_low.
             condition3 = self.day_vpoc < self.ib_low
-            logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL3: day_vpoc({self.day_vpoc}) < ib_low({self.ib_low}) --> {condition3}")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL3: day_vpoc(%s) < ib_low(%s) --> %s", self.product_name, self.direction, self.day_vpoc, self.ib_low, condition3)
 
             # CRITICAL4: Prior session must be rotational.
             prior_day_type = self.prior_day()
             condition4 = (prior_day_type in ["Rotational", "Semi-Rotational"])
-            logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL4: prior_day({prior_day_type}) == 'Rotational' or 'Semi-Rotational' --> {condition4}")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL4: prior_day(%s) == 'Rotational' or 'Semi-Rotational' --> %s", self.product_name, self.direction, prior_day_type, condition4)
 
             # CRITICAL5: self.cpl must be less than current session MID.
             current_mid = (self.day_high + self.day_low) / 2
             condition5 = self.cpl < current_mid
-            logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL5: cpl({self.cpl}) < current_mid({round(current_mid, 2)}) --> {condition5}")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL5: cpl(%s) < current_mid(%s) --> %s", self.product_name, self.direction, self.cpl, round(current_mid, 2), condition5)
 
             # CRITICAL6: After IB extension, no subsequent period high can be >= its period ETH VWAP.
-            extension_found = False
-            condition6 = True
-            ib_extension_period = None
-            for period in finished_periods:
-                var_name_low = f"{self.product_name}_{period}_LOW"
-                period_low = self.variables.get(var_name_low)
-                if period_low is None:
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL6: No LOW data for period {period}. Skipping.")
-                    continue
-                period_low = self.safe_round(period_low)
-                if not extension_found and period_low < self.ib_low:
-                    extension_found = True
-                    ib_extension_period = period
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL6: Found IB extension at period {period} with low({period_low}).")
-                    continue
-                if extension_found:
-                    var_name_high = f"{self.product_name}_{period}_HIGH"
-                    period_high = self.variables.get(var_name_high)
-                    if period_high is None:
-                        logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL6: No HIGH data for period {period}. Skipping.")
-                        continue
-                    period_high = self.safe_round(period_high)
-                    vwap_var = f"{self.product_name}_ETH_VWAP_{period}"
-                    period_vwap = self.variables.get(vwap_var)
-                    if period_vwap is None:
-                        logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL6: No VWAP data for period {period}. Skipping.")
-                        continue
-                    period_vwap = self.safe_round(period_vwap)
-                    if period_high >= period_vwap:
-                        logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL6: Failed at period {period}: high({period_high}) >= vwap({period_vwap}).")
-                        condition6 = False
-                        break
+            finished = len(finished_periods)
+            ext_index = self.variables.extension_period(finished, ib_low=self.ib_low)
+            condition6 = ext_index is None or not self.variables.vwap_touched(ext_index + 1, finished, "high")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL6: IB extension index %s, no high >= vwap after it --> %s", self.product_name, self.direction, ext_index, condition6)
 
             # CRITICAL7: RTH VPOC must be within the range of the last finished or current period.
             if len(finished_periods) >= 2:
                 period1 = finished_periods[-2]
                 period2 = finished_periods[-1]
-                period1_high = self.variables.get(f"{self.product_name}_{period1}_HIGH")
-                period1_low = self.variables.get(f"{self.product_name}_{period1}_LOW")
-                period2_high = self.variables.get(f"{self.product_name}_{period2}_HIGH")
-                period2_low = self.variables.get(f"{self.product_name}_{period2}_LOW")
+                period1_high = self.variables.period("period_high", period1)
+                period1_low = self.variables.period("period_low", period1)
+                period2_high = self.variables.period("period_high", period2)
+                period2_low = self.variables.period("period_low", period2)
                 if None not in (period1_high, period1_low, period2_high, period2_low):
                     period1_high = self.safe_round(period1_high)
                     period1_low = self.safe_round(period1_low)
@@ -387,47 +238,90 @@ class TRCT(Base):
                     high_range = max(period1_high, period2_high)
                     low_range = min(period1_low, period2_low)
                     condition7 = (low_range < self.day_vpoc < high_range)
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL7: Day VPOC ({self.day_vpoc}) within range ({low_range} - {high_range}) --> {condition7}")
+                    logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL7: Day VPOC (%s) within range (%s - %s) --> %s", self.product_name, self.direction, self.day_vpoc, low_range, high_range, condition7)
                 else:
                     condition7 = False
-                    logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL7: Insufficient period data for VPOC range check --> {condition7}")
+                    logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL7: Insufficient period data for VPOC range check --> %s", self.product_name, self.direction, condition7)
             else:
                 condition7 = False
-                logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | CRITICAL7: Not enough finished periods for VPOC range check --> {condition7}")
+                logger.debug("TRCT | trend_day | Product: %s | Direction: %s | CRITICAL7: Not enough finished periods for VPOC range check --> %s", self.product_name, self.direction, condition7)
 
             final_logic = condition1 and acceptance and condition3 and condition4 and condition5 and condition6 and condition7
-            logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | FINAL_LOGIC: {final_logic} | CRITICAL1: {condition1} | CRITICAL2: {acceptance} | CRITICAL3: {condition3} | CRITICAL4: {condition4} | CRITICAL5: {condition5} | CRITICAL6: {condition6} | CRITICAL7: {condition7}")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | FINAL_LOGIC: %s | CRITICAL1: %s | CRITICAL2: %s | CRITICAL3: %s | CRITICAL4: %s | CRITICAL5: %s | CRITICAL6: %s | CRITICAL7: %s", self.product_name, self.direction, final_logic, condition1, acceptance, condition3, condition4, condition5, condition6, condition7)
             
             self.ib_acceptance_s = acceptance
             self.value_following_price = condition7
             return final_logic
         else:
-            logger.debug(f"TRCT | trend_day | Product: {self.product_name} | Direction: {self.direction} | FINAL_LOGIC: False | No valid direction detected.")
+            logger.debug("TRCT | trend_day | Product: %s | Direction: %s | FINAL_LOGIC: False | No valid direction detected.", self.product_name, self.direction)
             return False
 
-    # ---------- helper: tick-perfect iterator (replaces old float_range) ----------
-    def float_range(self, start: float, stop: float, step: float):
-        if step <= 0:
-            raise ValueError("step must be positive")
-
-        mult = int(round(1 / step))          
-        start_tick = int(round(start * mult))
-        stop_tick = int(round(stop  * mult))
-
-        direction = 1 if stop_tick >= start_tick else -1
-        for t in range(start_tick, stop_tick + direction, direction):
-            yield t / mult
+    # ---------- helper: TPO ladder on integer ticks ----------
+    def tpo_profile(self, finished_periods, tick_size):
+        # Every price is an integer tick (price * ticks-per-point). Each period's [low, high]
+        # becomes +1/-1 steps in a difference array, so one cumsum gives the TPO count per
+        # tick; the same trick over per-period bit values gives, wherever the count is 1,
+        # exactly the bit of the one period printing there.
+        mult = int(round(1 / tick_size))
+        letters, low_ticks, high_ticks = [], [], []
+        min_price = float('inf')
+        max_price = float('-inf')
+        for period in finished_periods:
+            p_low = self.variables.period("period_low", period)
+            p_high = self.variables.period("period_high", period)
+            if p_low is None or p_high is None:
+                logger.debug("TRCT | single_prints | Product: %s | Period %s missing data (LOW or HIGH). Skipping.", self.product_name, period)
+                continue
+            low_val = float(p_low)
+            high_val = float(p_high)
+            min_price = min(min_price, low_val)
+            max_price = max(max_price, high_val)
+            if period in letters:
+                continue
+            low_tick = int(round(low_val * mult))
+            high_tick = int(round(high_val * mult))
+            letters.append(period)
+            low_ticks.append(min(low_tick, high_tick))
+            high_ticks.append(max(low_tick, high_tick))
+
+        if not letters:
+            return None
+
+        start_tick = int(round(min_price * mult))
+        stop_tick = int(round(max_price * mult))
+        low_ticks = np.array(low_ticks, dtype=np.int64)
+        high_ticks = np.array(high_ticks, dtype=np.int64)
+        base = min(int(low_ticks.min()), start_tick)
+        size = max(int(high_ticks.max()), stop_tick) - base + 2
+        bits = np.left_shift(1, np.arange(len(letters), dtype=np.int64))
+
+        counts = np.zeros(size, dtype=np.int64)
+        owners = np.zeros(size, dtype=np.int64)
+        np.add.at(counts, low_ticks - base, 1)
+        np.add.at(counts, high_ticks - base + 1, -1)
+        np.add.at(owners, low_ticks - base, bits)
+        np.add.at(owners, high_ticks - base + 1, -bits)
+        return {
+            "mult": mult,
+            "letters": letters,
+            "bits": bits,
+            "base": base,
+            "counts": np.cumsum(counts),
+            "owners": np.cumsum(owners),
+            "min_price": min_price,
+            "max_price": max_price,
+            "start_tick": start_tick,
+            "stop_tick": stop_tick,
+        }
 
     def single_prints(self, finished_periods):
-        logger.debug(f"TRCT | single_prints | Product: {self.product_name} | Finished Periods: {finished_periods}")
+        logger.debug("TRCT | single_prints | Product: %s | Finished Periods: %s", self.product_name, finished_periods)
         if len(finished_periods) < 3:
-            logger.debug(f"TRCT | single_prints | Product: {self.product_name} | Not enough periods (need >= 3). Returning False.")
+            logger.debug("TRCT | single_prints | Product: %s | Not enough periods (need >= 3). Returning False.", self.product_name)
             return False
 
-        first_subperiod = finished_periods[0]
-        last_subperiod = finished_periods[-1]
         middle_periods = finished_periods[1:-1]
-        logger.debug(f"TRCT | single_prints | Product: {self.product_name} | Middle Sub-Periods: {middle_periods}")
+        logger.debug("TRCT | single_prints | Product: %s | Middle Sub-Periods: %s", self.product_name, middle_periods)
 
         tick_size_map = {
             "ES": 0.25,
@@ -436,73 +330,52 @@ class TRCT(Base):
             "CL": 0.01
         }
         tick_size = tick_size_map.get(self.product_name, 1.0)
-        logger.debug(f"TRCT | single_prints | Product: {self.product_name} | tick_size = {tick_size}")
+        logger.debug("TRCT | single_prints | Product: %s | tick_size = %s", self.product_name, tick_size)
 
-        price_map = defaultdict(set)
-        min_price = float('inf')
-        max_price = float('-inf')
-
-        # 1) Gather overall min/max and build price->subperiods map
-        for period in finished_periods:
-            p_low = self.variables.get(f"{self.product_name}_{period}_LOW")
-            p_high = self.variables.get(f"{self.product_name}_{period}_HIGH")
-            if p_low is None or p_high is None:
-                logger.debug(f"TRCT | single_prints | Product: {self.product_name} | Period {period} missing data (LOW or HIGH). Skipping.")
-                continue
-            low_val = float(p_low)
-            high_val = float(p_high)
+        # 1) Build the TPO ladder and overall min/max
+        profile = self.tpo_profile(finished_periods, tick_size)
+        if profile is None:
+            logger.debug("TRCT | single_prints | Product: %s | No valid min/max price found. Returning False.", self.product_name)
+            return False
 
-            if low_val < min_price:
-                min_price = low_val
-            if high_val > max_price:
-                max_price = high_val
+        logger.debug("TRCT | single_prints | Product: %s | min_price: %s | max_price=%s", self.product_name, profile["min_price"], profile["max_price"])
 
-            for price in self.float_range(low_val, high_val, tick_size):
-                price_map[price].add(period)
+        mult = profile["mult"]
+        base = profile["base"]
+        counts = profile["counts"]
+        owners = profile["owners"]
+        start_tick = profile["start_tick"]
+        stop_tick = profile["stop_tick"]
 
-        if min_price == float('inf') or max_price == float('-inf'):
-            logger.debug(f"TRCT | single_prints | Product: {self.product_name} | No valid min/max price found. Returning False.")
+        # 2-4) Overlapped region: first and last tick between min and max printed by 2+ periods
+        if start_tick > stop_tick:
+            logger.debug("TRCT | single_prints | Product: %s | No valid overlapped region. Returning False.", self.product_name)
             return False
-
-        logger.debug(f"TRCT | single_prints | Product: {self.product_name} | min_price: {min_price} | max_price={max_price}")
-
-        # 2) Find the lowest_overlapped_price
-        lowest_overlapped_price = None
-        for price in self.float_range(min_price, max_price, tick_size):
-            if len(price_map[price]) >= 2:
-                lowest_overlapped_price = price
-                logger.debug(f"TRCT | single_prints | Product: {self.product_name} | lowest_overlapped_price: {lowest_overlapped_price}")
-                break
-
-        # 3) Find the highest_overlapped_price
-        highest_overlapped_price = None
-        reversed_prices = list(self.float_range(min_price, max_price, tick_size))
-        reversed_prices.reverse()
-        for price in reversed_prices:
-            if len(price_map[price]) >= 2:
-                highest_overlapped_price = price
-                logger.debug(f"TRCT | single_prints | Product: {self.product_name} | highest_overlapped_price: {highest_overlapped_price}")
-                break
-
-        # 4) If no overlapped region
-        if (lowest_overlapped_price is None or
-            highest_overlapped_price is None or
-            lowest_overlapped_price >= highest_overlapped_price):
-            logger.debug(f"TRCT | single_prints | Product: {self.product_name} | No valid overlapped region. Returning False.")
+        overlapped = np.flatnonzero(counts[start_tick - base:stop_tick - base + 1] >= 2)
+        if overlapped.size < 2:
+            logger.debug("TRCT | single_prints | Product: %s | No valid overlapped region. Returning False.", self.product_name)
             return False
+        lowest_tick = start_tick + int(overlapped[0])
+        highest_tick = start_tick + int(overlapped[-1])
+        lowest_overlapped_price = lowest_tick / mult
+        highest_overlapped_price = highest_tick / mult
+
+        logger.debug("TRCT | single_prints | Product: %s | Overlapped region: %s -> %s", self.product_name, lowest_overlapped_price, highest_overlapped_price)
+
+        # 5) Single prints inside the overlapped region that belong to a middle sub-period
+        middle_mask = 0
+        for index, period in enumerate(profile["letters"]):
+            if period in middle_periods:
+                middle_mask |= int(profile["bits"][index])
+        band = slice(lowest_tick - base, highest_tick - base + 1)
+        singles = np.flatnonzero((counts[band] == 1) & ((owners[band] & middle_mask) != 0))
+        if singles.size:
+            price = (lowest_tick + int(singles[0])) / mult
+            unique_period = profile["letters"][int(owners[band][singles[0]]).bit_length() - 1]
+            logger.debug("TRCT | single_prints | Product: %s | Found single print price=%s in sub-period=%s. Returning True.", self.product_name, price, unique_period)
+            return True
 
-        logger.debug(f"TRCT | single_prints | Product: {self.product_name} | Overlapped region: {lowest_overlapped_price} -> {highest_overlapped_price}")
-
-        # 5) Check for a price that belongs to exactly one middle sub-period
-        for price in self.float_range(lowest_overlapped_price, highest_overlapped_price, tick_size):
-            if len(price_map[price]) == 1:
-                # Extract the single sub-period
-                (unique_period,) = price_map[price]
-                if unique_period in middle_periods:
-                    logger.debug(f"TRCT | single_prints | Product: {self.product_name} | Found single print price={price} in sub-period={unique_period}. Returning True.")
-                    return True
-
-        logger.debug(f"TRCT | single_prints | Product: {self.product_name} | No single prints found. Returning False.")
+        logger.debug("TRCT | single_prints | Product: %s | No single prints found. Returning False.", self.product_name)
         return False
 
     def strong_trending(self):
@@ -528,132 +401,80 @@ class TRCT(Base):
                 after the extension sub-period.
             6) Single prints must be present.
         """
-        if self.product_name == "CL":
-            period_times = {
-                'A': time(9, 0), 'B': time(9, 30), 'C': time(10, 0),
-                'D': time(10, 30), 'E': time(11, 0), 'F': time(11, 30),
-                'G': time(12, 0), 'H': time(12, 30), 'I': time(13, 0),
-                'J': time(13, 30), 'K': time(14, 0),
-            }
-        else:
-            period_times = {
-                'A': time(9, 30), 'B': time(10, 0), 'C': time(10, 30),
-                'D': time(11, 0), 'E': time(11, 30), 'F': time(12, 0),
-                'G': time(12, 30), 'H': time(13, 0), 'I': time(13, 30),
-                'J': time(14, 0), 'K': time(14, 30), 'L': time(15, 0),
-                'M': time(15, 30),
-            }
+        # Periods are contiguous from A, so the started ones are a prefix of the product's period table
+        now = clock.now(ZoneInfo('America/New_York')).time()
+        finished_periods = list(product_periods[self.product_name])[:self.variables.started_periods(now)]
+        logger.debug("TRCT | strong_trending | Product: %s | TPO Periods: %s", self.product_name, finished_periods)
 
-        now = datetime.now(ZoneInfo('America/New_York')).time()
-        sorted_periods = sorted(period_times.items(), key=lambda x: x[1])
-        finished_periods = [p for p, t in sorted_periods if t <= now]
-        logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | TPO Periods: {finished_periods}")
-
-        # Determine current period (the period in which 'now' falls)
-        current_period = None
-        for i, (period, start_time) in enumerate(sorted_periods):
-            if i < len(sorted_periods) - 1:
-                next_start = sorted_periods[i + 1][1]
-                if start_time <= now < next_start:
-                    current_period = period
-                    break
-            else:
-                if now >= start_time:
-                    current_period = period
-                    break
+        # The period 'now' falls in is the last one to have started
+        current_period = finished_periods[-1] if finished_periods else None
 
         if not finished_periods:
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | No finished periods. Returning False.")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | No finished periods. Returning False.", self.product_name, self.direction)
             return False
 
         # Decide direction
         if self.direction == "long":
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Checking LONG strong trending criteria...")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Checking LONG strong trending criteria...", self.product_name, self.direction)
 
             # 1) Find IBH extension
-            ext_found = False
-            ext_index = None
-            for i, period in enumerate(finished_periods):
-                p_high = self.variables.get(f"{self.product_name}_{period}_HIGH")
-                if p_high is None:
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Period {period} missing HIGH. Skipping.")
-                    continue
-                if self.safe_round(p_high) > self.ib_high:
-                    ext_found = True
-                    ext_index = i
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Found IBH extension at period {period}, index={i}, p_high={p_high}.")
-                    break
-            if not ext_found:
-                logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | No IBH extension found. Returning False.")
+            ext_index = self.variables.extension_period(len(finished_periods), ib_high=self.ib_high)
+            if ext_index is None:
+                logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | No IBH extension found. Returning False.", self.product_name, self.direction)
                 return False
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Found IBH extension at period %s, index=%s.", self.product_name, self.direction, finished_periods[ext_index], ext_index)
 
             # Trending channel acceptance
             trending_acceptance = True
             outside_low = None
             for i in range(ext_index, len(finished_periods)):
                 period = finished_periods[i]
-                p_low = self.variables.get(f"{self.product_name}_{period}_LOW")
-                p_top1 = self.variables.get(f"{self.product_name}_ETH_TOP_1_{period}")
+                p_low = self.variables.period("period_low", period)
+                p_top1 = self.variables.period("eth_top_1_period", period)
                 if p_low is None or p_top1 is None:
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Missing data (LOW or TOP_1) for period {period}. Skipping.")
+                    logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Missing data (LOW or TOP_1) for period %s. Skipping.", self.product_name, self.direction, period)
                     continue
                 p_low = self.safe_round(p_low)
                 p_top1 = self.safe_round(p_top1)
                 if p_low < p_top1:
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Period {period} outside channel. low({p_low}) < top1({p_top1}).")
+                    logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Period %s outside channel. low(%s) < top1(%s).", self.product_name, self.direction, period, p_low, p_top1)
                     if outside_low is None:
                         outside_low = p_low
-                        logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Setting outside_low={outside_low}.")
+                        logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Setting outside_low=%s.", self.product_name, self.direction, outside_low)
                     else:
                         if p_low < outside_low:
-                            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | New lower outside low={p_low} < old outside_low={outside_low}. Failing.")
+                            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | New lower outside low=%s < old outside_low=%s. Failing.", self.product_name, self.direction, p_low, outside_low)
                             trending_acceptance = False
                             break
 
             # 2) Prior session must be 'Rotational'
             prior_session_type = self.prior_day()
             condition2 = (prior_session_type in ["Rotational", "Semi-Rotational"])
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL2: prior_day({prior_session_type}) == 'Rotational' or 'Semi-Rotational --> {condition2}")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL2: prior_day(%s) == 'Rotational' or 'Semi-Rotational --> %s", self.product_name, self.direction, prior_session_type, condition2)
 
             # 3) No VWAP Touch after IBH extension
-            condition3 = True
-            for i in range(ext_index + 1, len(finished_periods)):
-                period = finished_periods[i]
-                p_low = self.variables.get(f"{self.product_name}_{period}_LOW")
-                if p_low is None:
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Period {period} missing LOW. Skipping.")
-                    continue
-                p_low = self.safe_round(p_low)
-                vwap_var = f"{self.product_name}_ETH_VWAP_{period}"
-                period_vwap = self.variables.get(vwap_var)
-                if period_vwap is None:
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Period {period} missing VWAP. Skipping.")
-                    continue
-                period_vwap = self.safe_round(period_vwap)
-                if p_low <= period_vwap:
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Period {period} low({p_low}) <= vwap({period_vwap}). Failing CRITICAL3.")
-                    condition3 = False
-                    break
+            condition3 = not self.variables.vwap_touched(ext_index + 1, len(finished_periods), "low")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL3: no low <= vwap after extension --> %s", self.product_name, self.direction, condition3)
 
             # 4) cpl > session MID
             session_mid = (self.day_high + self.day_low) / 2
             condition4 = (self.cpl > session_mid)
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL4: cpl({self.cpl}) > session_mid({session_mid}) --> {condition4}")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL4: cpl(%s) > session_mid(%s) --> %s", self.product_name, self.direction, self.cpl, session_mid, condition4)
 
             # 5) One-time framing >= 2 consecutive sub-periods after the extension
             one_time_count = 0
             if ext_index < len(finished_periods) - 1:
                 prev_period = finished_periods[ext_index]
-                prev_high = self.variables.get(f"{self.product_name}_{prev_period}_HIGH")
-                prev_low = self.variables.get(f"{self.product_name}_{prev_period}_LOW")
+                prev_high = self.variables.period("period_high", prev_period)
+                prev_low = self.variables.period("period_low", prev_period)
                 if prev_high is not None and prev_low is not None:
                     prev_high = self.safe_round(prev_high)
                     prev_low = self.safe_round(prev_low)
                     for period in finished_periods[ext_index + 1:]:
-                        cur_high = self.variables.get(f"{self.product_name}_{period}_HIGH")
-                        cur_low = self.variables.get(f"{self.product_name}_{period}_LOW")
+                        cur_high = self.variables.period("period_high", period)
+                        cur_low = self.variables.period("period_low", period)
                         if cur_high is None or cur_low is None:
-                            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Missing data in period {period} for OTF check. Skipping.")
+                            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Missing data in period %s for OTF check. Skipping.", self.product_name, self.direction, period)
                             continue
                         cur_high = self.safe_round(cur_high)
                         cur_low = self.safe_round(cur_low)
@@ -661,27 +482,27 @@ class TRCT(Base):
                             one_time_count += 1
                             prev_high = cur_high
                             prev_low = cur_low
-                            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL5: OTF +1 => {one_time_count} during (period {period}).")
+                            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL5: OTF +1 => %s during (period %s).", self.product_name, self.direction, one_time_count, period)
                         else:
                             if period == current_period:
                                 # Only reset count for the current period if the current low is less than the prior period low.
                                 if cur_low < prev_low:
                                     one_time_count = 0
-                                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL5: In current period {period}, OTF reset to 0 because current low ({cur_low}) < prior low ({prev_low}).")
+                                    logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL5: In current period %s, OTF reset to 0 because current low (%s) < prior low (%s).", self.product_name, self.direction, period, cur_low, prev_low)
                                 else:
-                                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL5: In current period {period}, OTF count maintained because current low ({cur_low}) >= prior low ({prev_low}).")
+                                    logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL5: In current period %s, OTF count maintained because current low (%s) >= prior low (%s).", self.product_name, self.direction, period, cur_low, prev_low)
                             else:
                                 one_time_count = 0
-                                logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL5: OTF reset to 0 during (period {period}).")
+                                logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL5: OTF reset to 0 during (period %s).", self.product_name, self.direction, period)
             condition5 = (one_time_count >= 2)
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL5: one_time_count({one_time_count}) >= 2 --> {condition5}")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL5: one_time_count(%s) >= 2 --> %s", self.product_name, self.direction, one_time_count, condition5)
 
             # 6) Single prints must be present
             condition6 = self.single_prints(finished_periods)
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL6: single_prints --> {condition6}")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL6: single_prints --> %s", self.product_name, self.direction, condition6)
 
             final_logic = trending_acceptance and condition2 and condition3 and condition4 and condition5 and condition6
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | FINAL_LOGIC: {final_logic} | CRITICAL1: {trending_acceptance} | CRITICAL2: {condition2} | CRITICAL3: {condition3} | CRITICAL4: {condition4} | CRITICAL5: {condition5} | CRITICAL6: {condition6}")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | FINAL_LOGIC: %s | CRITICAL1: %s | CRITICAL2: %s | CRITICAL3: %s | CRITICAL4: %s | CRITICAL5: %s | CRITICAL6: %s", self.product_name, self.direction, final_logic, trending_acceptance, condition2, condition3, condition4, condition5, condition6)
             
             # Make Accessible to Check Method.
             self.trending_acceptance_l = trending_acceptance
@@ -692,90 +513,64 @@ class TRCT(Base):
             return final_logic
 
         elif self.direction == "short":
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Checking SHORT strong trending criteria...")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Checking SHORT strong trending criteria...", self.product_name, self.direction)
             # 1) Find IBL extension
-            ext_found = False
-            ext_index = None
-            for i, period in enumerate(finished_periods):
-                p_low = self.variables.get(f"{self.product_name}_{period}_LOW")
-                if p_low is None:
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Period {period} missing LOW. Skipping.")
-                    continue
-                if self.safe_round(p_low) < self.ib_low:
-                    ext_found = True
-                    ext_index = i
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Found IBL extension at period {period}, index={i}, p_low={p_low}.")
-                    break
-            if not ext_found:
-                logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | No IBL extension found. Returning False.")
+            ext_index = self.variables.extension_period(len(finished_periods), ib_low=self.ib_low)
+            if ext_index is None:
+                logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | No IBL extension found. Returning False.", self.product_name, self.direction)
                 return False
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Found IBL extension at period %s, index=%s.", self.product_name, self.direction, finished_periods[ext_index], ext_index)
 
             trending_acceptance = True
             outside_high = None
             for i in range(ext_index, len(finished_periods)):
                 period = finished_periods[i]
-                p_high = self.variables.get(f"{self.product_name}_{period}_HIGH")
-                p_bottom1 = self.variables.get(f"{self.product_name}_ETH_BOTTOM_1_{period}")
+                p_high = self.variables.period("period_high", period)
+                p_bottom1 = self.variables.period("eth_bottom_1_period", period)
                 if p_high is None or p_bottom1 is None:
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Missing data (HIGH or BOTTOM_1) for period {period}. Skipping.")
+                    logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Missing data (HIGH or BOTTOM_1) for period %s. Skipping.", self.product_name, self.direction, period)
                     continue
                 p_high = self.safe_round(p_high)
                 p_bottom1 = self.safe_round(p_bottom1)
                 if p_high > p_bottom1:
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Period {period} outside channel. high({p_high}) > bottom1({p_bottom1}).")
+                    logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Period %s outside channel. high(%s) > bottom1(%s).", self.product_name, self.direction, period, p_high, p_bottom1)
                     if outside_high is None:
                         outside_high = p_high
-                        logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Setting outside_high={outside_high}.")
+                        logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Setting outside_high=%s.", self.product_name, self.direction, outside_high)
                     else:
                         if p_high > outside_high:
-                            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | New higher outside high={p_high} > old outside_high={outside_high}. Failing.")
+                            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | New higher outside high=%s > old outside_high=%s. Failing.", self.product_name, self.direction, p_high, outside_high)
                             trending_acceptance = False
                             break
 
             # 2) Prior session must be 'Rotational'
             prior_session_type = self.prior_day()
             condition2 = (prior_session_type in ["Rotational", "Semi-Rotational"])
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL2: prior_day({prior_session_type}) == 'Rotational' or 'Semi-Rotational --> {condition2}")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL2: prior_day(%s) == 'Rotational' or 'Semi-Rotational --> %s", self.product_name, self.direction, prior_session_type, condition2)
 
             # 3) No VWAP Touch after IBL extension
-            condition3 = True
-            for i in range(ext_index + 1, len(finished_periods)):
-                period = finished_periods[i]
-                p_high = self.variables.get(f"{self.product_name}_{period}_HIGH")
-                if p_high is None:
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Period {period} missing HIGH. Skipping.")
-                    continue
-                p_high = self.safe_round(p_high)
-                vwap_var = f"{self.product_name}_ETH_VWAP_{period}"
-                period_vwap = self.variables.get(vwap_var)
-                if period_vwap is None:
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Period {period} missing VWAP. Skipping.")
-                    continue
-                period_vwap = self.safe_round(period_vwap, 2)
-                if p_high >= period_vwap:
-                    logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Period {period} high({p_high}) >= vwap({period_vwap}). Failing condition3.")
-                    condition3 = False
-                    break
+            condition3 = not self.variables.vwap_touched(ext_index + 1, len(finished_periods), "high")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL3: no high >= vwap after extension --> %s", self.product_name, self.direction, condition3)
 
             # 4) cpl < session MID
             session_mid = (self.day_high + self.day_low) / 2
             condition4 = (self.cpl < session_mid)
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL4: cpl({self.cpl}) < session_mid({session_mid}) --> {condition4}")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL4: cpl(%s) < session_mid(%s) --> %s", self.product_name, self.direction, self.cpl, session_mid, condition4)
 
             # 5) One-time framing >= 2 consecutive sub-periods after the extension
             one_time_count = 0
             if ext_index < len(finished_periods) - 1:
                 prev_period = finished_periods[ext_index]
-                prev_high = self.variables.get(f"{self.product_name}_{prev_period}_HIGH")
-                prev_low = self.variables.get(f"{self.product_name}_{prev_period}_LOW")
+                prev_high = self.variables.period("period_high", prev_period)
+                prev_low = self.variables.period("period_low", prev_period)
                 if prev_high is not None and prev_low is not None:
                     prev_high = self.safe_round(prev_high)
                     prev_low = self.safe_round(prev_low)
                     for period in finished_periods[ext_index + 1:]:
-                        cur_high = self.variables.get(f"{self.product_name}_{period}_HIGH")
-                        cur_low = self.variables.get(f"{self.product_name}_{period}_LOW")
+                        cur_high = self.variables.period("period_high", period)
+                        cur_low = self.variables.period("period_low", period)
                         if cur_high is None or cur_low is None:
-                            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Missing data in period {period} for OTF check. Skipping.")
+                            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Missing data in period %s for OTF check. Skipping.", self.product_name, self.direction, period)
                             continue
                         cur_high = self.safe_round(cur_high)
                         cur_low = self.safe_round(cur_low)
@@ -783,19 +578,19 @@ class TRCT(Base):
                             one_time_count += 1
                             prev_high = cur_high
                             prev_low = cur_low
-                            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL5: OTF +1 => {one_time_count} (period {period}).")
+                            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL5: OTF +1 => %s (period %s).", self.product_name, self.direction, one_time_count, period)
                         else:
                             one_time_count = 0
-                            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL5: OTF reset to 0 (period {period}).")
+                            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL5: OTF reset to 0 (period %s).", self.product_name, self.direction, period)
             condition5 = (one_time_count >= 2)
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL5: one_time_count({one_time_count}) >= 2 --> {condition5}")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL5: one_time_count(%s) >= 2 --> %s", self.product_name, self.direction, one_time_count, condition5)
 
             # 6) Single prints must be present
             condition6 = self.single_prints(finished_periods)
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | CRITICAL6: single_prints --> {condition6}")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | CRITICAL6: single_prints --> %s", self.product_name, self.direction, condition6)
 
             final_logic = trending_acceptance and condition2 and condition3 and condition4 and condition5 and condition6
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | FINAL_LOGIC: {final_logic} | CRITICAL1: {trending_acceptance} | CRITICAL2: {condition2} | CRITICAL3: {condition3} | CRITICAL4: {condition4} | CRITICAL5: {condition5} | CRITICAL6: {condition6}")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | FINAL_LOGIC: %s | CRITICAL1: %s | CRITICAL2: %s | CRITICAL3: %s | CRITICAL4: %s | CRITICAL5: %s | CRITICAL6: %s", self.product_name, self.direction, final_logic, trending_acceptance, condition2, condition3, condition4, condition5, condition6)
             
             self.trending_acceptance_s = trending_acceptance
             self.prior_session_rotational = condition2
@@ -805,49 +600,47 @@ class TRCT(Base):
             return final_logic
 
         else:
-            logger.debug(f"TRCT | strong_trending | Product: {self.product_name} | Direction: {self.direction} | Invalid direction ({self.direction}). Returning False.")
+            logger.debug("TRCT | strong_trending | Product: %s | Direction: %s | Invalid direction (%s). Returning False.", self.product_name, self.direction, self.direction)
             return False
 
 
     def input(self):
-        def log_condition(condition, description):
-            logger.debug(f"TRCT | input | Product: {self.product_name} | Direction: {self.direction} | {description} --> {condition}")
-            return condition
+        log_condition = decision_trace.start("TRCT", self.product_name, self.direction)
 
         trend_day_result = log_condition(self.trend_day(), "Trend Day Conditions")
         strong_trending_result = log_condition(self.strong_trending(), "Strong Trending Conditions")
         
         logic = trend_day_result or strong_trending_result
 
-        logger.debug(f"TRCT | input | Product: {self.product_name} | FINAL_LOGIC: {logic} | Trend Day: {trend_day_result} | Strong Trending: {strong_trending_result}")
+        logger.debug("TRCT | input | Product: %s | FINAL_LOGIC: %s | Trend Day: %s | Strong Trending: %s", self.product_name, logic, trend_day_result, strong_trending_result)
         return logic
 
 # ---------------------------------- Opportunity Window ------------------------------------ #   
     def time_window(self):
         
         # Update current time
-        self.current_datetime = datetime.now(self.est)
+        self.current_datetime = clock.now(self.est)
         self.current_time = self.current_datetime.time()
         
         # Define time windows based on product type
         if self.product_name == 'CL':
             start_time = self.crude_ib
             end_time = self.crude_close
-            logger.debug(f" TRCT | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug(" TRCT | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         elif self.product_name in ['ES', 'RTY', 'NQ']:
             start_time = self.equity_ib
             end_time = self.equity_close
-            logger.debug(f" TRCT | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug(" TRCT | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         else:
             logger.warning(f" TRCT | time_window | Product: {self.product_name} | No time window defined.")
             return False  
         
         # Check if current time is within the window
         if start_time <= self.current_time <= end_time:
-            logger.debug(f" TRCT | time_window | Product: {self.product_name} | Within Window: {self.current_time}.")
+            logger.debug(" TRCT | time_window | Product: %s | Within Window: %s.", self.product_name, self.current_time)
             return True
         else:
-            logger.debug(f" TRCT | time_window | Product: {self.product_name} | Outside Window {self.current_time}.")
+            logger.debug(" TRCT | time_window | Product: %s | Outside Window %s.", self.product_name, self.current_time)
             return False
 # ---------------------------------- Calculate Criteria ------------------------------------ #      
     def check(self):
@@ -855,15 +648,15 @@ class TRCT(Base):
         # Define Direction with Detailed Logging
         if self.day_low < self.ib_low:
             self.direction = "short"
-            logger.debug(f" TRCT | check | Product: {self.product_name} | DIR_LOGIC: self.day_low({self.day_low}) < self.ib_low({self.ib_low}) -> short")
+            logger.debug(" TRCT | check | Product: %s | DIR_LOGIC: self.day_low(%s) < self.ib_low(%s) -> short", self.product_name, self.day_low, self.ib_low)
         elif self.day_high > self.ib_high:
             self.direction = "long"
-            logger.debug(f" TRCT | check | Product: {self.product_name} | DIR_LOGIC: self.day_high({self.day_high}) > self.ib_high({self.ib_high}) -> long")
+            logger.debug(" TRCT | check | Product: %s | DIR_LOGIC: self.day_high(%s) > self.ib_high(%s) -> long", self.product_name, self.day_high, self.ib_high)
         elif self.day_high > self.ib_high and self.day_low < self.ib_low:
-            logger.debug(f" TRCT | check | Product: {self.product_name} | Note: Neutral Behavior Detected, Returning")
+            logger.debug(" TRCT | check | Product: %s | Note: Neutral Behavior Detected, Returning", self.product_name)
             return
         else:
-            logger.debug(f" TRCT | check | Product: {self.product_name} | Note: No IB Extension Detected, Returning")
+            logger.debug(" TRCT | check | Product: %s | Note: No IB Extension Detected, Returning", self.product_name)
             return
 
         self.color = "red" if self.direction == "short" else "green"
@@ -872,136 +665,136 @@ class TRCT(Base):
         if self.time_window() and self.input():
             with last_alerts_lock:
                 last_alert = last_alerts.get(self.product_name)
-                logger.debug(f" TRCT | check | Product: {self.product_name} | Current Alert: {self.direction} | Last Alert: {last_alert}")
+                logger.debug(" TRCT | check | Product: %s | Current Alert: %s | Last Alert: %s", self.product_name, self.direction, last_alert)
                 if self.direction != last_alert:
                     logger.info(f" TRCT | check | Product: {self.product_name} | Note: Condition Met")
                     
                     # Logic For Trend Day
                     if self.trend_day():
                         self.c_trend_day = "x"
-                        logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_1: trend_day() True -> [{self.c_trend_day}]")
+                        logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_1: trend_day() True -> [%s]", self.product_name, self.direction, self.c_trend_day)
                     else:
                         self.c_trend_day = "  "
-                        logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_1: trend_day() False -> [{self.c_trend_day}]")
+                        logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_1: trend_day() False -> [%s]", self.product_name, self.direction, self.c_trend_day)
                     
                     # Logic For Strong Trending
                     if self.strong_trending():
                         self.c_strong_trending = "x"
-                        logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_2: strong_trending() True -> [{self.c_strong_trending}]")
+                        logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_2: strong_trending() True -> [%s]", self.product_name, self.direction, self.c_strong_trending)
                     else:
                         self.c_strong_trending = "  "
-                        logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_2: strong_trending() False -> [{self.c_strong_trending}]")
+                        logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_2: strong_trending() False -> [%s]", self.product_name, self.direction, self.c_strong_trending)
                     
                     # Logic For Acceptance Inside Trending Channel
                     if self.direction == "short":
                         if self.trending_acceptance_s:
                             self.c_trending_acceptance = "x"
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: trending_acceptance_s True -> [{self.c_trending_acceptance}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_3: trending_acceptance_s True -> [%s]", self.product_name, self.direction, self.c_trending_acceptance)
                         else:
                             self.c_trending_acceptance = "  "
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: trending_acceptance_s False -> [{self.c_trending_acceptance}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_3: trending_acceptance_s False -> [%s]", self.product_name, self.direction, self.c_trending_acceptance)
                     elif self.direction == "long":
                         if self.trending_acceptance_l:
                             self.c_trending_acceptance = "x"
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: trending_acceptance_l True -> [{self.c_trending_acceptance}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_3: trending_acceptance_l True -> [%s]", self.product_name, self.direction, self.c_trending_acceptance)
                         else:
                             self.c_trending_acceptance = "  "
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: trending_acceptance_l False -> [{self.c_trending_acceptance}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_3: trending_acceptance_l False -> [%s]", self.product_name, self.direction, self.c_trending_acceptance)
                     
                     # Logic For VWAP Strength
                     if self.direction == "short":
                         if self.vwap_slope < -0.08:
                             self.c_strong_vwap = "x"
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: self.vwap_slope({self.vwap_slope}) < -0.05 -> [{self.c_strong_vwap}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_4: self.vwap_slope(%s) < -0.05 -> [%s]", self.product_name, self.direction, self.vwap_slope, self.c_strong_vwap)
                         else:
                             self.c_strong_vwap = "  "
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: self.vwap_slope({self.vwap_slope}) >= -0.05 -> [{self.c_strong_vwap}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_4: self.vwap_slope(%s) >= -0.05 -> [%s]", self.product_name, self.direction, self.vwap_slope, self.c_strong_vwap)
                     elif self.direction == "long":
                         if self.vwap_slope > 0.08:
                             self.c_strong_vwap = "x"
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: self.vwap_slope({self.vwap_slope}) > 0.05 -> [{self.c_strong_vwap}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_4: self.vwap_slope(%s) > 0.05 -> [%s]", self.product_name, self.direction, self.vwap_slope, self.c_strong_vwap)
                         else:
                             self.c_strong_vwap = "  "
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: self.vwap_slope({self.vwap_slope}) <= 0.05 -> [{self.c_strong_vwap}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_4: self.vwap_slope(%s) <= 0.05 -> [%s]", self.product_name, self.direction, self.vwap_slope, self.c_strong_vwap)
                     
                     # Logic For One-Time-Framing
                     if self.direction == "short":
                         if self.one_time_framing_s:
                             self.c_otf = "x"
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: one_time_framing_s True -> [{self.c_otf}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_5: one_time_framing_s True -> [%s]", self.product_name, self.direction, self.c_otf)
                         else:
                             self.c_otf = "  "
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: one_time_framing_s False -> [{self.c_otf}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_5: one_time_framing_s False -> [%s]", self.product_name, self.direction, self.c_otf)
                     elif self.direction == "long":
                         if self.one_time_framing_l:
                             self.c_otf = "x"
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: one_time_framing_l True -> [{self.c_otf}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_5: one_time_framing_l True -> [%s]", self.product_name, self.direction, self.c_otf)
                         else:
                             self.c_otf = "  "
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: one_time_framing_l False -> [{self.c_otf}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_5: one_time_framing_l False -> [%s]", self.product_name, self.direction, self.c_otf)
                     
                     # Logic For Acceptance Outside of IB Range
                     if self.direction == "short":
                         if self.ib_acceptance_s:
                             self.c_iba = "x"
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6: ib_acceptance_s True -> [{self.c_iba}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_6: ib_acceptance_s True -> [%s]", self.product_name, self.direction, self.c_iba)
                         else:
                             self.c_iba = "  "
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6: ib_acceptance_s False -> [{self.c_iba}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_6: ib_acceptance_s False -> [%s]", self.product_name, self.direction, self.c_iba)
                     elif self.direction == "long":
                         if self.ib_acceptance_l:
                             self.c_iba = "x"
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6: ib_acceptance_l True -> [{self.c_iba}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_6: ib_acceptance_l True -> [%s]", self.product_name, self.direction, self.c_iba)
                         else:
                             self.c_iba = "  "
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_6: ib_acceptance_l False -> [{self.c_iba}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_6: ib_acceptance_l False -> [%s]", self.product_name, self.direction, self.c_iba)
                     
                     # Logic For Within 1 EXP Move of 5D
                     if self.cpl < (self.fd_vpoc + self.exp_rng) and self.cpl > (self.fd_vpoc - self.exp_rng):
                         self.c_fd_exp = "x"
-                        logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_7: self.cpl({self.cpl}) within 1 EXP move of fd_vpoc({self.fd_vpoc}) ± exp_rng({self.exp_rng}) -> [{self.c_fd_exp}]")
+                        logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_7: self.cpl(%s) within 1 EXP move of fd_vpoc(%s) ± exp_rng(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.fd_vpoc, self.exp_rng, self.c_fd_exp)
                     else:
                         self.c_fd_exp = "  "
-                        logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_7: self.cpl({self.cpl}) outside 1 EXP move of fd_vpoc({self.fd_vpoc}) ± exp_rng({self.exp_rng}) -> [{self.c_fd_exp}]")
+                        logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_7: self.cpl(%s) outside 1 EXP move of fd_vpoc(%s) ± exp_rng(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.fd_vpoc, self.exp_rng, self.c_fd_exp)
                     
                     # Logic For Value Following Price
                     if self.value_following_price:
                         self.c_v_fp = "x"
-                        logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_8: value_following_price True -> [{self.c_v_fp}]")
+                        logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_8: value_following_price True -> [%s]", self.product_name, self.direction, self.c_v_fp)
                     else:
                         self.c_v_fp = "  "
-                        logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_8: value_following_price False -> [{self.c_v_fp}]")
+                        logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_8: value_following_price False -> [%s]", self.product_name, self.direction, self.c_v_fp)
                     
                     # Logic For Above / Below RTH MID
                     if self.direction == "short":
                         if self.session_mid_s:
                             self.c_sm = "x"
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_9: session_mid_s True -> [{self.c_sm}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_9: session_mid_s True -> [%s]", self.product_name, self.direction, self.c_sm)
                         else:
                             self.c_sm = "  "
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_9: session_mid_s False -> [{self.c_sm}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_9: session_mid_s False -> [%s]", self.product_name, self.direction, self.c_sm)
                     elif self.direction == "long":
                         if self.session_mid_l:
                             self.c_sm = "x"
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_9: session_mid_l True -> [{self.c_sm}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_9: session_mid_l True -> [%s]", self.product_name, self.direction, self.c_sm)
                         else:
                             self.c_sm = "  "
-                            logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_9: session_mid_l False -> [{self.c_sm}]")
+                            logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_9: session_mid_l False -> [%s]", self.product_name, self.direction, self.c_sm)
                     
                     # Logic For Prior Day Was Rotational
                     if self.prior_day() in ["Rotational", "Semi-Rotational"]:
                         self.c_rotational = "x"
-                        logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_10: prior_day() returned Rotational or Semi-Rotational -> [{self.c_rotational}]")
+                        logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_10: prior_day() returned Rotational or Semi-Rotational -> [%s]", self.product_name, self.direction, self.c_rotational)
                     else:
                         self.c_rotational = "  "
-                        logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_10: prior_day() did not return Rotational or Semi-Rotational -> [{self.c_rotational}]")
+                        logger.debug(" TRCT | check | Product: %s | Direction: %s | CRITERIA_10: prior_day() did not return Rotational or Semi-Rotational -> [%s]", self.product_name, self.direction, self.c_rotational)
                     
                     # Score Calculation Logging
                     self.score = sum(1 for condition in [
                         self.c_rotational, self.c_sm, self.c_v_fp, self.c_fd_exp, self.c_iba,
                         self.c_otf, self.c_strong_vwap, self.c_trending_acceptance, self.c_strong_trending, self.c_trend_day
                     ] if condition == "x")
-                    logger.debug(f" TRCT | check | Product: {self.product_name} | Direction: {self.direction} | SCORE: {self.score}/10")
+                    logger.debug(" TRCT | check | Product: %s | Direction: %s | SCORE: %s/10", self.product_name, self.direction, self.score)
                     
                     try:
                         last_alerts[self.product_name] = self.direction
@@ -1009,9 +802,9 @@ class TRCT(Base):
                     except Exception as e:
                         logger.error(f" TRCT | check | Product: {self.product_name} | Note: Failed to send Slack alert: {e}")
                 else:
-                    logger.debug(f" TRCT | check | Product: {self.product_name} | Note: Alert: {self.direction} Is Same")
+                    logger.debug(" TRCT | check | Product: %s | Note: Alert: %s Is Same", self.product_name, self.direction)
         else:
-            logger.debug(f" TRCT | check | Product: {self.product_name} | Note: Condition(s) Not Met")
+            logger.debug(" TRCT | check | Product: %s | Note: Condition(s) Not Met", self.product_name)
 
 # ---------------------------------- Alert Preparation------------------------------------ #  
     def discord_message(self):
@@ -1082,6 +875,6 @@ class TRCT(Base):
         return embed 
     
     def execute(self):
-        embed = self.discord_message()
+        embed = self.build_embed()
         self.send_playbook_embed(embed, username=None, avatar_url=None)
         logger.info(f"TRCT | execute | Product: {self.product_name} | Note: Alert Sent To Playbook Webhook")
\ No newline at end of file
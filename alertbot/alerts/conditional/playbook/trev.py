@@ -1,46 +1,43 @@
 import logging
-import math
 import threading
 from datetime import datetime
 from alertbot.utils import config
+from alertbot.utils import clock
 from discord_webhook import DiscordEmbed
 from alertbot.alerts.base import Base
+from alertbot.utils.trace import decision_trace
 logger = logging.getLogger(__name__)
 
 last_alerts = {}
 last_alerts_lock = threading.Lock()
 
 class TREV(Base):
-    def __init__(self, product_name, variables):    
-        super().__init__(product_name=product_name, variables=variables)
+    def __init__(self, product_name, variables, context=None):    
+        super().__init__(product_name=product_name, variables=variables, context=context)
         
         # Variables (Round All Variables)
-        self.prior_vpoc = self.safe_round(variables.get(f'{self.product_name}_PRIOR_VPOC'))
-        self.day_open = self.safe_round(variables.get(f'{self.product_name}_DAY_OPEN'))
-        self.p_high = self.safe_round(variables.get(f'{self.product_name}_PRIOR_HIGH'))
-        self.p_low = self.safe_round(variables.get(f'{self.product_name}_PRIOR_LOW'))
-        self.prior_high = self.safe_round(variables.get(f'{self.product_name}_PRIOR_HIGH'))
-        self.prior_low = self.safe_round(variables.get(f'{self.product_name}_PRIOR_LOW'))
-        self.prior_prior_high = self.safe_round(variables.get(f'{self.product_name}_PRIOR_PRIOR_HIGH'))
-        self.prior_prior_low = self.safe_round(variables.get(f'{self.product_name}_PRIOR_PRIOR_LOW'))                
-        self.ib_atr = self.safe_round(variables.get(f'{self.product_name}_IB_ATR'))
-        self.eth_vwap = variables.get(f'{self.product_name}_ETH_VWAP')
-        self.cpl = self.safe_round(variables.get(f'{self.product_name}_CPL'))
-        self.total_ovn_delta = self.safe_round(variables.get(f'{self.product_name}_TOTAL_OVN_DELTA'))
-        self.total_rth_delta = self.safe_round(variables.get(f'{self.product_name}_TOTAL_RTH_DELTA'))
-        self.prior_close = self.safe_round(variables.get(f'{self.product_name}_PRIOR_CLOSE'))
-        self.ib_high = self.safe_round(variables.get(f'{product_name}_IB_HIGH'))
-        self.ib_low = self.safe_round(variables.get(f'{product_name}_IB_LOW'))
-        self.fd_vpoc = self.safe_round(variables.get(f'{product_name}_5D_VPOC'))
-        self.td_vpoc = self.safe_round(variables.get(f'{product_name}_20D_VPOC'))        
+        self.prior_vpoc = self.safe_round(variables.prior_vpoc)
+        self.day_open = self.safe_round(variables.day_open)
+        self.p_high = self.safe_round(variables.prior_high)
+        self.p_low = self.safe_round(variables.prior_low)
+        self.prior_high = self.safe_round(variables.prior_high)
+        self.prior_low = self.safe_round(variables.prior_low)
+        self.prior_prior_high = self.safe_round(variables.prior_prior_high)
+        self.prior_prior_low = self.safe_round(variables.prior_prior_low)                
+        self.ib_atr = self.safe_round(variables.ib_atr)
+        self.eth_vwap = variables.eth_vwap
+        self.cpl = self.safe_round(variables.cpl)
+        self.total_ovn_delta = self.safe_round(variables.total_ovn_delta)
+        self.total_rth_delta = self.safe_round(variables.total_rth_delta)
+        self.prior_close = self.safe_round(variables.prior_close)
+        self.ib_high = self.safe_round(variables.ib_high)
+        self.ib_low = self.safe_round(variables.ib_low)
+        self.fd_vpoc = self.safe_round(variables.vpoc_5d)
+        self.td_vpoc = self.safe_round(variables.vpoc_20d)        
         
-        self.es_impvol = config.es_impvol
-        self.nq_impvol = config.nq_impvol
-        self.rty_impvol = config.rty_impvol
-        self.cl_impvol = config.cl_impvol 
         
-        self.delta = self.total_delta()
-        self.exp_rng = self.exp_range() 
+        self.delta = self.context.total_delta()
+        self.exp_rng = self.context.exp_range()[0] 
         self.gap_tier, self.gap, self.gap_size = self.gap_info()
         
     def safe_round(self, value, digits=2):
@@ -54,22 +51,6 @@ class TREV(Base):
             return 0        
 
 # ---------------------------------- Specific Calculations ------------------------------------ #   
-    def exp_range(self):
-        if not self.prior_close:
-            logger.error(f" TREV | exp_range | Product: {self.product_name} | Note: No Close Found")
-            raise ValueError(f" TREV | exp_range | Product: {self.product_name} | Note: Need Close For Calculation!")
-        impvol = {
-            'ES': self.es_impvol,
-            'NQ': self.nq_impvol,
-            'RTY': self.rty_impvol,
-            'CL': self.cl_impvol
-        }.get(self.product_name)
-        if impvol is None:
-            raise ValueError(f" TREV | exp_range | Product: {self.product_name} | Note: Unknown Product")
-        exp_range = self.safe_round(((self.prior_close * (impvol / 100)) * math.sqrt(1/252)))
-        logger.debug(f" TREV | exp_range | Product: {self.product_name} | EXP_RNG: {exp_range}")
-        return exp_range
-    
     def gap_info(self):
         gap = ""
         gap_tier = ""
@@ -104,14 +85,9 @@ class TREV(Base):
             gap = "No Gap"
             gap_tier = "Tier_0"
             gap_size = 0
-        logger.debug(f" TREV | gap_info | Product: {self.product_name} | GAP: {gap} | GAP_TIER: {gap_tier} | GAP_SIZE: {gap_size}")
+        logger.debug(" TREV | gap_info | Product: %s | GAP: %s | GAP_TIER: %s | GAP_SIZE: %s", self.product_name, gap, gap_tier, gap_size)
         return gap_tier, gap, gap_size
         
-    def total_delta(self):
-        total_delta = self.total_ovn_delta + self.total_rth_delta
-        logger.debug(f" TREV | total_delta | Product: {self.product_name} | TOTAL_DELTA: {total_delta}")
-        return total_delta  
-     
     def posture(self):
         threshold = self.safe_round((self.exp_rng * 0.68))
         if (abs(self.cpl - self.fd_vpoc) <= threshold) and (abs(self.fd_vpoc - self.td_vpoc) <= threshold):
@@ -134,86 +110,83 @@ class TREV(Base):
             posture = "PRICEv5D^20D"
         else:
             posture = "Other"
-        logger.debug(f" TREV | posture | Product: {self.product_name} | POSTURE: {posture}")
+        logger.debug(" TREV | posture | Product: %s | POSTURE: %s", self.product_name, posture)
         return posture    
     
 # ---------------------------------- Driving Input Logic ------------------------------------ #   
     def input(self):
-        def log_condition(condition, description):
-            logger.debug(f"TREV | input | Product: {self.product_name} | Direction: {self.direction} | {description} --> {condition}")
-            return condition
+        log_condition = decision_trace.start("TREV", self.product_name, self.direction)
         if self.direction == "short":
             crit1 = log_condition(
                 self.prior_low > self.prior_prior_high - 0.1 * (self.prior_prior_high - self.prior_prior_low),
-                f"CRITICAL1 (short): prior_low({self.prior_low}) > prior_prior_high({self.prior_prior_high}) - 10% overlap of range({self.prior_prior_high - self.prior_prior_low})"
+                "CRITICAL1 (short): prior_low(%s) > prior_prior_high(%s) - 10%% overlap of range(%s)", self.prior_low, self.prior_prior_high, self.prior_prior_high - self.prior_prior_low
             )
             crit2 = log_condition(
                 self.prior_vpoc > self.prior_low + 0.33 * (self.prior_high - self.prior_low),
-                f"CRITICAL2: prior_vpoc({self.prior_vpoc}) > (prior_low({self.prior_low}) + 0.33*(prior_high({self.prior_high}) - prior_low({self.prior_low})))"
+                "CRITICAL2: prior_vpoc(%s) > (prior_low(%s) + 0.33*(prior_high(%s) - prior_low(%s)))", self.prior_vpoc, self.prior_low, self.prior_high, self.prior_low
             )
             crit3 = log_condition(
                 self.cpl < self.eth_vwap,
-                f"CRITICAL3: cpl({self.cpl}) < eth_vwap({self.eth_vwap})"
+                "CRITICAL3: cpl(%s) < eth_vwap(%s)", self.cpl, self.eth_vwap
             )
             crit6 = log_condition(
                 self.day_open > self.prior_high,
-                f"CRITICAL6: self.day_open({self.day_open}) > self.prior_high({self.prior_high})"
+                "CRITICAL6: self.day_open(%s) > self.prior_high(%s)", self.day_open, self.prior_high
             )
         elif self.direction == "long":
             crit1 = log_condition(
                 self.prior_high < self.prior_prior_low + 0.1 * (self.prior_prior_high - self.prior_prior_low),
-                f"CRITICAL1 (long): prior_high({self.prior_high}) < prior_prior_low({self.prior_prior_low}) + 10% overlap of range({self.prior_prior_high - self.prior_prior_low})"
+                "CRITICAL1 (long): prior_high(%s) < prior_prior_low(%s) + 10%% overlap of range(%s)", self.prior_high, self.prior_prior_low, self.prior_prior_high - self.prior_prior_low
             )
             crit2 = log_condition(
                 self.prior_vpoc < self.prior_high - 0.33 * (self.prior_high - self.prior_low),
-                f"CRITICAL2: prior_vpoc({self.prior_vpoc}) < (prior_high({self.prior_high}) - 0.33*(prior_high({self.prior_high}) - prior_low({self.prior_low})))"
+                "CRITICAL2: prior_vpoc(%s) < (prior_high(%s) - 0.33*(prior_high(%s) - prior_low(%s)))", self.prior_vpoc, self.prior_high, self.prior_high, self.prior_low
             )
             crit3 = log_condition(
                 self.cpl > self.eth_vwap,
-                f"CRITICAL3: cpl({self.cpl}) > eth_vwap({self.eth_vwap})"
+                "CRITICAL3: cpl(%s) > eth_vwap(%s)", self.cpl, self.eth_vwap
             )
             crit6 = log_condition(
                 self.day_open < self.prior_low,
-                f"CRITICAL6: self.day_open({self.day_open}) < self.prior_low({self.prior_low})"
+                "CRITICAL6: self.day_open(%s) < self.prior_low(%s)", self.day_open, self.prior_low
             )            
         crit4 = log_condition(
             self.gap_tier == "Tier_1",
-            f"CRITICAL4: gap_tier({self.gap_tier}) == 'Tier_1'")
+            "CRITICAL4: gap_tier(%s) == 'Tier_1'", self.gap_tier)
         crit5 = log_condition(
             self.posture() in ["PRICE^5D^20D", "PRICEv5Dv20D", "PRICEv5D^20D", "PRICE^5Dv20D"],
-            f"CRITICAL5: posture({self.posture()}) in ['PRICE^5D^20D', 'PRICEv5Dv20D', 'PRICEv5D^20D', 'PRICE^5Dv20D']"
+            "CRITICAL5: posture(%s) in ['PRICE^5D^20D', 'PRICEv5Dv20D', 'PRICEv5D^20D', 'PRICE^5Dv20D']", self.posture()
         )
         logic = crit1 and crit2 and crit3 and crit4 and crit5 and crit6
-        logger.debug(f"TREV | input | Product: {self.product_name} | Direction: {self.direction} | FINAL_LOGIC: {logic} | "
-                    f"CRITICAL1: {crit1} | CRITICAL2: {crit2} | CRITICAL3: {crit3} | CRITICAL4: {crit4} | CRITICAL5: {crit5} | CRITICAL6: {crit6}")
+        logger.debug("TREV | input | Product: %s | Direction: %s | FINAL_LOGIC: %s | CRITICAL1: %s | CRITICAL2: %s | CRITICAL3: %s | CRITICAL4: %s | CRITICAL5: %s | CRITICAL6: %s", self.product_name, self.direction, logic, crit1, crit2, crit3, crit4, crit5, crit6)
         return logic
     
 # ---------------------------------- Opportunity Window ------------------------------------ #   
     def time_window(self):
         
         # Update current time
-        self.current_datetime = datetime.now(self.est)
+        self.current_datetime = clock.now(self.est)
         self.current_time = self.current_datetime.time()
         
         # Define time windows based on product type
         if self.product_name == 'CL':
             start_time = self.crude_open
             end_time = self.crude_ib
-            logger.debug(f" TREV | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug(" TREV | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         elif self.product_name in ['ES', 'RTY', 'NQ']:
             start_time = self.equity_open
             end_time = self.equity_ib
-            logger.debug(f" TREV | time_window | Product: {self.product_name} | Time Window: {start_time} - {end_time}")
+            logger.debug(" TREV | time_window | Product: %s | Time Window: %s - %s", self.product_name, start_time, end_time)
         else:
             logger.warning(f" TREV | time_window | Product: {self.product_name} | No time window defined.")
             return False  
         
         # Check if current time is within the window
         if start_time <= self.current_time <= end_time:
-            logger.debug(f" TREV | time_window | Product: {self.product_name} | Within Window: {self.current_time}.")
+            logger.debug(" TREV | time_window | Product: %s | Within Window: %s.", self.product_name, self.current_time)
             return True
         else:
-            logger.debug(f" TREV | time_window | Product: {self.product_name} | Outside Window {self.current_time}.")
+            logger.debug(" TREV | time_window | Product: %s | Outside Window %s.", self.product_name, self.current_time)
             return False
 # ---------------------------------- Calculate Criteria ------------------------------------ #      
     def check(self):
@@ -221,54 +194,54 @@ class TREV(Base):
         # Determine Direction Based on Open vs. Prior High/Low with Logging
         if self.day_open > self.prior_high:
             self.direction = "short"
-            logger.debug(f" TREV | check | Product: {self.product_name} | DIR_LOGIC: self.day_open({self.day_open}) > self.prior_high({self.prior_high}) -> short")
+            logger.debug(" TREV | check | Product: %s | DIR_LOGIC: self.day_open(%s) > self.prior_high(%s) -> short", self.product_name, self.day_open, self.prior_high)
         elif self.day_open < self.prior_low:
             self.direction = "long"
-            logger.debug(f" TREV | check | Product: {self.product_name} | DIR_LOGIC: self.day_open({self.day_open}) < self.prior_low({self.prior_low}) -> long")
+            logger.debug(" TREV | check | Product: %s | DIR_LOGIC: self.day_open(%s) < self.prior_low(%s) -> long", self.product_name, self.day_open, self.prior_low)
         else:
-            logger.debug(f" TREV | check | Product: {self.product_name} | Note: Open In Range; Not In Play, Returning.")
+            logger.debug(" TREV | check | Product: %s | Note: Open In Range; Not In Play, Returning.", self.product_name)
             return  # Open In Range, So Not In Play
 
         # Driving Input Check with Logging
         if self.time_window() and self.input():
             with last_alerts_lock:
                 last_alert = last_alerts.get(self.product_name)
-                logger.debug(f" TREV | check | Product: {self.product_name} | Current Alert: {self.direction} | Last Alert: {last_alert}")
+                logger.debug(" TREV | check | Product: %s | Current Alert: %s | Last Alert: %s", self.product_name, self.direction, last_alert)
                 if self.direction != last_alert:
                     logger.info(f" TREV | check | Product: {self.product_name} | Note: Condition Met")
                     
                     # Critical Criteria Logging
                     self.c_several_dir_days = "x"
-                    logger.debug(f" TREV | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_1: Set c_several_dir_days -> [{self.c_several_dir_days}]")
+                    logger.debug(" TREV | check | Product: %s | Direction: %s | CRITERIA_1: Set c_several_dir_days -> [%s]", self.product_name, self.direction, self.c_several_dir_days)
                     
                     self.c_ab_vwap = "x"
-                    logger.debug(f" TREV | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_2: Set c_ab_vwap -> [{self.c_ab_vwap}]")
+                    logger.debug(" TREV | check | Product: %s | Direction: %s | CRITERIA_2: Set c_ab_vwap -> [%s]", self.product_name, self.direction, self.c_ab_vwap)
                     
                     self.c_posture = "x"
-                    logger.debug(f" TREV | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_3: Set c_posture -> [{self.c_posture}]")
+                    logger.debug(" TREV | check | Product: %s | Direction: %s | CRITERIA_3: Set c_posture -> [%s]", self.product_name, self.direction, self.c_posture)
                     
                     # Logic For c_orderflow with Logging
                     self.c_orderflow = "  "
                     if self.direction == "short" and self.delta < 0:
                         self.c_orderflow = "x"
-                        logger.debug(f" TREV | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: self.delta({self.delta}) < 0 for short -> [{self.c_orderflow}]")
+                        logger.debug(" TREV | check | Product: %s | Direction: %s | CRITERIA_4: self.delta(%s) < 0 for short -> [%s]", self.product_name, self.direction, self.delta, self.c_orderflow)
                     elif self.direction == "long" and self.delta > 0:
                         self.c_orderflow = "x"
-                        logger.debug(f" TREV | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: self.delta({self.delta}) > 0 for long -> [{self.c_orderflow}]")
+                        logger.debug(" TREV | check | Product: %s | Direction: %s | CRITERIA_4: self.delta(%s) > 0 for long -> [%s]", self.product_name, self.direction, self.delta, self.c_orderflow)
                     else:
-                        logger.debug(f" TREV | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_4: Orderflow criteria not met -> [{self.c_orderflow}]")
+                        logger.debug(" TREV | check | Product: %s | Direction: %s | CRITERIA_4: Orderflow criteria not met -> [%s]", self.product_name, self.direction, self.c_orderflow)
                     
                     # Logic for c_within_ibatr with Logging
                     if abs(self.cpl - self.prior_vpoc) <= self.ib_atr:
                         self.c_within_ibatr = "x"
-                        logger.debug(f" TREV | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: |abs(self.cpl({self.cpl}) - self.prior_vpoc({self.prior_vpoc})| <= self.ib_atr({self.ib_atr}) -> [{self.c_within_ibatr}]")
+                        logger.debug(" TREV | check | Product: %s | Direction: %s | CRITERIA_5: |abs(self.cpl(%s) - self.prior_vpoc(%s)| <= self.ib_atr(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.prior_vpoc, self.ib_atr, self.c_within_ibatr)
                     else:
                         self.c_within_ibatr = "  "
-                        logger.debug(f" TREV | check | Product: {self.product_name} | Direction: {self.direction} | CRITERIA_5: |abs(self.cpl({self.cpl}) - self.prior_vpoc({self.prior_vpoc})| > self.ib_atr({self.ib_atr}) -> [{self.c_within_ibatr}]")
+                        logger.debug(" TREV | check | Product: %s | Direction: %s | CRITERIA_5: |abs(self.cpl(%s) - self.prior_vpoc(%s)| > self.ib_atr(%s) -> [%s]", self.product_name, self.direction, self.cpl, self.prior_vpoc, self.ib_atr, self.c_within_ibatr)
                     
                     # Score Calculation Logging
                     self.score = sum(1 for condition in [self.c_several_dir_days, self.c_ab_vwap, self.c_posture, self.c_orderflow, self.c_within_ibatr] if condition == "x")
-                    logger.debug(f" TREV | check | Product: {self.product_name} | Direction: {self.direction} | SCORE: {self.score}/5")
+                    logger.debug(" TREV | check | Product: %s | Direction: %s | SCORE: %s/5", self.product_name, self.direction, self.score)
                     
                     try:
                         last_alerts[self.product_name] = self.direction
@@ -276,9 +249,9 @@ class TREV(Base):
                     except Exception as e:
                         logger.error(f" TREV | check | Product: {self.product_name} | Note: Failed to send Slack alert: {e}")
                 else:
-                    logger.debug(f" TREV | check | Product: {self.product_name} | Note: Alert: {self.direction} Is Same")
+                    logger.debug(" TREV | check | Product: %s | Note: Alert: %s Is Same", self.product_name, self.direction)
         else:
-            logger.debug(f" TREV | check | Product: {self.product_name} | Note: Condition(s) Not Met")
+            logger.debug(" TREV | check | Product: %s | Note: Condition(s) Not Met", self.product_name)
 
 # ---------------------------------- Alert Preparation------------------------------------ #  
     def discord_message(self):
@@ -331,6 +304,6 @@ class TREV(Base):
         return embed
     
     def execute(self):
-        embed = self.discord_message()
+        embed = self.build_embed()
         self.send_playbook_embed(embed, username=None, avatar_url=None)
         logger.info(f"TREV | execute | Product: {self.product_name} | Note: Alert Sent To Playbook Webhook")
@@ -0,0 +1,269 @@
+import math
+import logging
+import threading
+from collections import OrderedDict
+from zoneinfo import ZoneInfo
+from alertbot.utils import config
+from alertbot.utils import clock
+from alertbot.source.extraction import product_periods
+
+logger = logging.getLogger(__name__)
+
+# Session metrics every playbook of a product derives the same way. Each one is memoized on
+# the file cache keys (path, mtime, size) of the StreamData file types it reads, so all the
+# playbooks evaluating one snapshot of a product pay for it once, whichever files they loaded.
+metric_sources = {
+    "exp_range": ("1",),
+    "prior_day": ("1", "3"),
+    "open_type": ("1", "7"),
+    "total_delta": ("1", "4"),
+    "one_time_framing": ("1",),
+}
+
+# Prior day branches in evaluation order -> (day type, DATR profile)
+prior_day_labels = [
+    ("Rotational", "Non-Trend"),
+    ("Directional", "Neutral Extreme ^"),
+    ("Directional", "Neutral Extreme v"),
+    ("Rotational", "Neutral Center"),
+    ("Rotational", "Normal Day ^"),
+    ("Rotational", "Normal Day v"),
+    ("Directional", "Trend ^"),
+    ("Directional", "Trend ^"),
+    ("Directional", "Trend v"),
+    ("Directional", "Trend v"),
+    ("Semi-Rotational", "Normal Var ^"),
+    ("Semi-Directional", "Normal Var ^"),
+    ("Semi-Rotational", "Normal Var v"),
+    ("Semi-Directional", "Normal Var v"),
+    ("Other", "Other"),
+]
+
+class MetricMemo:
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                self._values.move_to_end(key)
+                return self._values[key]
+        # Computed outside the lock; two lanes racing on one key store the same value
+        value = compute()
+        with self._lock:
+            self.misses += 1
+            self._values[key] = value
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+        return value
+
+class SessionContext:
+    def __init__(self, product_name, variables, sources=None, memo=None):
+        self.product_name = product_name
+        self.variables = variables
+        # File type -> cache key of the file these variables came from (None outside prep_data)
+        self.sources = sources
+        self.memo = memo if memo is not None else MetricMemo()
+        self.est = ZoneInfo('America/New_York')
+
+    def value(self, field, period=None):
+        # A record attribute, or one period's entry of a period vector, rounded; 0 when missing
+        value = getattr(self.variables, field) if period is None else self.variables.period(field, period)
+        if value is None:
+            return 0
+        try:
+            return round(value, 2)
+        except Exception:
+            return 0
+
+    def memoized(self, metric, compute, *extra):
+        if self.sources is None:
+            # No snapshot identity: only this context's own lookups can be shared
+            snapshot = id(self.variables)
+        else:
+            snapshot = tuple(self.sources.get(file_id) for file_id in metric_sources[metric])
+        return self.memo.get_or_compute((metric, snapshot) + extra, compute)
+
+# ---------------------------------- Session Metrics ------------------------------------ #
+    def exp_range(self):
+        impvol = {
+            'ES': config.es_impvol,
+            'NQ': config.nq_impvol,
+            'RTY': config.rty_impvol,
+            'CL': config.cl_impvol
+        }.get(self.product_name)
+        return self.memoized("exp_range", lambda: self.compute_exp_range(impvol), impvol)
+
+    def compute_exp_range(self, impvol):
+        prior_close = self.value("prior_close")
+        if not prior_close:
+            logger.error(f" Context | exp_range | Product: {self.product_name} | Note: No Close Found")
+            raise ValueError(f" Context | exp_range | Product: {self.product_name} | Note: Need Close For Calculation!")
+        if impvol is None:
+            raise ValueError(f" Context | exp_range | Product: {self.product_name} | Note: Unknown Product")
+        exp_range = round(((prior_close * (impvol / 100)) * math.sqrt(1/252)), 2)
+        exp_hi = round(prior_close + exp_range, 2)
+        exp_lo = round(prior_close - exp_range, 2)
+        logger.debug(" Context | exp_range | Product: %s | EXP_RNG: %s | EXP_HI: %s | EXP_LO: %s", self.product_name, exp_range, exp_hi, exp_lo)
+        return exp_range, exp_hi, exp_lo
+
+    def total_delta(self):
+        return self.memoized("total_delta", lambda: self.value("total_ovn_delta") + self.value("total_rth_delta"))
+
+    def prior_day_branch(self):
+        return self.memoized("prior_day", self.compute_prior_day_branch)
+
+    def prior_day(self):
+        return prior_day_labels[self.prior_day_branch()][0]
+
+    def prior_day_profile(self):
+        return prior_day_labels[self.prior_day_branch()][1]
+
+    def compute_prior_day_branch(self):
+        prior_high, prior_low, prior_close = self.value("prior_high"), self.value("prior_low"), self.value("prior_close")
+        prior_ibh, prior_ibl = self.value("prior_ib_high"), self.value("prior_ib_low")
+        ib = prior_ibh - prior_ibl
+        if prior_high <= prior_ibh and prior_low >= prior_ibl:
+            branch = 0
+        elif prior_low < prior_ibl and prior_high > prior_ibh and prior_close >= prior_ibh + 0.5 * ib:
+            branch = 1
+        elif prior_low < prior_ibl and prior_high > prior_ibh and prior_close <= prior_ibl - 0.5 * ib:
+            branch = 2
+        elif (prior_high > prior_ibh and prior_low < prior_ibl and
+            prior_close >= (prior_ibl - 0.5 * ib) and prior_close <= (prior_ibh + 0.5 * ib)):
+            branch = 3
+        elif prior_high > prior_ibh and prior_low >= prior_ibl and prior_high <= prior_ibh + 0.5 * ib:
+            branch = 4
+        elif prior_low < prior_ibl and prior_high <= prior_ibh and prior_low >= prior_ibl - 0.5 * ib:
+            branch = 5
+        elif (prior_high > prior_ibh and prior_low >= prior_ibl and
+            prior_high >= prior_ibh + ib and prior_close >= prior_ibh + ib):
+            branch = 6
+        elif (prior_high > prior_ibh and prior_low >= prior_ibl and
+            prior_close <= prior_ibh + ib and prior_high >= prior_ibh + 1.25 * ib):
+            branch = 7
+        elif (prior_low < prior_ibl and prior_high <= prior_ibh and
+            prior_low <= prior_ibl - ib and prior_close <= prior_ibl - ib):
+            branch = 8
+        elif (prior_low < prior_ibl and prior_high <= prior_ibh and
+            prior_close >= prior_ibl - ib and prior_low <= prior_ibl - 1.25 * ib):
+            branch = 9
+        elif (prior_high > prior_ibh and prior_low >= prior_ibl and
+            prior_high >= prior_ibh + 0.5 * ib and prior_high <= prior_ibh + ib):
+            branch = 10
+        elif (prior_high > prior_ibh and prior_low >= prior_ibl and
+            prior_high >= prior_ibh + ib and prior_close <= prior_ibh + ib):
+            branch = 11
+        elif (prior_low < prior_ibl and prior_high <= prior_ibh and  # IB EXTENSION DOWN
+            prior_low <= prior_ibl - 0.5 * ib and # LOW IS BELOW 1.5x IB
+            prior_low >= prior_ibl - ib): # LOW IS ABOVE 2x IB
+            branch = 12
+        elif (prior_low < prior_ibl and prior_high <= prior_ibh and # IB EXTENSION DOWN
+            prior_low <= prior_ibl - ib and # LOW IS BELOW 2x IB
+            prior_close >= prior_ibl - ib): # CLOSE IS WITHIN 2x IB
+            branch = 13
+        else:
+            branch = 14
+        logger.debug(" Context | prior_day | Product: %s | Prior Day Type: %s | Profile: %s", self.product_name, *prior_day_labels[branch])
+        return branch
+
+    def open_type(self):
+        return self.memoized("open_type", self.compute_open_type)
+
+    def compute_open_type(self):
+        day_open, day_high, day_low = self.value("day_open"), self.value("day_high"), self.value("day_low")
+        prior_high, prior_low = self.value("prior_high"), self.value("prior_low")
+        a_high, a_low, b_high, b_low = self.value("period_high", "A"), self.value("period_low", "A"), self.value("period_high", "B"), self.value("period_low", "B")
+        orh, orl = self.value("orh"), self.value("orl")
+        a_period_mid = round(((a_high + a_low) / 2), 2)
+        current_sub_low = min(a_low, b_low)
+        current_sub_high = max(a_high, b_high)
+        overlap = max(0, min(current_sub_high, prior_high) - max(current_sub_low, prior_low))
+        total_range = day_high - day_low
+        if day_open == a_high and (b_high < a_period_mid):
+            open_type = "OD v"
+        elif day_open == a_low and (b_low > a_period_mid):
+            open_type = "OD ^"
+        elif (day_open > a_period_mid) and (b_high < a_period_mid):
+            open_type = "OTD v"
+        elif (day_open < a_period_mid) and (b_low > a_period_mid):
+            open_type = "OTD ^"
+        elif (day_open > a_period_mid) and (b_low > a_period_mid) and (b_high > orh):
+            open_type = "ORR ^"
+        elif (day_open < a_period_mid) and (b_high < a_period_mid) and (b_low < orl):
+            open_type = "ORR v"
+        elif overlap >= 0.5 * total_range:
+            open_type = "OAIR"
+        elif (overlap < 0.5 * total_range) and (day_open >= prior_high):
+            open_type = "OAOR ^"
+        elif (overlap < 0.5 * total_range) and (day_open <= prior_low):
+            open_type = "OAOR v"
+        else:
+            open_type = "Other"
+        logger.debug(" Context | open_type | Product: %s | Open Type: %s", self.product_name, open_type)
+        return open_type
+
+    def current_period(self):
+        # (current period, finished periods) for the product's 30 minute brackets at clock time
+        now = clock.now(self.est).time()
+        sorted_periods = sorted(product_periods[self.product_name].items(), key=lambda x: x[1])
+        for i, (period, start_time) in enumerate(sorted_periods):
+            next_start = sorted_periods[i + 1][1] if i < len(sorted_periods) - 1 else None
+            if start_time <= now and (next_start is None or now < next_start):
+                return period, [p for p, t in sorted_periods[:i]]
+        return None, []
+
+    def one_time_framing(self):
+        # "^" when the last two finished periods frame higher and the current one holds above,
+        # "v" for the mirror image, None otherwise
+        current_period, finished_periods = self.current_period()
+        if len(finished_periods) < 2:
+            return None
+        return self.memoized("one_time_framing", lambda: self.compute_one_time_framing(current_period, finished_periods), current_period)
+
+    def compute_one_time_framing(self, current_period, finished_periods):
+        period1, period2 = finished_periods[-2], finished_periods[-1]
+        period = self.variables.period
+        raw = (period("period_high", period1), period("period_low", period1), period("period_high", period2),
+               period("period_low", period2), period("period_high", current_period), period("period_low", current_period))
+        if None in raw:
+            logger.debug(" Context | one_time_framing | Product: %s | Note: Period Values Missing For %s, %s, %s", self.product_name, period1, period2, current_period)
+            return None
+        p1_high, p1_low, p2_high, p2_low, current_high, current_low = (round(value, 2) for value in raw)
+        if p2_high > p1_high and p2_low > p1_low and current_low >= p2_low:
+            framing = "^"
+        elif p2_high < p1_high and p2_low < p1_low and current_high <= p2_high:
+            framing = "v"
+        else:
+            framing = None
+        logger.debug(" Context | one_time_framing | Product: %s | Periods: %s, %s, %s | Framing: %s", self.product_name, period1, period2, current_period, framing)
+        return framing
+
+class SessionContexts:
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._memos = {}
+        self._lock = threading.Lock()
+
+    def get(self, product_name, variables, sources=None):
+        with self._lock:
+            memo = self._memos.get(product_name)
+            if memo is None:
+                memo = self._memos[product_name] = MetricMemo(self.maxsize)
+        return SessionContext(product_name, variables, sources, memo)
+
+    def clear(self):
+        with self._lock:
+            self._memos.clear()
+
+    def stats(self):
+        with self._lock:
+            memos = dict(self._memos)
+        return {product_name: {"computed": memo.misses, "reused": memo.hits} for product_name, memo in memos.items()}
+
+session_contexts = SessionContexts()
@@ -0,0 +1,276 @@
+import time
+import logging
+import threading
+from collections import deque, Counter
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from discord_webhook import DiscordWebhook, DiscordEmbed
+from alertbot.utils.metrics import metrics
+from alertbot.utils.event_trace import event_traces
+
+logger = logging.getLogger(__name__)
+
+class Delivery:
+    __slots__ = ("username", "avatar_url", "embed", "enqueued_at", "attempts", "labels", "trace", "origin", "size", "solo")
+
+    def __init__(self, username, avatar_url, embed, labels=("", ""), trace=None, origin=None):
+        self.username = username
+        self.avatar_url = avatar_url
+        self.embed = embed
+        self.enqueued_at = time.monotonic()
+        self.attempts = 0
+        # (product, condition) of the lane that submitted it, for the send metrics
+        self.labels = labels
+        # Event trace resolved by the webhook response (or the final failure)
+        self.trace = trace
+        # (accepted_at, on_posted) of the file event behind it, for file event -> post latency
+        self.origin = origin
+        self.size = embed_size(embed)
+        # Set after a batch it was in came back 400, so it is retried on its own
+        self.solo = False
+
+def embed_size(embed):
+    # Characters Discord counts towards its 6000 per-message limit
+    size = len(embed.get("title") or "") + len(embed.get("description") or "")
+    for field in embed.get("fields") or ():
+        size += len(field.get("name") or "") + len(field.get("value") or "")
+    size += len((embed.get("footer") or {}).get("text") or "")
+    size += len((embed.get("author") or {}).get("name") or "")
+    return size
+
+class DiscordDelivery:
+    def __init__(self, max_queue=256, max_batch=10, timeout=10, max_attempts=5, max_chars=6000):
+        # Discord accepts up to 10 embeds in one webhook message
+        self.max_queue = max_queue
+        self.max_batch = max_batch
+        # ...and up to 6000 characters across all of them
+        self.max_chars = max_chars
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.transport = None
+
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+        self.rate_limited = 0
+        self.status_codes = Counter()
+
+        self._pending = {}
+        self._blocked_until = {}
+        self._queued = 0
+        self._in_flight = 0
+        self._sessions = {}
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopping = False
+        self._local = threading.local()
+
+    # ---------------------- Public API ----------------------------- #
+    def bind(self, accepted_at, on_posted=None):
+        # File event behind the embeds this thread submits; on_posted(latency) runs once each is posted
+        self._local.origin = (accepted_at, on_posted)
+        self._local.submitted = 0
+
+    def unbind(self):
+        # Returns how many embeds were queued under the binding
+        submitted = getattr(self._local, "submitted", 0)
+        self._local.origin = None
+        self._local.submitted = 0
+        return submitted
+
+    def submit(self, webhook_url, embed, username=None, avatar_url=None):
+        if isinstance(embed, DiscordEmbed):
+            embed = dict(embed.__dict__)
+        trace = event_traces.submitted()
+        origin = getattr(self._local, "origin", None)
+        with self._cond:
+            dropped = self._queued >= self.max_queue
+            if dropped:
+                self.dropped += 1
+            else:
+                self._pending.setdefault(webhook_url, deque()).append(Delivery(username, avatar_url, embed, metrics.labels(), trace, origin))
+                self._queued += 1
+                self._ensure_started()
+                self._cond.notify()
+        if dropped:
+            logger.error(f" Delivery | submit | Webhook: {webhook_url} | Note: Queue Full, Dropping Embed")
+            event_traces.delivered(trace, "dropped")
+            return False
+        if origin is not None:
+            self._local.submitted += 1
+        return True
+
+    def flush(self, timeout=10):
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._queued or self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self, timeout=10):
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        return flushed
+
+    def stats(self):
+        with self._cond:
+            return {
+                "queued": self._queued,
+                "sent": self.sent,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "rate_limited": self.rate_limited,
+                "status_codes": dict(self.status_codes),
+            }
+
+    # ---------------------- Sender Thread ----------------------------- #
+    def _ensure_started(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="discord-delivery", daemon=True)
+            self._thread.start()
+
+    def _next_batch(self):
+        # Called with the condition held: oldest ready webhook first, respecting Retry-After
+        while not self._stopping:
+            now = time.monotonic()
+            ready, wake_at = None, None
+            for url, items in self._pending.items():
+                if not items:
+                    continue
+                blocked_until = self._blocked_until.get(url, 0)
+                if blocked_until > now:
+                    wake_at = blocked_until if wake_at is None else min(wake_at, blocked_until)
+                elif ready is None or items[0].enqueued_at < self._pending[ready][0].enqueued_at:
+                    ready = url
+            if ready is not None:
+                items = self._pending[ready]
+                first = items.popleft()
+                batch, size = [first], first.size
+                while (items and not first.solo and not items[0].solo and len(batch) < self.max_batch
+                       and size + items[0].size <= self.max_chars
+                       and (items[0].username, items[0].avatar_url) == (first.username, first.avatar_url)):
+                    size += items[0].size
+                    batch.append(items.popleft())
+                self._queued -= len(batch)
+                self._in_flight += len(batch)
+                return ready, batch
+            self._cond.wait(None if wake_at is None else max(wake_at - now, 0))
+        return None, None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                url, batch = self._next_batch()
+            if url is None:
+                return
+            try:
+                retry_after = self._post(url, batch)
+            except Exception as e:
+                logger.error(f"Failed to send message to Discord webhook: {e}")
+                retry_after = 1.0
+            given_up = []
+            with self._cond:
+                self._in_flight -= len(batch)
+                if retry_after is not None:
+                    retry = [item for item in batch if item.attempts < self.max_attempts]
+                    given_up = [item for item in batch if item.attempts >= self.max_attempts]
+                    self.failed += len(given_up)
+                    if retry:
+                        self._blocked_until[url] = time.monotonic() + retry_after
+                        self._pending.setdefault(url, deque()).extendleft(reversed(retry))
+                        self._queued += len(retry)
+                self._cond.notify_all()
+            for item in given_up:
+                event_traces.delivered(item.trace, "failed")
+
+    def _session(self, url):
+        host = urlsplit(url).netloc
+        session = self._sessions.get(host)
+        if session is None:
+            # Keep-alive pool per webhook host so each post skips TCP/TLS setup
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            self._sessions[host] = session
+        return session
+
+    def _post(self, url, batch):
+        first = batch[0]
+        webhook = DiscordWebhook(url=url, username=first.username, avatar_url=first.avatar_url)
+        for item in batch:
+            item.attempts += 1
+            webhook.add_embed(item.embed)
+        payload = webhook.json
+
+        started = time.perf_counter()
+        if self.transport is not None:
+            response = self.transport(url, payload)
+        else:
+            response = self._session(url).post(url, json=payload, timeout=self.timeout)
+        status_code = response.status_code
+        elapsed = time.perf_counter() - started
+        with self._cond:
+            self.status_codes[status_code] += 1
+        for item in batch:
+            metrics.observe_stage("send", elapsed, *item.labels)
+            metrics.webhook_response(status_code, *item.labels)
+        # Retried responses (429, 5xx, a rejected batch) leave the trace open until the final attempt
+        split = status_code == 400 and len(batch) > 1
+        final = status_code in (200, 204) or (status_code != 429 and status_code < 500 and not split)
+        if final:
+            for item in batch:
+                event_traces.delivered(item.trace, status_code)
+
+        if status_code in (200, 204):
+            with self._cond:
+                self.sent += len(batch)
+            posted_at = time.monotonic()
+            for item in batch:
+                if item.origin is not None:
+                    accepted_at, on_posted = item.origin
+                    metrics.observe_stage("total", posted_at - accepted_at, *item.labels)
+                    if on_posted is not None:
+                        on_posted(posted_at - accepted_at)
+            waited = time.monotonic() - first.enqueued_at
+            logger.info(f"Message sent to Discord webhook: {url} | Response Code: {status_code} | Embeds: {len(batch)} | Queued: {waited*1000:.0f}ms")
+            return None
+        if status_code == 429:
+            with self._cond:
+                self.rate_limited += 1
+            retry_after = self._retry_after(response)
+            logger.warning(f" Delivery | post | Webhook: {url} | Note: Rate Limited, Retrying In {retry_after:.2f}s")
+            # A rate-limited send does not count against the item's attempts
+            for item in batch:
+                item.attempts -= 1
+            return retry_after
+        if split:
+            # One bad or oversized embed rejects the whole message; resend each on its own
+            logger.warning(f" Delivery | post | Webhook: {url} | Response Code: 400 | Embeds: {len(batch)} | Note: Retrying One By One")
+            for item in batch:
+                item.attempts -= 1
+                item.solo = True
+            return 0.0
+        if status_code >= 500:
+            logger.warning(f" Delivery | post | Webhook: {url} | Response Code: {status_code} | Note: Retrying")
+            return min(2 ** first.attempts, 30)
+        with self._cond:
+            self.failed += len(batch)
+        logger.error(f"Failed to send message to Discord webhook: {url} | Response Code: {status_code} | Body: {response.text[:200]}")
+        return None
+
+    def _retry_after(self, response):
+        header = response.headers.get("Retry-After")
+        try:
+            if header is not None:
+                return max(float(header), 0.0)
+            return max(float(response.json().get("retry_after", 1.0)), 0.0)
+        except Exception:
+            return 1.0
+
+discord_delivery = DiscordDelivery()
@@ -1,12 +1,12 @@
 import logging
 import math
 from alertbot.utils import config
+from alertbot.utils import clock
 from alertbot.alerts.base import Base
 import threading
 from datetime import datetime
 import time
 from discord_webhook import DiscordWebhook, DiscordEmbed
-import investpy
 import pandas as pd
 import os
 
@@ -16,11 +16,13 @@ class Economic(Base):
     def __init__(self, files):
         super().__init__(files=files)
     def send_alert(self):
-        today = datetime.now()
+        today = clock.now()
         today_str = today.strftime('%m/%d/%Y')
         logger.debug(f" ECON | send_alert | Note: Fetching economic data for {today_str}...")
 
         try:
+            # Imported on first use: investpy is heavy and only needed once a day
+            import investpy
             calendar = investpy.news.economic_calendar(
                 time_zone=None,
                 time_filter='time_only',
@@ -61,9 +61,11 @@ class Gap_Check_Crude(Base):
 
     # ---------------------- Driving Input Logic ------------------------- #
     def send_alert(self):
+        # One read of the product files per scheduled run, shared by every product thread
+        snapshot = self.fetch_snapshot(['CL'])
         threads = []
         for product_name in ['CL']:
-            thread = threading.Thread(target=self.process_product, args=(product_name,))
+            thread = threading.Thread(target=self.process_product, args=(product_name, snapshot))
             thread.start()
             threads.append(thread)
             time.sleep(1)
@@ -72,17 +74,17 @@ class Gap_Check_Crude(Base):
             thread.join()
 
     # ---------------------- Alert Preparation ------------------------- #
-    def process_product(self, product_name):
+    def process_product(self, product_name, snapshot=None):
         try:
             local_product = product_name
-            variables = self.fetch_latest_variables(local_product)
+            variables = self.fetch_latest_variables(local_product, snapshot)
             if not variables:
                 logger.error(f" GAP_CRUDE | process_product | Product: {local_product} |  Note: No data available ")
                 return
-            prior_close = round(variables.get(f'{local_product}_PRIOR_CLOSE'), 2)
-            day_open = round(variables.get(f'{local_product}_DAY_OPEN'), 2)
-            prior_high = round(variables.get(f'{local_product}_PRIOR_HIGH'), 2)
-            prior_low = round(variables.get(f'{local_product}_PRIOR_LOW'), 2)
+            prior_close = round(variables.prior_close, 2)
+            day_open = round(variables.day_open, 2)
+            prior_high = round(variables.prior_high, 2)
+            prior_low = round(variables.prior_low, 2)
             impvol = config.cl_impvol
             color_name = self.product_color.get(local_product, ":black_large_square:") 
             color_value = self.get_color(local_product)
@@ -132,9 +132,11 @@ class IB_Crude_Alert(Base):
         return open_type
     # ---------------------- Alert Preparation ------------------------- #
     def send_alert(self):
+        # One read of the product files per scheduled run, shared by every product thread
+        snapshot = self.fetch_snapshot(['CL'])
         threads = []
         for product_name in ['CL']:
-            thread = threading.Thread(target=self.process_product, args=(product_name,))
+            thread = threading.Thread(target=self.process_product, args=(product_name, snapshot))
             thread.start()
             threads.append(thread)
             time.sleep(1)
@@ -142,39 +144,39 @@ class IB_Crude_Alert(Base):
         for thread in threads:
             thread.join()
 
-    def process_product(self, product_name):
+    def process_product(self, product_name, snapshot=None):
         try:
             local_product = product_name
-            variables = self.fetch_latest_variables(local_product)
+            variables = self.fetch_latest_variables(local_product, snapshot)
             if not variables:
                 logger.error(f" IB_CRUDE | process_product | Product: {local_product} |  Note: No data available ")
                 return
             
-            ib_atr = round(variables.get(f'{local_product}_IB_ATR'), 2)
-            ib_high = round(variables.get(f'{local_product}_IB_HIGH'), 2)
-            ib_low = round(variables.get(f'{local_product}_IB_LOW'), 2)
-            prior_close = round(variables.get(f'{local_product}_PRIOR_CLOSE'), 2)
-            day_open = round(variables.get(f'{local_product}_DAY_OPEN'), 2)
-            prior_high = round(variables.get(f'{local_product}_PRIOR_HIGH'), 2)
-            prior_low = round(variables.get(f'{local_product}_PRIOR_LOW'), 2)
-            cpl = round(variables.get(f'{local_product}_CPL'), 2)
-            fd_vpoc = round(variables.get(f'{local_product}_5D_VPOC'), 2)
-            td_vpoc = round(variables.get(f'{local_product}_20D_VPOC'), 2)
-            ovn_to_ibh = round(variables.get(f'{local_product}_OVNTOIB_HI'), 2)
-            ovn_to_ibl = round(variables.get(f'{local_product}_OVNTOIB_LO'), 2)
-            a_high = round(variables.get(f'{local_product}_A_HIGH'), 2)
-            a_low = round(variables.get(f'{local_product}_A_LOW'), 2)
-            b_high = round(variables.get(f'{local_product}_B_HIGH'), 2)
-            b_low = round(variables.get(f'{local_product}_B_LOW'), 2)
-            orh = round(variables.get(f'{local_product}_ORH'), 2)
-            orl = round(variables.get(f'{local_product}_ORL'), 2)
-            rvol = round(variables.get(f'{local_product}_CUMULATIVE_RVOL'), 2)
-            overnight_high = round(variables.get(f'{local_product}_OVNH'), 2)
-            overnight_low = round(variables.get(f'{local_product}_OVNL'), 2)
-            day_high = round(variables.get(f'{local_product}_DAY_HIGH'), 2)
-            day_low = round(variables.get(f'{local_product}_DAY_LOW'), 2) 
+            ib_atr = round(variables.ib_atr, 2)
+            ib_high = round(variables.ib_high, 2)
+            ib_low = round(variables.ib_low, 2)
+            prior_close = round(variables.prior_close, 2)
+            day_open = round(variables.day_open, 2)
+            prior_high = round(variables.prior_high, 2)
+            prior_low = round(variables.prior_low, 2)
+            cpl = round(variables.cpl, 2)
+            fd_vpoc = round(variables.vpoc_5d, 2)
+            td_vpoc = round(variables.vpoc_20d, 2)
+            ovn_to_ibh = round(variables.ovntoib_hi, 2)
+            ovn_to_ibl = round(variables.ovntoib_lo, 2)
+            a_high = round(variables.period("period_high", "A"), 2)
+            a_low = round(variables.period("period_low", "A"), 2)
+            b_high = round(variables.period("period_high", "B"), 2)
+            b_low = round(variables.period("period_low", "B"), 2)
+            orh = round(variables.orh, 2)
+            orl = round(variables.orl, 2)
+            rvol = round(variables.cumulative_rvol, 2)
+            overnight_high = round(variables.ovnh, 2)
+            overnight_low = round(variables.ovnl, 2)
+            day_high = round(variables.day_high, 2)
+            day_low = round(variables.day_low, 2) 
             impvol = config.cl_impvol
-            vwap_slope = variables.get(f'{local_product}_VWAP_SLOPE')
+            vwap_slope = variables.vwap_slope
 
             color_name = self.product_color.get(local_product, ":black_large_square:")  
             color_value = self.get_color(local_product)
@@ -0,0 +1,87 @@
+import os
+import threading
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+class CacheEntry:
+    __slots__ = ("key", "data", "variables")
+
+    def __init__(self, key, data, variables):
+        self.key = key
+        self.data = data
+        self.variables = variables
+
+class FileCache:
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._path_locks = {}
+
+    def file_key(self, filepath):
+        stat = os.stat(filepath)
+        return (filepath, stat.st_mtime_ns, stat.st_size)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key[0])
+            if entry is None or entry.key != key:
+                return None
+            self._entries.move_to_end(key[0])
+            return entry
+
+    def put(self, key, data, variables):
+        entry = CacheEntry(key, data, variables)
+        with self._lock:
+            # One entry per path: a new (mtime, size) replaces the stale parse.
+            self._entries[key[0]] = entry
+            self._entries.move_to_end(key[0])
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def load(self, task, loader):
+        filepath = task["filepath"]
+        with self._lock:
+            path_lock = self._path_locks.setdefault(filepath, threading.Lock())
+
+        # Serialize loads of the same path so concurrent conditions share one parse.
+        with path_lock:
+            # Stat before reading: if the file changes mid-read the stored key is
+            # already outdated and the next lookup misses instead of serving stale data.
+            key = self.file_key(filepath)
+            entry = self.get(key)
+            if entry is not None:
+                with self._lock:
+                    self.hits += 1
+                return entry
+            with self._lock:
+                self.misses += 1
+            data, variables = loader(task)
+            return self.put(key, data, variables)
+
+    def invalidate(self, filepath=None):
+        with self._lock:
+            if filepath is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(filepath, None)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+file_cache = FileCache(maxsize=64)
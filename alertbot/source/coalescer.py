@@ -0,0 +1,157 @@
+import logging
+import threading
+from alertbot.utils import clock
+
+logger = logging.getLogger(__name__)
+
+# ---------------------- Timer Wheel ----------------------------- #
+class TimerWheel:
+    # Hashed timing wheel: `slots` buckets of `tick` seconds. Adding a deadline is an append to
+    # its bucket; a deadline more than one rotation out stays put and is re-checked each time
+    # its bucket comes round.
+    def __init__(self, tick=0.05, slots=128):
+        self.tick = tick
+        self.slots = slots
+        self.buckets = [[] for _ in range(slots)]
+        self.cursor = None
+
+    def add(self, key, deadline):
+        index = int(deadline // self.tick)
+        if self.cursor is not None and index < self.cursor:
+            index = self.cursor
+        self.buckets[index % self.slots].append((key, deadline))
+
+    def expire(self, now):
+        # Keys whose deadline is <= now, visiting each bucket between the cursor and now once
+        target = int(now // self.tick)
+        if self.cursor is None:
+            self.cursor = target
+        first = self.cursor
+        last = min(target, first + self.slots - 1)
+        expired = []
+        for index in range(first, last + 1):
+            bucket = self.buckets[index % self.slots]
+            if not bucket:
+                continue
+            keep = []
+            for key, deadline in bucket:
+                if deadline <= now:
+                    expired.append(key)
+                else:
+                    keep.append((key, deadline))
+            self.buckets[index % self.slots] = keep
+        self.cursor = target
+        return expired
+
+# ---------------------- Write Coalescer ----------------------------- #
+class PendingWrite:
+    __slots__ = ("payload", "first", "last", "deadline", "writes")
+
+    def __init__(self, payload, now):
+        self.payload = payload
+        self.first = now
+        self.last = now
+        self.deadline = now
+        self.writes = 0
+
+class WriteCoalescer:
+    # Trailing-edge debounce per key: every write pushes the key's deadline to `quiet` seconds
+    # after it, capped at `max_latency` after the burst's first write, and exactly one
+    # emit(key, payload, first, last) fires once the deadline passes. A file written
+    # continuously is therefore still flushed at least every `max_latency` seconds.
+    def __init__(self, emit, quiet=0.5, max_latency=2.0, tick=0.05):
+        self.emit = emit
+        self.quiet = quiet
+        self.max_latency = max(max_latency, quiet)
+        self.tick = tick
+        self.wheel = TimerWheel(tick=tick)
+        self.pending = {}
+        self.writes = 0
+        self.flushes = 0
+        self.capped = 0
+        self.max_hold = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def touch(self, key, payload, now):
+        with self._lock:
+            self.writes += 1
+            entry = self.pending.get(key)
+            if entry is None:
+                entry = self.pending[key] = PendingWrite(payload, now)
+                entry.deadline = min(now + self.quiet, now + self.max_latency)
+                self.wheel.add(key, entry.deadline)
+            else:
+                # The wheel entry is left where it is and moved on expiry if the deadline slid
+                entry.payload = payload
+                entry.last = now
+                entry.deadline = min(now + self.quiet, entry.first + self.max_latency)
+            entry.writes += 1
+
+    def advance(self, now):
+        ready = []
+        with self._lock:
+            for key in self.wheel.expire(now):
+                entry = self.pending.get(key)
+                if entry is None:
+                    continue
+                if entry.deadline <= now:
+                    del self.pending[key]
+                    ready.append((key, entry))
+                else:
+                    self.wheel.add(key, entry.deadline)
+        self.deliver(ready, now)
+        return len(ready)
+
+    def flush(self, now=None):
+        # Emits everything pending regardless of deadline (a replay snapshot or shutdown)
+        now = clock.timestamp() if now is None else now
+        with self._lock:
+            ready = list(self.pending.items())
+            self.pending.clear()
+        self.deliver(ready, now)
+        return len(ready)
+
+    def deliver(self, ready, now):
+        for key, entry in ready:
+            with self._lock:
+                self.flushes += 1
+                if entry.last + self.quiet > entry.first + self.max_latency:
+                    self.capped += 1
+                self.max_hold = max(self.max_hold, now - entry.first)
+            try:
+                self.emit(key, entry.payload, entry.first, entry.last)
+            except Exception as e:
+                logger.error(f" Coalescer | deliver | Key: {key} | Note: Emit Failed: {e}")
+
+    # ---------------------- Wheel Thread ----------------------------- #
+    def run(self):
+        while not self._stop.wait(self.tick):
+            self.advance(clock.timestamp())
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="write-coalescer", daemon=True)
+        self._thread.start()
+
+    def stop(self, flush=True):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+        if flush:
+            self.flush()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "writes": self.writes,
+                "write_flushes": self.flushes,
+                "writes_coalesced": self.writes - self.flushes - len(self.pending),
+                "flushes_capped": self.capped,
+                "max_hold": round(self.max_hold, 3),
+                "pending_writes": len(self.pending),
+            }
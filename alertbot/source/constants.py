@@ -1,18 +1,6 @@
 from datetime import time as datetime_time
-# ---------------------- Playbook ------------------------- #
-from alertbot.alerts.conditional.playbook.pvat import PVAT
-from alertbot.alerts.conditional.playbook.datr import DATR
-from alertbot.alerts.conditional.playbook.dogw import DOGW
-from alertbot.alerts.conditional.playbook.Ibgp import IBGP 
-from alertbot.alerts.conditional.playbook.Ibgw import IBGW
-from alertbot.alerts.conditional.playbook.trct import TRCT
-from alertbot.alerts.conditional.playbook.trev import TREV
-from alertbot.alerts.conditional.playbook.xtfd import XTFD
-# ---------------------- Contextual ------------------------- #
-from alertbot.alerts.conditional.contextual.neutral import NEUTRAL
-from alertbot.alerts.conditional.contextual.pre_ib import PRE_IB_BIAS
-from alertbot.alerts.conditional.contextual.swing import SWING_BIAS
-from alertbot.alerts.conditional.contextual.long_term_bias import LONG_TERM_BIAS
+from collections.abc import Mapping
+from importlib import import_module
 # Investpy Current Timezones
 TIMEZONES = {
     'GMT -11:00': [2, 35],
@@ -384,20 +372,55 @@ conditions = [
     
 ]
 
-condition_functions = {
-    "PVAT": PVAT,
-    "DATR": DATR,
-    "PREIB": PRE_IB_BIAS,
-    "SWING": SWING_BIAS,
-    "LONGTERM": LONG_TERM_BIAS,
-    "NEUTRAL": NEUTRAL,
-    "DOGW": DOGW,
-    "TRCT": TRCT,
-    "IBGW": IBGW,
-    "IBGP": IBGP,
-    "XTFD": XTFD,
-    "TREV": TREV,
+# Product trading hours (ET) that gate file parsing
+product_hours = {
+    "ES": (datetime_time(9, 30), datetime_time(16, 0)),
+    "NQ": (datetime_time(9, 30), datetime_time(16, 0)),
+    "RTY": (datetime_time(9, 30), datetime_time(16, 0)),
+    "CL": (datetime_time(9, 0), datetime_time(14, 30)),
 }
+
+class LazyConditionFunctions(Mapping):
+    # Playbook and contextual classes are imported on first lookup (or by preload),
+    # so importing constants does not pull in every alert module at startup.
+    def __init__(self, paths):
+        self.paths = paths
+        self.loaded = {}
+
+    def __getitem__(self, prefix):
+        function_class = self.loaded.get(prefix)
+        if function_class is None:
+            module_name, class_name = self.paths[prefix].split(':')
+            function_class = getattr(import_module(module_name), class_name)
+            self.loaded[prefix] = function_class
+        return function_class
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def preload(self):
+        for prefix in self.paths:
+            self[prefix]
+
+condition_functions = LazyConditionFunctions({
+    # ---------------------- Playbook ------------------------- #
+    "PVAT": "alertbot.alerts.conditional.playbook.pvat:PVAT",
+    "DATR": "alertbot.alerts.conditional.playbook.datr:DATR",
+    "DOGW": "alertbot.alerts.conditional.playbook.dogw:DOGW",
+    "TRCT": "alertbot.alerts.conditional.playbook.trct:TRCT",
+    "IBGW": "alertbot.alerts.conditional.playbook.Ibgw:IBGW",
+    "IBGP": "alertbot.alerts.conditional.playbook.Ibgp:IBGP",
+    "XTFD": "alertbot.alerts.conditional.playbook.xtfd:XTFD",
+    "TREV": "alertbot.alerts.conditional.playbook.trev:TREV",
+    # ---------------------- Contextual ------------------------- #
+    "PREIB": "alertbot.alerts.conditional.contextual.pre_ib:PRE_IB_BIAS",
+    "SWING": "alertbot.alerts.conditional.contextual.swing:SWING_BIAS",
+    "LONGTERM": "alertbot.alerts.conditional.contextual.long_term_bias:LONG_TERM_BIAS",
+    "NEUTRAL": "alertbot.alerts.conditional.contextual.neutral:NEUTRAL",
+})
 es_1 = [
     '[ID24.SG1] RTH_VWAP', '[ID23.SG2] Vwap_Slope', '[ID2.SG1] Day_Open', '[ID2.SG2] Day_High', '[ID2.SG3] Day_Low', 
     '[ID2.SG4] Day_Close', '[ID1.SG1] Day_Vpoc', '[ID9.SG1] Prior_Vpoc', '[ID8.SG2] Prior_High', '[ID8.SG3] Prior_Low', '[ID8.SG4] Prior_Close',
@@ -0,0 +1,227 @@
+import logging
+import numpy as np
+import pandas as pd
+from datetime import datetime, time, timedelta
+
+logger = logging.getLogger(__name__)
+
+period_equity = {
+    'A': time(9, 30),
+    'B': time(10, 0),
+    'C': time(10, 30),
+    'D': time(11, 0),
+    'E': time(11, 30),
+    'F': time(12, 0),
+    'G': time(12, 30),
+    'H': time(13, 0),
+    'I': time(13, 30),
+    'J': time(14, 0),
+    'K': time(14, 30),
+    'L': time(15, 0),
+    'M': time(15, 30),
+}
+period_crude = {
+    'A': time(9, 0),
+    'B': time(9, 30),
+    'C': time(10, 0),
+    'D': time(10, 30),
+    'E': time(11, 0),
+    'F': time(11, 30),
+    'G': time(12, 0),
+    'H': time(12, 30),
+    'I': time(13, 0),
+    'J': time(13, 30),
+    'K': time(14, 0),
+}
+product_periods = {
+    'ES': period_equity,
+    'NQ': period_equity,
+    'RTY': period_equity,
+    'CL': period_crude,
+}
+
+# Row selectors: an int is a positional row (iloc), CURRENT / PRIOR pick the row stamped
+# at a period's start time in the latest / previous session, PRIOR_PRIOR is the product's
+# row for the session before the prior one.
+CURRENT = "current"
+PRIOR = "prior"
+PRIOR_PRIOR = "prior_prior"
+prior_prior_rows = {'ES': 14, 'NQ': 14, 'RTY': 14, 'CL': 12}
+
+# ---------------------- Variable Layouts ----------------------------- #
+# File type -> (variable suffix, column label, row selector). Variable names are prefixed
+# with the product and column labels are matched against the task's column list, so
+# ES/NQ/RTY/CL share one layout even where their study IDs differ. "{period}" entries
+# expand to every period letter of the product's session.
+file_layouts = {
+    "1": [
+        ("RTH_VWAP", "RTH_VWAP", 0),
+        ("VWAP_SLOPE", "Vwap_Slope", 0),
+        ("DAY_OPEN", "Day_Open", 0),
+        ("DAY_HIGH", "Day_High", 0),
+        ("DAY_LOW", "Day_Low", 0),
+        ("DAY_CLOSE", "Day_Close", 0),
+        ("DAY_VPOC", "Day_Vpoc", 0),
+        ("PRIOR_VPOC", "Prior_Vpoc", 0),
+        ("PRIOR_HIGH", "Prior_High", 0),
+        ("PRIOR_LOW", "Prior_Low", 0),
+        ("PRIOR_CLOSE", "Prior_Close", 0),
+        ("RVOL", "R_Vol", 0),
+        ("CUMULATIVE_RVOL", "R_Vol_Cumulative", 0),
+        ("TOTAL_RTH_DELTA", "Total_Delta", 0),
+        ("PRIOR_PRIOR_HIGH", "Prior_High", PRIOR_PRIOR),
+        ("PRIOR_PRIOR_LOW", "Prior_Low", PRIOR_PRIOR),
+        ("{period}_HIGH", "{period}_High", CURRENT),
+        ("{period}_LOW", "{period}_Low", CURRENT),
+        ("PRIOR_{period}_HIGH", "{period}_High", PRIOR),
+        ("PRIOR_{period}_LOW", "{period}_Low", PRIOR),
+    ],
+    "2": [
+        ("ETH_VWAP", "ETH_VWAP", 0),
+        ("ETH_TOP_1", "Top_1", 0),
+        ("ETH_BOTTOM_1", "Bottom_1", 0),
+        ("ETH_TOP_2", "Top_2", 0),
+        ("ETH_BOTTOM_2", "Bottom_2", 0),
+        ("CPL", "CPL", 0),
+        ("5D_VPOC", "5DVPOC", 0),
+        ("20D_VPOC", "20DVPOC", 0),
+        ("P_WOPEN", "P_WOPEN", 0),
+        ("P_WHIGH", "P_WHIGH", 0),
+        ("P_WLO", "P_WLO", 0),
+        ("P_WCLOSE", "P_WCLOSE", 0),
+        ("P_WVPOC", "P_WVPOC", 0),
+        ("WVWAP", "WVWAP", 0),
+        ("P_MOPEN", "P_MOPEN", 0),
+        ("P_MHIGH", "P_MHIGH", 0),
+        ("P_MLO", "P_MLO", 0),
+        ("P_MCLOSE", "P_MCLOSE", 0),
+        ("P_MVPOC", "P_MVPOC", 0),
+        ("MVWAP", "MVWAP", 0),
+        ("ETH_VWAP_{period}", "ETH_VWAP", CURRENT),
+        ("ETH_TOP_1_{period}", "Top_1", CURRENT),
+        ("ETH_BOTTOM_1_{period}", "Bottom_1", CURRENT),
+    ],
+    "3": [
+        ("IB_ATR", "IB ATR", 1),
+        ("IB_HIGH", "IBH", 0),
+        ("IB_LOW", "IBL", 0),
+        ("PRIOR_IB_HIGH", "IBH", 1),
+        ("PRIOR_IB_LOW", "IBL", 1),
+    ],
+    "4": [
+        ("OVNH", "OVN H", 0),
+        ("OVNL", "OVN L", 0),
+        ("TOTAL_OVN_DELTA", "OVN Total", 0),
+    ],
+    "5": [
+        ("OVNTOIB_HI", "OVNTOIB_HI", 0),
+        ("OVNTOIB_LO", "OVNTOIB_LO", 0),
+    ],
+    "6": [
+        ("EURO_IBH", "EURO IBH", 0),
+        ("EURO_IBL", "EURO IBL", 0),
+    ],
+    "7": [
+        ("ORH", "ORH", 0),
+        ("ORL", "ORL", 0),
+    ],
+}
+
+class CompiledLayout:
+    __slots__ = ("variables", "columns", "column_slots", "rows", "periods")
+
+    def __init__(self, variables, columns, column_slots, rows, periods):
+        self.variables = variables
+        self.columns = columns
+        self.column_slots = column_slots
+        self.rows = rows
+        self.periods = periods
+
+_compiled = {}
+
+def compile_layout(task):
+    name = task["name"]
+    compiled = _compiled.get(name)
+    if compiled is not None:
+        return compiled
+
+    product_name, file_id = name.split('_')[0], name.split('_')[1]
+    entries = file_layouts.get(file_id)
+    if entries is None:
+        raise KeyError(f" Extraction | compile_layout | Task: {name} | Note: No Layout For File Type {file_id}")
+    periods = product_periods.get(product_name, period_equity)
+    by_label = {column.split('] ', 1)[-1]: column for column in task["columns"]}
+
+    variables, columns, rows = [], [], []
+    column_slots = {}
+    for variable, label, selector in entries:
+        if selector == PRIOR_PRIOR:
+            selector = prior_prior_rows.get(product_name, 14)
+        expanded = [(p, selector) for p in periods] if "{period}" in variable else [(None, selector)]
+        for period, row in expanded:
+            column_label = label.format(period=period) if period else label
+            column = by_label.get(column_label)
+            if column is None:
+                # Periods past the product's session (e.g. L/M for crude) have no column
+                continue
+            if row in (CURRENT, PRIOR):
+                row = (row, period)
+            if row not in rows:
+                rows.append(row)
+            if column not in column_slots:
+                column_slots[column] = len(columns)
+                columns.append(column)
+            var_name = f"{product_name}_{variable.format(period=period) if period else variable}"
+            variables.append((var_name, rows.index(row), column_slots[column]))
+
+    compiled = CompiledLayout(variables, columns, column_slots, rows, periods)
+    _compiled[name] = compiled
+    return compiled
+
+def resolve_rows(data, layout):
+    positions = np.full(len(layout.rows), -1, dtype=np.intp)
+    session_rows = [(slot, row) for slot, row in enumerate(layout.rows) if isinstance(row, tuple)]
+    for slot, row in enumerate(layout.rows):
+        if not isinstance(row, tuple):
+            if row >= len(data):
+                raise IndexError(f" Extraction | resolve_rows | Note: Row {row} Out Of Range ({len(data)} Rows)")
+            positions[slot] = row
+
+    if session_rows:
+        index = data.index
+        latest_date = index.max().date()
+        previous_date = latest_date - timedelta(days=1)
+        stamps = [
+            datetime.combine(latest_date if session == CURRENT else previous_date, layout.periods[period])
+            for _, (session, period) in session_rows
+        ]
+        if index.is_unique:
+            lookup = index.get_indexer(pd.DatetimeIndex(stamps))
+        else:
+            # Duplicate stamps resolve to their first (newest) row
+            first = ~index.duplicated(keep='first')
+            lookup = index[first].get_indexer(pd.DatetimeIndex(stamps))
+            lookup = np.where(lookup >= 0, np.flatnonzero(first)[lookup], -1)
+        for (slot, _), position in zip(session_rows, lookup):
+            positions[slot] = position
+    return positions
+
+def extract_variables(task, data):
+    layout = compile_layout(task)
+    column_positions = data.columns.get_indexer(layout.columns)
+    if (column_positions < 0).any():
+        missing = [c for c, p in zip(layout.columns, column_positions) if p < 0]
+        raise KeyError(f" Extraction | extract_variables | Task: {task['name']} | Note: Missing Columns {missing}")
+
+    row_positions = resolve_rows(data, layout)
+    found = row_positions >= 0
+    # One positional gather pulls every needed scalar out of the frame at once
+    block = np.full((len(row_positions), len(column_positions)), np.nan)
+    if found.any():
+        block[found] = data.iloc[row_positions[found], column_positions].to_numpy(dtype=float)
+
+    variables = {}
+    for var_name, row_slot, column_slot in layout.variables:
+        if found[row_slot]:
+            variables[var_name] = float(block[row_slot, column_slot])
+    return variables
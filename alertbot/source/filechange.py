@@ -1,89 +1,291 @@
 import threading
 from queue import Queue
+from collections import deque
 import logging
 import os
 import time as time_module
-from datetime import datetime
-from zoneinfo import ZoneInfo
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 from alertbot.source.startup import Initialization
+from alertbot.source.stability import file_stability
+from alertbot.source.schedule import ScheduleIndex
+from alertbot.source.coalescer import WriteCoalescer
 from alertbot.source.constants import conditions, condition_functions
+from alertbot.alerts.context import session_contexts
+from alertbot.alerts.delivery import discord_delivery
+from alertbot.source.cache import file_cache
+from alertbot.source.record import product_records
+from alertbot.utils.metrics import metrics
+from alertbot.utils.event_trace import event_traces
+from alertbot.utils import clock, config
 
 logger = logging.getLogger(__name__)
 
 class FileChangeHandler(FileSystemEventHandler):
-    def __init__(self, files, conditions, debounce_interval=1.0):
+    def __init__(self, files, conditions, debounce_interval=None, workers=1, max_latency=None):
 
         self.files = files
         self.conditions = conditions
-        self.file_paths = [os.path.abspath(task["filepath"]) for task in self.files]
-        
         self.file_to_task = {task["name"]: task for task in self.files}
 
-        self.conditions_dict = {condition["name"]: set(condition["required_files"]) for condition in self.conditions}
+        # Event-thread index: normalized path -> task (file name -> active conditions lives in the schedule)
+        self.path_to_task = {self.normalize_path(task["filepath"]): task for task in self.files}
+        self.file_paths = frozenset(self.path_to_task)
+
+        self.conditions_dict = {condition["name"]: frozenset(condition["required_files"]) for condition in self.conditions}
+
+        for file_name in self.file_to_task:
+            product_name, file_id = self.extract_product_and_id(file_name)
+            if not product_name or not file_id:
+                logger.warning(f" FileChange | FileName: {file_name} | Note: Invalid task name")
 
         self.updated_conditions = {condition["name"]: set() for condition in self.conditions}
 
-        self.processing_queue = Queue()
+        # Trigger mode (see config): "all_updated" waits for every required file to change,
+        # "freshness" fires on any change once the other required files are within budget.
+        self.trigger_mode = config.trigger_mode
+        if self.trigger_mode not in ("all_updated", "freshness"):
+            logger.warning(f" FileChange | TriggerMode: {self.trigger_mode} | Note: Unknown Trigger Mode, Using all_updated")
+            self.trigger_mode = "all_updated"
+        self.file_updated_at = {}
+        # Shadow of the all_updated rule, kept in both modes: when it completes, the time since
+        # the condition first became fresh is the trigger latency freshness mode saves.
+        self.shadow_updated = {condition["name"]: set() for condition in self.conditions}
+        self.fresh_since = {}
+        self.fired = 0
+        self.stale_skips = 0
+        self.saved_latencies = deque(maxlen=1000)
 
-        self.processing_thread = threading.Thread(target=self.process_queue, daemon=True)
-        self.processing_thread.start()
+        # Only conditions inside their time windows are tracked; see ScheduleIndex
+        self.schedule = ScheduleIndex(self.conditions, on_change=self.on_schedule_change)
+        self.inactive_events = 0
 
         self.lock = threading.Lock()
 
-        self.debounce_interval = debounce_interval
-        self.last_processed = {}
+        # Trailing-edge debounce: a burst of writes to a file is handled once, after it has been
+        # quiet for debounce_interval (or max_latency after its first write), with the newest data
+        self.debounce_interval = config.debounce_quiet if debounce_interval is None else debounce_interval
+        max_latency = config.debounce_max_latency if max_latency is None else max_latency
+        self.coalescer = WriteCoalescer(self.on_write_settled, quiet=self.debounce_interval, max_latency=max_latency)
+        # Normalized path -> (trace id, monotonic first write) of the burst being coalesced
+        self.write_started = {}
+        # File name -> (trace id, first write, settled) of its last settled burst
+        self.last_settled = {}
 
         self.conditions_in_queue = set()
 
+        # One queue (lane) per worker. Every condition of a product lands in the same lane,
+        # so a product's playbooks never run concurrently with each other and their
+        # module-level last_alerts stay consistent, while other products keep moving.
+        self.workers = max(1, workers)
+        self.processing_queues = [Queue() for _ in range(self.workers)]
+        self.processing_queue = self.processing_queues[0]
+        products = []
+        for condition in self.conditions:
+            product_name = condition["name"].split('_')[-1]
+            if product_name not in products:
+                products.append(product_name)
+        self.product_lanes = {product_name: index % self.workers for index, product_name in enumerate(products)}
+
+        self.stats_lock = threading.Lock()
+        self.processed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        # File event -> Discord post (or -> check() returning, when the run queued no embed)
+        self.latencies = deque(maxlen=1000)
+
+        metrics.callback("alertbot_condition_queue_depth", "Conditions waiting in each processing lane", "gauge", ("lane",),
+                         lambda: {(str(lane),): lane_queue.qsize() for lane, lane_queue in enumerate(self.processing_queues)})
+        metrics.callback("alertbot_cache_lookups_total", "Cache lookups by cache and result", "counter", ("cache", "result"), self.cache_lookups)
+
+        self.processing_threads = []
+        for lane, lane_queue in enumerate(self.processing_queues):
+            thread = threading.Thread(target=self.process_queue, args=(lane_queue,), name=f"conditions-{lane}", daemon=True)
+            thread.start()
+            self.processing_threads.append(thread)
+        self.processing_thread = self.processing_threads[0]
+
+    def enqueue(self, condition, accepted_at, origin=None):
+        # origin: (trace id, file name, settled) of the file event that triggered the condition
+        lane = self.product_lanes.get(condition["name"].split('_')[-1], 0)
+        self.processing_queues[lane].put((condition, time_module.monotonic(), accepted_at, origin))
+
+    def queue_depth(self):
+        return sum(lane_queue.qsize() for lane_queue in self.processing_queues)
+
+    def cache_lookups(self):
+        lookups = {
+            ("file", "hit"): file_cache.hits,
+            ("file", "miss"): file_cache.misses,
+            ("record", "hit"): product_records.hits,
+            ("record", "miss"): product_records.misses,
+        }
+        for product_name, memo in session_contexts.stats().items():
+            lookups[(f"context_{product_name}", "hit")] = memo["reused"]
+            lookups[(f"context_{product_name}", "miss")] = memo["computed"]
+        return lookups
+
+    def record_timing(self, wait):
+        with self.stats_lock:
+            self.processed += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def record_latency(self, latency):
+        with self.stats_lock:
+            self.latencies.append(latency)
+
+    def stats(self):
+        with self.stats_lock:
+            latencies = sorted(self.latencies)
+            processed = self.processed
+            avg_wait = self.total_wait / processed if processed else 0.0
+            max_wait = self.max_wait
+        def percentile(q):
+            return latencies[min(int(q * len(latencies)), len(latencies) - 1)] if latencies else 0.0
+        return {
+            "workers": self.workers,
+            "queue_depth": self.queue_depth(),
+            "processed": processed,
+            "avg_wait": round(avg_wait, 4),
+            "max_wait": round(max_wait, 4),
+            "latency_p50": round(percentile(0.50), 4),
+            "latency_p95": round(percentile(0.95), 4),
+            "latency_max": round(latencies[-1], 4) if latencies else 0.0,
+            "inactive_events": self.inactive_events,
+            **self.schedule.stats(),
+            **self.coalescer.stats(),
+            **self.trigger_stats(),
+        }
+
+    def on_schedule_change(self, activated, deactivated):
+        with self.lock:
+            for condition_name in deactivated:
+                self.updated_conditions[condition_name] = set()
+                self.shadow_updated[condition_name] = set()
+                self.fresh_since.pop(condition_name, None)
+            # Files written while the condition was inactive still count towards all_updated
+            for condition_name in activated:
+                seen = {file_name for file_name in self.conditions_dict[condition_name] if file_name in self.file_updated_at}
+                self.updated_conditions[condition_name] = set(seen)
+                self.shadow_updated[condition_name] = set(seen)
+
+    def staleness_budget(self, file_name):
+        _, file_id = self.extract_product_and_id(file_name)
+        return config.staleness_budgets.get(file_id, config.default_staleness_budget)
+
+    def is_fresh(self, condition_name, file_name, now):
+        # Every other required file has been written within its staleness budget
+        for other in self.conditions_dict[condition_name]:
+            if other == file_name:
+                continue
+            updated_at = self.file_updated_at.get(other)
+            if updated_at is None or now - updated_at > self.staleness_budget(other):
+                return False
+        return True
+
+    def trigger_stats(self):
+        with self.lock:
+            saved = sorted(self.saved_latencies)
+            fired = self.fired
+            stale_skips = self.stale_skips
+        return {
+            "trigger_mode": self.trigger_mode,
+            "fired": fired,
+            "stale_skips": stale_skips,
+            "saved_samples": len(saved),
+            "saved_avg": round(sum(saved) / len(saved), 3) if saved else 0.0,
+            "saved_p50": round(saved[len(saved) // 2], 3) if saved else 0.0,
+            "saved_max": round(saved[-1], 3) if saved else 0.0,
+        }
+
+    def normalize_path(self, path):
+        return os.path.normcase(os.path.abspath(path))
+
     def on_modified(self, event):
 
         if event.is_directory:
             return  
 
-        filepath = os.path.abspath(event.src_path)
+        filepath = self.normalize_path(event.src_path)
+        task = self.path_to_task.get(filepath)
 
-        if filepath in self.file_paths:
-            current_time = time_module.time()
-            last_time = self.last_processed.get(filepath, 0)
-            if current_time - last_time < self.debounce_interval:
+        if task is not None:
+            received = time_module.monotonic()
+            # Every write counts towards stability, including the ones coalesced below
+            file_stability.notify_modified(filepath)
+            current_time = clock.timestamp()
+            # Freshness counts every write, including the ones coalesced below
+            self.file_updated_at[task["name"]] = current_time
+            if not self.schedule.conditions_for(task["name"], current_time):
+                # Outside every dependent window: nothing to track, nothing gets parsed
+                self.inactive_events += 1
                 return
-            else:
-                self.last_processed[filepath] = current_time
+            if filepath not in self.write_started:
+                self.write_started[filepath] = (event_traces.new_id(), received)
+            self.coalescer.touch(filepath, task, current_time)
+            metrics.observe_stage("receipt", time_module.monotonic() - received, task["name"].split('_')[0], "")
 
-            #logger.debug(f" FileChange | Note: {filepath} modified")
+    def on_write_settled(self, filepath, task, first_write, last_write):
+        # Called by the coalescer once per burst of writes to a file
+        trace_id, accepted_at = self.write_started.pop(filepath, (None, time_module.monotonic()))
+        settled_at = time_module.monotonic()
+        metrics.observe_stage("debounce", settled_at - accepted_at, task["name"].split('_')[0], "")
+        self.last_settled[task["name"]] = (trace_id, accepted_at, settled_at)
+        current_time = clock.timestamp()
+        dependent_conditions = self.schedule.conditions_for(task["name"], current_time)
+        if not dependent_conditions:
+            return
 
-            try:
-                task = next((t for t in self.files if os.path.abspath(t["filepath"]) == filepath), None)
-                
-                if task:
-                    file_name = task["name"]
-                    product_name, file_id = self.extract_product_and_id(file_name)
-                    
-                    if not product_name or not file_id:
-                        logger.warning(f" FileChange | FileName: {file_name} | Note: Invalid task name")
-                        return
-
-                    with self.lock:
-                        for condition in self.conditions:
-                            if file_name in condition["required_files"]:
-                                self.updated_conditions[condition["name"]].add(file_name)
-                                #logger.debug(f" FileChange | Condition: {condition['name']} | CurrentQueue: {self.updated_conditions[condition['name']]}")
-                                if self.updated_conditions[condition["name"]] == set(condition["required_files"]):
-                                    if condition["name"] not in self.conditions_in_queue:
-                                        self.processing_queue.put(condition)
-                                        self.conditions_in_queue.add(condition["name"])
-                                        #logger.debug(f" FileChange | Condition: {condition['name']} | Note: All Required Files")
-                                        self.updated_conditions[condition["name"]] = set()
-                                    else:
-                                        pass
-                                        #logger.debug(f" FileChange | Condition: {condition['name']} | Note: Already In Queue")
-                else:
-                    logger.warning(f" FileChange | FilePath: {event.src_path} | Note: No task found for file")
-                    
-            except Exception as e:
-                logger.error(f" FileChange | FilePath: {event.src_path} | Note: Error Processing File: {e}")
+        #logger.debug(f" FileChange | Note: {filepath} modified")
+
+        try:
+            file_name = task["name"]
+
+            with self.lock:
+                for condition in dependent_conditions:
+                    condition_name = condition["name"]
+                    required = self.conditions_dict[condition_name]
+
+                    fresh = self.is_fresh(condition_name, file_name, current_time)
+                    if fresh:
+                        self.fresh_since.setdefault(condition_name, current_time)
+                    shadow = self.shadow_updated[condition_name]
+                    shadow.add(file_name)
+                    if shadow == required:
+                        self.saved_latencies.append(current_time - self.fresh_since.pop(condition_name, current_time))
+                        self.shadow_updated[condition_name] = set()
+
+                    if self.trigger_mode == "freshness":
+                        ready = fresh
+                        if not fresh:
+                            self.stale_skips += 1
+                    else:
+                        updated = self.updated_conditions[condition_name]
+                        updated.add(file_name)
+                        #logger.debug(f" FileChange | Condition: {condition_name} | CurrentQueue: {updated}")
+                        ready = updated == required
+
+                    if ready:
+                        if condition_name not in self.conditions_in_queue:
+                            self.enqueue(condition, accepted_at, (trace_id, file_name, settled_at))
+                            self.conditions_in_queue.add(condition_name)
+                            self.fired += 1
+                            #logger.debug(f" FileChange | Condition: {condition_name} | Note: Ready To Trigger")
+                            self.updated_conditions[condition_name] = set()
+                        else:
+                            pass
+                            #logger.debug(f" FileChange | Condition: {condition_name} | Note: Already In Queue")
+
+        except Exception as e:
+            logger.error(f" FileChange | FilePath: {filepath} | Note: Error Processing File: {e}")
+
+    def on_closed(self, event):
+        if event.is_directory:
+            return
+        filepath = self.normalize_path(event.src_path)
+        if filepath in self.path_to_task:
+            file_stability.notify_closed(filepath)
 
     def extract_product_and_id(self, task_name):
         parts = task_name.split('_')
@@ -91,50 +293,57 @@ class FileChangeHandler(FileSystemEventHandler):
             return None, None
         return parts[0], parts[1]
     
-    def is_now_in_time_range(self, start_time, end_time, now):
-        if start_time <= end_time:
-            return start_time <= now <= end_time
-        else:
-            return now >= start_time or now <= end_time
-        
-    def process_queue(self):
+    def start_trace(self, condition, accepted_at, origin, enqueued_at, dequeued_at):
+        if origin is None:
+            return None
+        trace_id, file_name, settled_at = origin
+        # When each other required file last settled, relative to the triggering write (ms)
+        inputs = {}
+        for required in condition["required_files"]:
+            last = self.last_settled.get(required)
+            if last is not None and required != file_name:
+                inputs[required] = round((last[2] - accepted_at) * 1000, 2)
+        trace = event_traces.start(trace_id, file_name, condition["name"], accepted_at, inputs)
+        if trace is not None:
+            trace.hop("settled", settled_at)
+            trace.hop("enqueued", enqueued_at)
+            trace.hop("dequeued", dequeued_at)
+        return trace
+
+    def process_queue(self, lane_queue=None):
+        lane_queue = lane_queue if lane_queue is not None else self.processing_queue
         while True:
-            condition = self.processing_queue.get()
+            condition, enqueued_at, accepted_at, origin = lane_queue.get()
+            dequeued_at = time_module.monotonic()
+            wait = dequeued_at - enqueued_at
+            trace = self.start_trace(condition, accepted_at, origin, enqueued_at, dequeued_at)
+            event_traces.bind(trace)
+            outcome = "skipped"
             try:
                 condition_name = condition["name"]
+                # Stages recorded on this lane (parse, extract, check, embed) carry the condition's labels
+                metrics.bind(condition_name.split('_')[-1], condition_name)
+                metrics.observe_stage("queue", wait)
+                # Embeds queued by check() record the total once Discord accepts them
+                discord_delivery.bind(accepted_at, self.record_latency)
                 required_files = condition["required_files"]
                 
-                est = ZoneInfo('America/New_York')
-                now = datetime.now(est).time()
-                
-                # Check if condition defines multiple time windows
-                if "time_windows" in condition:
-                    in_range = False
-                    for window in condition["time_windows"]:
-                        start_time = window.get("start_time")
-                        end_time = window.get("end_time")
-                        if start_time and end_time and self.is_now_in_time_range(start_time, end_time, now):
-                            in_range = True
-                            break
-                    if not in_range:
-                        #logger.debug(f" FileChange | Condition: {condition_name} | Note: Not within any specified time window")
-                        continue
-                else:
-                    start_time = condition.get("start_time")
-                    end_time = condition.get("end_time")
-                    if start_time and end_time:
-                        if not self.is_now_in_time_range(start_time, end_time, now):
-                            #logger.debug(f" FileChange | Condition: {condition_name} | Note: Not within the time range")
-                            continue
-                    else:
-                        pass
-                        logger.warning(f" FileChange | Condition: {condition_name} | Note: No time range specified for condition. Proceeding with processing.")
+                # The window may have closed while the condition sat in the queue
+                if not self.schedule.is_active(condition_name, clock.timestamp()):
+                    #logger.debug(f" FileChange | Condition: {condition_name} | Note: Not within the time range")
+                    continue
 
                 logger.debug(f" FileChange | Condition: {condition_name} | Processing: {required_files}")
 
                 tasks = [self.file_to_task[file_name] for file_name in required_files]
 
-                all_variables = Initialization.prep_data(tasks)
+                load_errors = {}
+                sources = {}
+                all_variables = Initialization.prep_data(tasks, errors=load_errors, sources=sources)
+                event_traces.hop("loaded")
+                if load_errors:
+                    logger.error(f" FileChange | Condition: {condition_name} | Note: Skipping, Failed To Load {sorted(load_errors)}")
+                    continue
                 condition_parts = condition_name.split('_')
 
                 if len(condition_parts) != 2:
@@ -154,13 +363,31 @@ class FileChangeHandler(FileSystemEventHandler):
                     logger.error(f" FileChange | Condition: {condition_name} | Note: No Function Prefix Found For {function_prefix}")
                     continue
 
-                function_instance = function_class(product_name, variables)
-                function_instance.check()
+                context = session_contexts.get(product_name, variables, sources.get(product_name))
+                function_instance = function_class(product_name, variables, context=context)
+                with metrics.stage("check"):
+                    function_instance.check()
+                outcome = None
+
+                queued_posts = discord_delivery.unbind()
+                elapsed = time_module.monotonic() - accepted_at
+                self.record_timing(wait)
+                if not queued_posts:
+                    # No alert, or posted inline (async_discord off): the run ends with check()
+                    metrics.observe_stage("total", elapsed)
+                    self.record_latency(elapsed)
+                logger.debug(f" FileChange | Condition: {condition_name} | QueueWait: {wait*1000:.1f}ms | EventToChecked: {elapsed*1000:.1f}ms | PostsQueued: {queued_posts} | QueueDepth: {self.queue_depth()}")
 
                 #logger.debug(f" FileChange | Condition: {condition_name} | Note: Completed Processing")
             except Exception as e:
+                outcome = "error"
                 logger.error(f" FileChange | Condition: {condition['name']} | Note: Error processing condition: {e}")
             finally:
+                # Written to the trace log now, or once its embeds have webhook responses
+                event_traces.checked(trace, outcome)
+                event_traces.unbind()
+                discord_delivery.unbind()
+                metrics.unbind()
                 with self.lock:
                     self.conditions_in_queue.discard(condition["name"])
-                self.processing_queue.task_done()
+                lane_queue.task_done()
@@ -0,0 +1,247 @@
+import os
+import time
+import signal
+import logging
+import threading
+import multiprocessing
+from multiprocessing.connection import wait as wait_connections
+from logging.handlers import QueueHandler
+from alertbot.source.constants import files, conditions, condition_functions
+from alertbot.source.filechange import FileChangeHandler
+from alertbot.source.watcher import create_observer
+from alertbot.alerts.delivery import discord_delivery
+from alertbot.utils.trace import decision_trace, apply_trace_config
+from alertbot.utils.metrics import metrics
+from alertbot.utils.event_trace import event_traces
+from alertbot.utils import config
+
+logger = logging.getLogger(__name__)
+
+# ---------------------- In-Process Monitor ----------------------------- #
+class Monitor:
+    # One watcher and FileChangeHandler over a set of files and conditions: the whole bot when
+    # running in one process, or a single shard
+    def __init__(self, files, conditions, workers):
+        self.handler = FileChangeHandler(files, conditions, workers=workers)
+        # Only the tracked StreamData paths reach the handler; see config.watch_backend
+        self.observer, self.event_filter = create_observer(self.handler, files)
+
+    def start(self):
+        # Condition windows open and close on timers at their boundaries; settled writes flush from the timer wheel
+        self.handler.schedule.start()
+        self.handler.coalescer.start()
+        self.observer.start()
+        # Playbook classes load lazily; warm them now that the watcher is already running
+        threading.Thread(target=condition_functions.preload, name="preload-conditions", daemon=True).start()
+
+    def check(self):
+        # Nothing to supervise in-process
+        pass
+
+    def stats(self):
+        return f"Condition Queue: {self.handler.stats()} | Watcher: {self.event_filter.stats()}"
+
+    def stop(self):
+        self.observer.stop()
+        self.handler.schedule.stop()
+        self.handler.coalescer.stop(flush=False)
+        self.observer.join()
+
+def shard_files(products):
+    return [task for task in files if task["name"].split('_')[0] in products]
+
+def shard_conditions(products):
+    return [condition for condition in conditions if condition["name"].split('_')[-1] in products]
+
+# ---------------------- Shard Process ----------------------------- #
+class PipeWriter:
+    # QueueHandler target that sends log records up the shard's pipe. Each shard has its own
+    # pipe, so a shard that dies mid-send cannot leave a lock held for the others.
+    def __init__(self, conn):
+        self.conn = conn
+        self.lock = threading.Lock()
+
+    def put_nowait(self, record):
+        with self.lock:
+            self.conn.send(record)
+
+def run_shard(name, products, conn, external, metrics_port):
+    # Child process entry point. Ctrl+C is left to the supervisor, which sends "stop" down the
+    # pipe; the pipe closing (supervisor gone) stops the shard too. ("external", values) messages
+    # carry impvol/bias refreshed after the shard spawned.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.addHandler(QueueHandler(PipeWriter(conn)))
+    # Impvol/bias as the supervisor had them when it spawned this shard
+    for variable, value in external.items():
+        setattr(config, variable, value)
+    apply_trace_config(config)
+    metrics.enabled = config.metrics_enabled
+    if config.metrics_enabled:
+        metrics.serve(config.metrics_host, metrics_port)
+    os.makedirs(os.path.join(os.getcwd(), 'logs'), exist_ok=True)
+    event_traces.enabled = config.event_trace_enabled
+    if config.event_trace_enabled:
+        base, extension = os.path.splitext(config.event_trace_path)
+        event_traces.open(os.path.join(os.getcwd(), f"{base}-{name}{extension}"))
+    trace_path = os.path.join(os.getcwd(), 'logs', f'Decisions-{name}.log')
+    dump_signal = getattr(signal, "SIGUSR1", None) or getattr(signal, "SIGBREAK", None)
+    if dump_signal is not None:
+        signal.signal(dump_signal, lambda signum, frame: decision_trace.dump(trace_path))
+
+    monitor = Monitor(shard_files(products), shard_conditions(products), workers=min(config.condition_workers, len(products)))
+    monitor.start()
+    logger.info(f" Shard | {name} | Note: Monitoring {products} (pid {os.getpid()})")
+    try:
+        last_stats = time.time()
+        while True:
+            if conn.poll(1):
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    break
+                if message == "stop":
+                    break
+                if isinstance(message, tuple) and message[0] == "external":
+                    for variable, value in message[1].items():
+                        setattr(config, variable, value)
+                    logger.info(f" Shard | {name} | Note: External Data Updated")
+            if time.time() - last_stats >= 60:
+                logger.debug(f" Shard | {name} | {monitor.stats()}")
+                last_stats = time.time()
+    finally:
+        monitor.stop()
+        discord_delivery.stop(timeout=10)
+        event_traces.close()
+        decision_trace.dump(trace_path)
+        try:
+            logger.info(f" Shard | {name} | Note: Stopped")
+        except OSError:
+            pass
+
+# ---------------------- Supervisor ----------------------------- #
+class Shard:
+    __slots__ = ("name", "products", "metrics_port", "process", "conn", "started_at", "restarts", "restart_delay", "restart_at", "external")
+
+    def __init__(self, products, metrics_port):
+        self.name = "-".join(products)
+        self.metrics_port = metrics_port
+        self.products = list(products)
+        self.process = None
+        self.conn = None
+        self.started_at = 0.0
+        self.restarts = 0
+        self.restart_delay = config.shard_restart_delay
+        self.restart_at = None
+        # Impvol/bias values the shard was last given
+        self.external = None
+
+class ShardSupervisor:
+    # Spawns one process per product group and restarts any that exit, backing off while a shard
+    # keeps crashing. Shard log records come back over each shard's pipe and go through this
+    # process's handlers, so System.log has a single writer.
+    def __init__(self, groups, stable_after=300.0):
+        self.context = multiprocessing.get_context("spawn")
+        # The supervisor serves config.metrics_port; shard i serves the port i + 1 above it
+        self.shards = [Shard(products, config.metrics_port + 1 + index) for index, products in enumerate(groups)]
+        self.stable_after = stable_after
+        self.stopping = False
+        self._log_thread = None
+
+    def forward_logs(self):
+        # Runs until stopping and every shard's pipe has closed, so final shard logs get through
+        while True:
+            connections = [shard.conn for shard in self.shards if shard.conn is not None]
+            if not connections:
+                if self.stopping:
+                    break
+                time.sleep(0.5)
+                continue
+            for conn in wait_connections(connections, timeout=0.5):
+                try:
+                    record = conn.recv()
+                except (EOFError, OSError):
+                    # Shard exited; check() notices and respawns it with a new pipe
+                    for shard in self.shards:
+                        if shard.conn is conn:
+                            shard.conn = None
+                    conn.close()
+                    continue
+                logging.getLogger(record.name).handle(record)
+
+    def spawn(self, shard):
+        external = {name: getattr(config, name) for name in config.external_names}
+        parent_conn, child_conn = self.context.Pipe()
+        shard.process = self.context.Process(target=run_shard, name=f"shard-{shard.name}",
+                                             args=(shard.name, shard.products, child_conn, external, shard.metrics_port), daemon=False)
+        shard.process.start()
+        child_conn.close()
+        shard.conn = parent_conn
+        shard.external = external
+        shard.started_at = time.monotonic()
+        shard.restart_at = None
+        logger.info(f" Supervisor | spawn | Shard: {shard.name} | Pid: {shard.process.pid}")
+
+    def start(self):
+        for shard in self.shards:
+            self.spawn(shard)
+        self._log_thread = threading.Thread(target=self.forward_logs, name="shard-logs", daemon=True)
+        self._log_thread.start()
+
+    def push_external(self, shard, external):
+        # The background Sheets refresh can land after the shards spawned
+        try:
+            shard.conn.send(("external", external))
+        except OSError as e:
+            logger.error(f" Supervisor | push_external | Shard: {shard.name} | Note: Send Failed: {e}")
+            return
+        shard.external = external
+        logger.info(f" Supervisor | push_external | Shard: {shard.name} | Note: Sent Refreshed External Data")
+
+    def check(self):
+        if self.stopping:
+            return
+        now = time.monotonic()
+        external = {name: getattr(config, name) for name in config.external_names}
+        for shard in self.shards:
+            if shard.process.is_alive():
+                if shard.conn is not None and shard.external != external:
+                    self.push_external(shard, external)
+                if now - shard.started_at >= self.stable_after:
+                    shard.restart_delay = config.shard_restart_delay
+                continue
+            if shard.restart_at is None:
+                shard.restart_at = now + shard.restart_delay
+                logger.error(f" Supervisor | check | Shard: {shard.name} | Note: Exited With Code {shard.process.exitcode}, Restarting In {shard.restart_delay:.0f}s")
+                shard.restart_delay = min(shard.restart_delay * 2, config.shard_max_restart_delay)
+            elif now >= shard.restart_at:
+                shard.restarts += 1
+                self.spawn(shard)
+
+    def stats(self):
+        return "Shards: " + str({shard.name: {"pid": shard.process.pid, "alive": shard.process.is_alive(), "restarts": shard.restarts} for shard in self.shards})
+
+    def stop(self, timeout=15):
+        self.stopping = True
+        for shard in self.shards:
+            try:
+                if shard.conn is not None:
+                    shard.conn.send("stop")
+            except OSError:
+                pass
+        deadline = time.monotonic() + timeout
+        for shard in self.shards:
+            shard.process.join(max(deadline - time.monotonic(), 0))
+            if shard.process.is_alive():
+                logger.warning(f" Supervisor | stop | Shard: {shard.name} | Note: Did Not Stop, Terminating")
+                shard.process.terminate()
+                shard.process.join(1)
+        if self._log_thread is not None:
+            self._log_thread.join(timeout=5)
+
+def create_monitor():
+    if config.process_shards:
+        return ShardSupervisor(config.shard_groups)
+    return Monitor(files, conditions, workers=config.condition_workers)
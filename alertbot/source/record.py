@@ -0,0 +1,201 @@
+import math
+import logging
+import threading
+import numpy as np
+from collections import OrderedDict
+from collections.abc import Mapping
+from alertbot.source.extraction import file_layouts, product_periods, period_equity
+
+logger = logging.getLogger(__name__)
+
+# ---------------------- Record Layout ----------------------------- #
+# Every variable a product can have is known up front from the file layouts, so a product's
+# snapshot is a fixed-slot record instead of a dict keyed by f-strings:
+#   ES_IB_HIGH        -> record.ib_high
+#   ES_C_HIGH         -> record.period_high[2]      (period ordinal, NaN when missing)
+#   ES_ETH_VWAP_C     -> record.eth_vwap_period[2]
+# Names that are not identifiers get an explicit attribute.
+attribute_names = {
+    "5D_VPOC": "vpoc_5d",
+    "20D_VPOC": "vpoc_20d",
+}
+
+def attribute_name(variable):
+    if variable in attribute_names:
+        return attribute_names[variable]
+    return variable.replace("{period}", "period").lower()
+
+scalar_fields = []
+vector_fields = []
+for entries in file_layouts.values():
+    for variable, _, _ in entries:
+        field = attribute_name(variable)
+        target = vector_fields if "{period}" in variable else scalar_fields
+        if field not in target:
+            target.append(field)
+
+class RecordLayout:
+    __slots__ = ("product_name", "periods", "period_index", "keys")
+
+    def __init__(self, product_name):
+        self.product_name = product_name
+        self.periods = list(product_periods.get(product_name, period_equity))
+        self.period_index = {period: ordinal for ordinal, period in enumerate(self.periods)}
+        # Full variable name -> (field, period ordinal or None)
+        self.keys = {}
+        for entries in file_layouts.values():
+            for variable, _, _ in entries:
+                field = attribute_name(variable)
+                if "{period}" in variable:
+                    for ordinal, period in enumerate(self.periods):
+                        self.keys[f"{product_name}_{variable.format(period=period)}"] = (field, ordinal)
+                else:
+                    self.keys[f"{product_name}_{variable}"] = (field, None)
+
+_layouts = {}
+
+def record_layout(product_name):
+    layout = _layouts.get(product_name)
+    if layout is None:
+        layout = _layouts[product_name] = RecordLayout(product_name)
+    return layout
+
+# ---------------------- Product Record ----------------------------- #
+class ProductRecord(Mapping):
+    # Read-only Mapping over the same "<PRODUCT>_<NAME>" keys prep_data used to return, so
+    # variables.get(...) call sites keep working; missing values are absent keys (None from get).
+    __slots__ = ("product_name", "layout", "_views") + tuple(scalar_fields) + tuple(vector_fields)
+
+    def __init__(self, product_name):
+        self.product_name = product_name
+        self.layout = record_layout(product_name)
+        self._views = {}
+        for field in scalar_fields:
+            setattr(self, field, None)
+        for field in vector_fields:
+            setattr(self, field, np.full(len(self.layout.periods), np.nan))
+
+    def fill(self, variables):
+        self._views.clear()
+        keys = self.layout.keys
+        for name, value in variables.items():
+            target = keys.get(name)
+            if target is None:
+                logger.debug(" Record | fill | Product: %s | Note: No Slot For %s", self.product_name, name)
+                continue
+            field, ordinal = target
+            if ordinal is None:
+                setattr(self, field, value)
+            else:
+                getattr(self, field)[ordinal] = value
+        return self
+
+    # ---------------------- Period Vectors ----------------------------- #
+    def started_periods(self, now):
+        # Number of periods whose bracket has started at clock time `now` (A.. in order)
+        periods = product_periods.get(self.product_name, period_equity)
+        return sum(1 for period in self.layout.periods if periods[period] <= now)
+
+    def values(self, field):
+        # The vector as a list of floats with None for missing periods, for per-period loops
+        values = self._views.get(field)
+        if values is None:
+            values = [None if math.isnan(value) else value for value in getattr(self, field).tolist()]
+            self._views[field] = values
+        return values
+
+    def period(self, field, period):
+        ordinal = self.layout.period_index.get(period)
+        if ordinal is None:
+            return None
+        return self.values(field)[ordinal]
+
+    def rounded(self, field, digits=2):
+        # Python round() per element, cached, so comparisons match safe_round() exactly
+        key = (field, digits)
+        vector = self._views.get(key)
+        if vector is None:
+            vector = np.array([np.nan if value is None else round(value, digits) for value in self.values(field)])
+            self._views[key] = vector
+        return vector
+
+    def extension_period(self, count, ib_high=None, ib_low=None):
+        # Ordinal of the first of the first `count` periods that extends the IB
+        if ib_high is not None:
+            hits = np.flatnonzero(self.rounded("period_high")[:count] > ib_high)
+        else:
+            hits = np.flatnonzero(self.rounded("period_low")[:count] < ib_low)
+        return int(hits[0]) if hits.size else None
+
+    def vwap_touched(self, start, stop, side):
+        # Any period in [start, stop) whose low ("low") or high ("high") reached its ETH VWAP;
+        # periods missing either value are skipped
+        vwap = self.rounded("eth_vwap_period")[start:stop]
+        if side == "low":
+            return bool((self.rounded("period_low")[start:stop] <= vwap).any())
+        return bool((self.rounded("period_high")[start:stop] >= vwap).any())
+
+    # ---------------------- Mapping View ----------------------------- #
+    def get(self, key, default=None):
+        target = self.layout.keys.get(key)
+        if target is None:
+            return default
+        field, ordinal = target
+        if ordinal is None:
+            value = getattr(self, field)
+            return default if value is None else value
+        value = self.values(field)[ordinal]
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        for key in self.layout.keys:
+            if self.get(key) is not None:
+                yield key
+
+    def __len__(self):
+        count = sum(1 for field in scalar_fields if getattr(self, field) is not None)
+        return count + sum(int(np.count_nonzero(~np.isnan(getattr(self, field)))) for field in vector_fields)
+
+    def __repr__(self):
+        return f"ProductRecord({self.product_name}, {dict(self.items())})"
+
+# ---------------------- Record Cache ----------------------------- #
+class ProductRecords:
+    # One record per product snapshot: conditions loading the same file versions share it
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._records = OrderedDict()
+        self._lock = threading.Lock()
+
+    def build(self, product_name, entries):
+        # entries: [(file id, CacheEntry)] for the product's loaded files
+        key = (product_name,) + tuple(sorted((file_id, entry.key) for file_id, entry in entries))
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None:
+                self.hits += 1
+                self._records.move_to_end(key)
+                return record
+        record = ProductRecord(product_name)
+        for _, entry in entries:
+            record.fill(entry.variables)
+        with self._lock:
+            self.misses += 1
+            self._records[key] = record
+            while len(self._records) > self.maxsize:
+                self._records.popitem(last=False)
+        return record
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+product_records = ProductRecords()
@@ -0,0 +1,231 @@
+import os
+import re
+import json
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from watchdog.events import FileModifiedEvent
+from alertbot.utils import config
+from alertbot.utils import clock
+from alertbot.source.constants import files, conditions
+from alertbot.source.cache import file_cache
+from alertbot.source.stability import file_stability
+from alertbot.alerts.delivery import discord_delivery
+from alertbot.alerts.context import session_contexts
+
+logger = logging.getLogger(__name__)
+
+# A recording is a directory of snapshots, one sub-directory per capture time (America/New_York):
+#   <recording>/20250407-093015/StreamDataES_1.tsv
+# Each snapshot holds the StreamData files that changed since the previous one.
+snapshot_format = "%Y%m%d-%H%M%S"
+est = ZoneInfo('America/New_York')
+
+webhook_names = [
+    "DISCORD_PLAYBOOK_ES_WEBHOOK", "DISCORD_PLAYBOOK_NQ_WEBHOOK", "DISCORD_PLAYBOOK_RTY_WEBHOOK", "DISCORD_PLAYBOOK_CL_WEBHOOK",
+    "DISCORD_CONTEXT_ES_WEBHOOK", "DISCORD_CONTEXT_NQ_WEBHOOK", "DISCORD_CONTEXT_RTY_WEBHOOK", "DISCORD_CONTEXT_CL_WEBHOOK",
+]
+
+def file_basename(filepath):
+    # Task paths are Windows paths; split on either separator so this works on any host
+    return re.split(r"[\\/]", filepath)[-1]
+
+def list_snapshots(recording_dir):
+    snapshots = []
+    for entry in sorted(os.listdir(recording_dir)):
+        try:
+            captured_at = datetime.strptime(entry, snapshot_format).replace(tzinfo=est)
+        except ValueError:
+            continue
+        snapshots.append((captured_at, os.path.join(recording_dir, entry)))
+    return snapshots
+
+# ---------------------- Recording ----------------------------- #
+def record(out_dir, interval=5.0, duration=None, tasks=None):
+    tasks = tasks if tasks is not None else files
+    os.makedirs(out_dir, exist_ok=True)
+    last_seen = {}
+    started = time.monotonic()
+    while duration is None or time.monotonic() - started < duration:
+        changed = []
+        for task in tasks:
+            try:
+                stat = os.stat(task["filepath"])
+            except OSError:
+                continue
+            key = (stat.st_mtime_ns, stat.st_size)
+            if last_seen.get(task["filepath"]) != key:
+                last_seen[task["filepath"]] = key
+                changed.append(task)
+        if changed:
+            snapshot_dir = os.path.join(out_dir, datetime.now(est).strftime(snapshot_format))
+            os.makedirs(snapshot_dir, exist_ok=True)
+            for task in changed:
+                shutil.copy2(task["filepath"], os.path.join(snapshot_dir, file_basename(task["filepath"])))
+            logger.debug(f" Replay | record | Snapshot: {os.path.basename(snapshot_dir)} | Files: {len(changed)}")
+        time.sleep(interval)
+
+# ---------------------- Replay ----------------------------- #
+class CapturedResponse:
+    status_code = 204
+    headers = {}
+    text = ""
+
+    def json(self):
+        return {}
+
+class SessionReplay:
+    def __init__(self, recording_dir, workers=None, work_dir=None, external_snapshot=None):
+        self.recording_dir = recording_dir
+        self.external_snapshot = external_snapshot
+        self.workers = workers if workers is not None else config.condition_workers
+        self.work_dir = work_dir
+        self.embeds = []
+        self.webhook_labels = {}
+
+    def capture(self, url, payload):
+        self.embeds.append({
+            "time": clock.now(est).strftime("%Y-%m-%d %H:%M:%S"),
+            "webhook": self.webhook_labels.get(url, url),
+            "username": payload.get("username"),
+            "embeds": payload.get("embeds", []),
+        })
+        return CapturedResponse()
+
+    def prepare(self, work_dir):
+        # Point every task at the scratch copy and every webhook at the capture transport
+        replay_files = [dict(task, filepath=os.path.join(work_dir, file_basename(task["filepath"]))) for task in files]
+        for name in webhook_names:
+            url = f"https://replay.invalid/{name.lower()}"
+            os.environ[name] = url
+            self.webhook_labels[url] = name.replace("DISCORD_", "").replace("_WEBHOOK", "").lower()
+        config.async_discord = True
+        discord_delivery.transport = self.capture
+        # Impvol and bias come from the saved startup snapshot, whatever its age
+        if config.load_external_snapshot(self.external_snapshot, max_age=float("inf")) is None:
+            logger.warning(" Replay | prepare | Note: No External Data Snapshot, Playbooks Needing Impvol/Bias Will Error")
+        return replay_files
+
+    def run(self):
+        from alertbot.source.filechange import FileChangeHandler
+        snapshots = list_snapshots(self.recording_dir)
+        if not snapshots:
+            raise ValueError(f" Replay | run | Note: No Snapshots Found In {self.recording_dir}")
+
+        work_dir = self.work_dir or tempfile.mkdtemp(prefix="alertbot-replay-")
+        os.makedirs(work_dir, exist_ok=True)
+        replay_files = self.prepare(work_dir)
+        by_basename = {file_basename(task["filepath"]): task for task in replay_files}
+
+        simulated = clock.SimulatedClock(snapshots[0][0])
+        previous_clock = clock.set_clock(simulated)
+        # Snapshots land via os.replace, so they are complete the moment they appear
+        previous_quiet_period = file_stability.quiet_period
+        file_stability.quiet_period = 0.0
+        started = time.monotonic()
+        file_events = 0
+        try:
+            handler = FileChangeHandler(replay_files, conditions, workers=self.workers)
+            for captured_at, snapshot_dir in snapshots:
+                simulated.set(captured_at)
+                for name in sorted(os.listdir(snapshot_dir)):
+                    task = by_basename.get(name)
+                    if task is None:
+                        continue
+                    target = task["filepath"]
+                    tmp_path = f"{target}.tmp"
+                    shutil.copyfile(os.path.join(snapshot_dir, name), tmp_path)
+                    os.replace(tmp_path, target)
+                    # Whole-file rewrite: drop cached frames before the event goes out
+                    file_cache.invalidate(target)
+                    handler.on_modified(FileModifiedEvent(target))
+                    file_events += 1
+                # A snapshot is one complete burst, so its writes settle at the capture time
+                handler.coalescer.flush()
+                for lane_queue in handler.processing_queues:
+                    lane_queue.join()
+                discord_delivery.flush()
+        finally:
+            clock.set_clock(previous_clock)
+            file_stability.quiet_period = previous_quiet_period
+            discord_delivery.transport = None
+            if self.work_dir is None:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+        wall = time.monotonic() - started
+        simulated_seconds = (snapshots[-1][0] - snapshots[0][0]).total_seconds()
+        return {
+            "snapshots": len(snapshots),
+            "file_events": file_events,
+            "embeds": len(self.embeds),
+            "session_start": snapshots[0][0].strftime("%H:%M:%S"),
+            "session_end": snapshots[-1][0].strftime("%H:%M:%S"),
+            "wall_seconds": round(wall, 3),
+            "speedup": round(simulated_seconds / wall, 1) if wall > 0 else None,
+            "conditions": handler.stats(),
+            "session_contexts": session_contexts.stats(),
+        }
+
+# ---------------------- Parity ----------------------------- #
+def embed_key(captured):
+    # set_timestamp() stamps the real send time, so it is left out of the comparison
+    embeds = [{key: value for key, value in embed.items() if key != "timestamp"} for embed in captured["embeds"]]
+    return json.dumps([captured["time"], captured["webhook"], embeds], sort_keys=True)
+
+def compare(captured, baseline):
+    current_keys = [embed_key(item) for item in captured]
+    baseline_keys = [embed_key(item) for item in baseline]
+    missing = [key for key in baseline_keys if key not in current_keys]
+    extra = [key for key in current_keys if key not in baseline_keys]
+    return missing, extra
+
+def load_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded StreamData session under a simulated clock")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    record_parser = subparsers.add_parser("record", help="Snapshot the live StreamData files while the market runs")
+    record_parser.add_argument("out_dir")
+    record_parser.add_argument("--interval", type=float, default=5.0)
+    record_parser.add_argument("--duration", type=float, default=None)
+    replay_parser = subparsers.add_parser("replay", help="Drive a recording through FileChangeHandler and capture embeds")
+    replay_parser.add_argument("recording_dir")
+    replay_parser.add_argument("--workers", type=int, default=None)
+    replay_parser.add_argument("--external", default=None, help="External data snapshot (defaults to config.external_snapshot_path)")
+    replay_parser.add_argument("--embeds-out", default=None)
+    replay_parser.add_argument("--compare", default=None, help="Embeds JSONL from a previous replay to check parity against")
+    replay_parser.add_argument("--trigger-mode", choices=("all_updated", "freshness"), default=None, help="Overrides config.trigger_mode")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.command == "record":
+        record(args.out_dir, args.interval, args.duration)
+        return
+
+    if args.trigger_mode:
+        config.trigger_mode = args.trigger_mode
+    replay = SessionReplay(args.recording_dir, workers=args.workers, external_snapshot=args.external)
+    summary = replay.run()
+    print(json.dumps(summary, indent=2))
+    if args.embeds_out:
+        with open(args.embeds_out, "w", encoding="utf-8") as f:
+            for item in replay.embeds:
+                f.write(json.dumps(item) + "\n")
+    if args.compare:
+        missing, extra = compare(replay.embeds, load_jsonl(args.compare))
+        print(f" Replay | compare | Missing: {len(missing)} | Extra: {len(extra)}")
+        for key in missing:
+            print(f"   - {key}")
+        for key in extra:
+            print(f"   + {key}")
+        if missing or extra:
+            raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
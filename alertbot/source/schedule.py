@@ -0,0 +1,139 @@
+import logging
+import threading
+import time as time_module
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from alertbot.source.constants import product_hours
+from alertbot.utils import clock
+
+logger = logging.getLogger(__name__)
+
+est = ZoneInfo('America/New_York')
+
+def in_window(start_time, end_time, now):
+    # Inclusive at both ends; a start after the end wraps past midnight
+    if start_time <= end_time:
+        return start_time <= now <= end_time
+    return now >= start_time or now <= end_time
+
+def in_product_hours(product_name, now):
+    hours = product_hours.get(product_name)
+    return hours is not None and in_window(hours[0], hours[1], now)
+
+def condition_windows(condition):
+    # [(start, end)] for the condition, or None when it has no time range (always active)
+    if "time_windows" in condition:
+        return [(window["start_time"], window["end_time"]) for window in condition["time_windows"]
+                if window.get("start_time") and window.get("end_time")]
+    start_time = condition.get("start_time")
+    end_time = condition.get("end_time")
+    if start_time and end_time:
+        return [(start_time, end_time)]
+    return None
+
+# ---------------------- Schedule Index ----------------------------- #
+class ScheduleIndex:
+    # Which conditions are inside their time windows right now, and which of them each file
+    # feeds. The active set only changes at window boundaries: a timer thread (start) refreshes
+    # it there in live mode, and conditions_for/is_active refresh lazily once a boundary has
+    # passed, which also covers a simulated clock.
+    def __init__(self, conditions, on_change=None):
+        self.conditions = {condition["name"]: condition for condition in conditions}
+        self.windows = {}
+        for name, condition in self.conditions.items():
+            windows = condition_windows(condition)
+            if windows is None:
+                logger.warning(f" Schedule | Condition: {name} | Note: No Time Range Specified, Always Active")
+            self.windows[name] = windows
+        # Activation happens at a window's start, deactivation just after its (inclusive) end
+        self.boundaries = sorted({start for windows in self.windows.values() if windows for start, _ in windows}
+                                 | {(datetime.combine(datetime.min, end) + timedelta(microseconds=1)).time()
+                                    for windows in self.windows.values() if windows for _, end in windows})
+        self.on_change = on_change
+        self.active = frozenset()
+        self.active_files = {}
+        self.next_refresh = float("-inf")
+        self.refreshes = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._timer = None
+
+    def is_in_window(self, name, now):
+        windows = self.windows[name]
+        if windows is None:
+            return True
+        return any(in_window(start_time, end_time, now) for start_time, end_time in windows)
+
+    def next_boundary(self, current):
+        # First boundary strictly after `current` (an ET datetime), today or tomorrow
+        for day in (current.date(), current.date() + timedelta(days=1)):
+            for boundary in self.boundaries:
+                candidate = datetime.combine(day, boundary, tzinfo=est)
+                if candidate > current:
+                    return candidate
+        return None
+
+    def refresh(self):
+        with self._lock:
+            current = clock.now(est)
+            now = current.time()
+            active = frozenset(name for name in self.conditions if self.is_in_window(name, now))
+            activated = active - self.active
+            deactivated = self.active - active
+            self.active = active
+            active_files = {}
+            for name in self.conditions:
+                if name in active:
+                    for file_name in self.conditions[name]["required_files"]:
+                        active_files.setdefault(file_name, []).append(self.conditions[name])
+            self.active_files = active_files
+            boundary = self.next_boundary(current)
+            self.next_refresh = boundary.timestamp() if boundary else float("inf")
+            self.refreshes += 1
+            if activated or deactivated:
+                logger.debug(f" Schedule | refresh | Activated: {sorted(activated)} | Deactivated: {sorted(deactivated)} | Active: {len(active)}")
+                if self.on_change:
+                    self.on_change(activated, deactivated)
+            return active
+
+    def conditions_for(self, file_name, timestamp):
+        # Active conditions the file feeds; empty outside every window
+        if timestamp >= self.next_refresh:
+            self.refresh()
+        return self.active_files.get(file_name, ())
+
+    def is_active(self, name, timestamp):
+        if timestamp >= self.next_refresh:
+            self.refresh()
+        return name in self.active
+
+    # ---------------------- Boundary Timer ----------------------------- #
+    def start(self):
+        if self._timer is not None:
+            return
+        self._stop.clear()
+        self.refresh()
+        self._timer = threading.Thread(target=self._run, name="schedule-index", daemon=True)
+        self._timer.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            delay = self.next_refresh - clock.timestamp()
+            # Waits are capped so a suspended machine or clock change can't strand the index
+            if self._stop.wait(min(max(delay, 0.0), 60.0)):
+                break
+            if clock.timestamp() >= self.next_refresh:
+                self.refresh()
+
+    def stop(self):
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.join(timeout=1)
+            self._timer = None
+
+    def stats(self):
+        return {
+            "active_conditions": len(self.active),
+            "schedule_refreshes": self.refreshes,
+            "next_boundary": datetime.fromtimestamp(self.next_refresh, est).strftime("%H:%M:%S") if self.next_refresh not in (float("inf"), float("-inf")) else None,
+        }
@@ -0,0 +1,95 @@
+import os
+import time
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+class FileState:
+    __slots__ = ("last_event", "closed", "closed_stat")
+
+    def __init__(self):
+        self.last_event = 0.0
+        self.closed = False
+        self.closed_stat = None
+
+class FileStabilityTracker:
+    def __init__(self, quiet_period=0.25):
+        self.quiet_period = quiet_period
+        self._states = {}
+        self._lock = threading.Lock()
+        self._waits = {}
+
+    def normalize(self, filepath):
+        return os.path.normcase(os.path.abspath(filepath))
+
+    def _state(self, filepath):
+        key = self.normalize(filepath)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states.setdefault(key, FileState())
+        return state
+
+    # ---------------------- Watchdog Notifications ----------------------------- #
+    def notify_modified(self, filepath):
+        state = self._state(filepath)
+        with self._lock:
+            state.last_event = time.monotonic()
+            state.closed = False
+            state.closed_stat = None
+
+    def notify_closed(self, filepath):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return
+        state = self._state(filepath)
+        with self._lock:
+            state.last_event = time.monotonic()
+            state.closed = True
+            state.closed_stat = (stat.st_mtime_ns, stat.st_size)
+
+    # ---------------------- Stability Checks ----------------------------- #
+    def is_stable(self, filepath, stat):
+        if stat.st_size <= 0:
+            return False
+        state = self._state(filepath)
+        with self._lock:
+            # Writer closed the file and nothing touched it since: known complete.
+            if state.closed and state.closed_stat == (stat.st_mtime_ns, stat.st_size):
+                return True
+            quiet_since_event = time.monotonic() - state.last_event >= self.quiet_period
+        # Platforms without close-write events (Windows) fall back to a quiet period
+        # measured both from our last notification and from the file's own mtime.
+        quiet_since_write = time.time() - stat.st_mtime >= self.quiet_period
+        return quiet_since_event and quiet_since_write
+
+    def time_until_quiet(self, filepath, stat):
+        state = self._state(filepath)
+        with self._lock:
+            since_event = time.monotonic() - state.last_event
+        since_write = time.time() - stat.st_mtime
+        return max(self.quiet_period - min(since_event, since_write), 0.0)
+
+    # ---------------------- Wait Reporting ----------------------------- #
+    def record_wait(self, filepath, waited, attempts):
+        key = self.normalize(filepath)
+        with self._lock:
+            count, total, worst, _, _ = self._waits.get(key, (0, 0.0, 0.0, 0.0, 0))
+            self._waits[key] = (count + 1, total + waited, max(worst, waited), waited, attempts)
+        logger.debug(f" Stability | record_wait | File: {os.path.basename(filepath)} | Waited: {waited*1000:.1f}ms | Attempts: {attempts}")
+
+    def stats(self):
+        with self._lock:
+            return {
+                path: {
+                    "reads": count,
+                    "avg_wait": round(total / count, 4),
+                    "max_wait": round(worst, 4),
+                    "last_wait": round(last, 4),
+                    "last_attempts": attempts,
+                }
+                for path, (count, total, worst, last, attempts) in self._waits.items()
+            }
+
+file_stability = FileStabilityTracker(quiet_period=0.25)
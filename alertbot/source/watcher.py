@@ -0,0 +1,147 @@
+import os
+import time
+import logging
+import threading
+from watchdog.events import FileSystemEventHandler, FileModifiedEvent, EVENT_TYPE_MODIFIED
+from watchdog.observers import Observer
+from alertbot.source.stability import file_stability
+from alertbot.utils import config
+
+logger = logging.getLogger(__name__)
+
+# The SierraChart data directory also holds the .scid/.dly files of every tracked symbol, so
+# most events the observer sees are for files we never read. FilteredEventHandler sits in
+# front of FileChangeHandler and drops those with a set lookup on the raw event path, before
+# any normalization or handler work.
+
+def watch_directories(files):
+    return sorted({os.path.dirname(os.path.abspath(task["filepath"])) for task in files})
+
+class FilteredEventHandler(FileSystemEventHandler):
+    def __init__(self, handler, files, coalesce_interval=None):
+        self.handler = handler
+        self.coalesce_interval = config.coalesce_interval if coalesce_interval is None else coalesce_interval
+        # Raw event paths exactly as the observers build them (watch directory + file name);
+        # anything else falls back to a case-insensitive basename check, then normalization
+        self.paths = frozenset(os.path.join(os.path.dirname(os.path.abspath(task["filepath"])), os.path.basename(task["filepath"])) for task in files)
+        self.basenames = frozenset(os.path.basename(task["filepath"]).lower() for task in files)
+        self.normalized = frozenset(handler.normalize_path(task["filepath"]) for task in files)
+        self.last_forwarded = {}
+        self.received = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.accepted = 0
+
+    def is_tracked(self, path):
+        if path in self.paths:
+            return True
+        name = path.replace("\\", "/").rpartition("/")[2].lower()
+        return name in self.basenames and self.handler.normalize_path(path) in self.normalized
+
+    def dispatch(self, event):
+        self.received += 1
+        if event.is_directory or not self.is_tracked(event.src_path):
+            self.dropped += 1
+            return
+        if event.event_type == EVENT_TYPE_MODIFIED:
+            now = time.monotonic()
+            last = self.last_forwarded.get(event.src_path)
+            if last is not None and now - last < self.coalesce_interval:
+                # Part of the same write burst: the handler would debounce it anyway, but the
+                # stability tracker still needs to know the file is being written
+                file_stability.notify_modified(event.src_path)
+                self.coalesced += 1
+                return
+            self.last_forwarded[event.src_path] = now
+        self.accepted += 1
+        self.handler.dispatch(event)
+
+    def stats(self):
+        return {
+            "events_received": self.received,
+            "events_dropped": self.dropped,
+            "events_coalesced": self.coalesced,
+            "events_accepted": self.accepted,
+        }
+
+# ---------------------- Polling Backend ----------------------------- #
+class ScandirObserver:
+    # Observer-compatible poller: one os.scandir per watched directory per interval, stat only
+    # for the tracked names (on Windows the scandir entry already carries the stat), and a
+    # FileModifiedEvent for each file whose mtime or size changed.
+    def __init__(self, files, interval=None):
+        self.interval = config.poll_interval if interval is None else interval
+        self.tracked = {}
+        for task in files:
+            directory = os.path.dirname(os.path.abspath(task["filepath"]))
+            self.tracked.setdefault(directory, set()).add(os.path.basename(task["filepath"]).lower())
+        self.watches = []
+        self.signatures = {}
+        self.polls = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def schedule(self, event_handler, path, recursive=False):
+        self.watches.append((event_handler, os.path.abspath(path)))
+
+    def scan(self, directory):
+        # {path: (mtime_ns, size)} for the tracked files in one directory listing
+        names = self.tracked.get(directory, ())
+        found = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.lower() in names:
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        found[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError as e:
+            logger.error(f" Watcher | scan | Directory: {directory} | Note: Scan Failed: {e}")
+        return found
+
+    def poll(self):
+        self.polls += 1
+        for event_handler, directory in self.watches:
+            for path, signature in self.scan(directory).items():
+                previous = self.signatures.get(path)
+                self.signatures[path] = signature
+                if previous is not None and previous != signature:
+                    event_handler.dispatch(FileModifiedEvent(path))
+
+    def run(self):
+        # The first pass only records signatures; changes are reported from the second on
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f" Watcher | run | Note: Poll Failed: {e}")
+            self._stop.wait(max(self.interval - (time.monotonic() - started), 0.0))
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="scandir-observer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+def create_observer(handler, files, backend=None):
+    # Returns (observer, filter) with the filter scheduled on every directory holding a tracked file
+    backend = backend or config.watch_backend
+    event_filter = FilteredEventHandler(handler, files)
+    if backend == "polling":
+        observer = ScandirObserver(files)
+    else:
+        if backend != "native":
+            logger.warning(f" Watcher | create_observer | Backend: {backend} | Note: Unknown Backend, Using native")
+        observer = Observer()
+    for directory in watch_directories(files):
+        observer.schedule(event_filter, path=directory, recursive=False)
+    logger.info(f" Watcher | create_observer | Backend: {backend} | Directories: {watch_directories(files)}")
+    return observer, event_filter
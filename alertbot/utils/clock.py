@@ -0,0 +1,58 @@
+import time
+import threading
+from datetime import datetime, timedelta, timezone
+
+# Every time-gated path reads the wall clock through here, so a replay can swap in a simulated clock.
+
+class SystemClock:
+    def now(self, tz=None):
+        return datetime.now(tz)
+
+    def timestamp(self):
+        return time.time()
+
+class SimulatedClock:
+    def __init__(self, start):
+        if start.tzinfo is None:
+            raise ValueError(" Clock | SimulatedClock | Note: Start Time Must Be Timezone Aware")
+        self._current = start.astimezone(timezone.utc)
+        self._lock = threading.Lock()
+
+    def now(self, tz=None):
+        with self._lock:
+            current = self._current
+        if tz is None:
+            # Same as datetime.now(): naive local time
+            return current.astimezone().replace(tzinfo=None)
+        return current.astimezone(tz)
+
+    def timestamp(self):
+        with self._lock:
+            return self._current.timestamp()
+
+    def set(self, when):
+        if when.tzinfo is None:
+            raise ValueError(" Clock | SimulatedClock | Note: Time Must Be Timezone Aware")
+        with self._lock:
+            self._current = when.astimezone(timezone.utc)
+
+    def advance(self, seconds):
+        with self._lock:
+            self._current += timedelta(seconds=seconds)
+
+_active = SystemClock()
+
+def now(tz=None):
+    return _active.now(tz)
+
+def timestamp():
+    return _active.timestamp()
+
+def set_clock(source):
+    global _active
+    previous = _active
+    _active = source
+    return previous
+
+def reset_clock():
+    set_clock(SystemClock())
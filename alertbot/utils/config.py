@@ -1,3 +1,7 @@
+import os
+import json
+import time
+
 # File For Storing External Data
 
 es_impvol = None
@@ -43,4 +47,103 @@ def set_long_term_bias(es, nq, rty, cl):
     es_long_term_bias = es
     nq_long_term_bias = nq
     rty_long_term_bias = rty
-    cl_long_term_bias = cl       
\ No newline at end of file
+    cl_long_term_bias = cl       
+
+# Ingest Settings
+
+concurrent_reads = False
+read_workers = 4
+condition_workers = 4
+async_discord = True
+
+# File Watching
+
+# "native": watchdog's OS notifications. "polling": scandir/stat of the tracked files only,
+# every poll_interval seconds, for when native notifications flood.
+watch_backend = "native"
+poll_interval = 0.25
+# Repeat events for a path inside this many seconds are coalesced before reaching the handler
+coalesce_interval = 0.05
+# A burst of writes to a file is handled once it has been quiet for debounce_quiet seconds,
+# or debounce_max_latency seconds after its first write if it never settles
+debounce_quiet = 0.5
+debounce_max_latency = 2.0
+
+# Metrics
+
+# Prometheus text at http://metrics_host:metrics_port/metrics; shards serve on the following ports
+metrics_enabled = True
+metrics_host = "127.0.0.1"
+metrics_port = 9464
+
+# Event Traces
+
+# Completed file event -> webhook traces, one JSON line each (per shard when sharded);
+# summarize with: python -m alertbot.utils.event_trace logs/EventTraces*.jsonl
+event_trace_enabled = True
+event_trace_path = os.path.join("logs", "EventTraces.jsonl")
+
+# Process Sharding
+
+# When enabled, each group of products gets its own process with its own watcher, file cache
+# and conditions; main.py supervises them and restarts any that die.
+process_shards = False
+shard_groups = [["ES"], ["NQ"], ["RTY"], ["CL"]]
+shard_restart_delay = 1.0
+shard_max_restart_delay = 60.0
+
+# External Data Snapshot
+
+external_names = [
+    "es_impvol", "nq_impvol", "rty_impvol", "cl_impvol",
+    "es_bias", "nq_bias", "rty_bias", "cl_bias",
+    "es_swing_bias", "nq_swing_bias", "rty_swing_bias", "cl_swing_bias",
+    "es_long_term_bias", "nq_long_term_bias", "rty_long_term_bias", "cl_long_term_bias",
+]
+external_snapshot_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "external_snapshot.json")
+external_snapshot_ttl = 12 * 60 * 60
+
+def save_external_snapshot(path=None):
+    path = path or external_snapshot_path
+    snapshot = {
+        "saved_at": time.time(),
+        "ttl": external_snapshot_ttl,
+        "values": {name: globals()[name] for name in external_names},
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(snapshot, f)
+    os.replace(tmp_path, path)
+
+def load_external_snapshot(path=None, max_age=None):
+    # Returns the snapshot age in seconds, or None when missing, unreadable or expired
+    path = path or external_snapshot_path
+    try:
+        with open(path) as f:
+            snapshot = json.load(f)
+        age = time.time() - snapshot["saved_at"]
+        ttl = max_age if max_age is not None else snapshot.get("ttl", external_snapshot_ttl)
+        values = snapshot["values"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if age < 0 or age > ttl or any(values.get(name) is None for name in external_names):
+        return None
+    globals().update({name: values[name] for name in external_names})
+    return age
+
+# Decision Trace
+
+playbook_debug_logging = False
+log_variables = False
+trace_enabled = True
+trace_playbooks = {}
+trace_sampling = {}
+
+# Condition Triggering
+
+# "all_updated": a condition fires once every required file changed since it last fired.
+# "freshness": any required file change fires it, provided every other required file was
+# written within its staleness budget (seconds, by file type; default for unlisted types).
+trigger_mode = "all_updated"
+staleness_budgets = {"1": 30, "2": 30, "3": 60, "4": 300, "5": 300, "6": 900, "7": 900}
+default_staleness_budget = 120
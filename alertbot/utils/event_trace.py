@@ -0,0 +1,269 @@
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+import threading
+from collections import deque
+from itertools import count
+from alertbot.utils import clock
+
+logger = logging.getLogger(__name__)
+
+# Event traces follow one accepted file event through the pipeline. The trace ID is minted at
+# the first write of a burst; every condition run that burst triggers records monotonic hops
+# (milliseconds since that first write):
+#   settled -> enqueued -> dequeued -> loaded -> checked, plus submitted/sent per embed
+# and waits (e.g. read_wait) as accumulated durations. A run is written to the trace log once
+# check() has returned and every embed it submitted has a webhook response.
+
+hop_order = ("settled", "enqueued", "dequeued", "loaded", "checked", "submitted", "sent")
+
+class EventTrace:
+    __slots__ = ("trace_id", "file_name", "condition", "received", "at", "hops", "waits", "inputs",
+                 "statuses", "pending", "checked", "outcome")
+
+    def __init__(self, trace_id, file_name, condition, received, inputs=None):
+        self.trace_id = trace_id
+        self.file_name = file_name
+        self.condition = condition
+        self.received = received
+        self.at = clock.timestamp()
+        self.hops = []
+        self.waits = {}
+        self.inputs = inputs or {}
+        self.statuses = []
+        self.pending = 0
+        self.checked = False
+        self.outcome = "ok"
+
+    def hop(self, name, when=None):
+        when = time.monotonic() if when is None else when
+        self.hops.append((name, round((when - self.received) * 1000, 2)))
+
+    def record(self):
+        return {
+            "id": self.trace_id,
+            "condition": self.condition,
+            "file": self.file_name,
+            "at": round(self.at, 3),
+            "outcome": self.outcome,
+            "hops": self.hops,
+            "waits": {name: round(seconds * 1000, 2) for name, seconds in self.waits.items()},
+            "inputs": self.inputs,
+            "statuses": self.statuses,
+        }
+
+class EventTracer:
+    def __init__(self, maxlen=2000, flush_interval=2.0):
+        self.enabled = True
+        self.recent = deque(maxlen=maxlen)
+        self.flush_interval = flush_interval
+        self._ids = count(1)
+        self._prefix = f"{os.getpid():x}"
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._live = set()
+        self._file = None
+        self._last_flush = 0.0
+
+    def new_id(self):
+        return f"{self._prefix}-{next(self._ids):x}"
+
+    # ---------------------- Condition Runs ----------------------------- #
+    def start(self, trace_id, file_name, condition, received, inputs=None):
+        if not self.enabled or trace_id is None:
+            return None
+        trace = EventTrace(trace_id, file_name, condition, received, inputs)
+        with self._lock:
+            self._live.add(trace)
+        return trace
+
+    def bind(self, trace):
+        self._local.trace = trace
+
+    def unbind(self):
+        self._local.trace = None
+
+    def current(self):
+        return getattr(self._local, "trace", None)
+
+    def bound(self, function):
+        # Carries the caller's trace into a pool thread (concurrent prep_data reads)
+        trace = self.current()
+        if trace is None:
+            return function
+        def run(*args, **kwargs):
+            self.bind(trace)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.unbind()
+        return run
+
+    def hop(self, name, trace=None):
+        trace = trace or self.current()
+        if trace is not None:
+            with self._lock:
+                trace.hop(name)
+
+    def wait(self, name, seconds, trace=None):
+        trace = trace or self.current()
+        if trace is not None:
+            with self._lock:
+                trace.waits[name] = trace.waits.get(name, 0.0) + seconds
+
+    def submitted(self):
+        # An embed left the condition thread; returns the trace its delivery should resolve
+        trace = self.current()
+        if trace is not None:
+            with self._lock:
+                trace.hop("submitted")
+                trace.pending += 1
+        return trace
+
+    def delivered(self, trace, status):
+        if trace is None:
+            return
+        with self._lock:
+            trace.hop("sent")
+            trace.statuses.append(status)
+            trace.pending -= 1
+            done = trace.checked and trace.pending <= 0
+        if done:
+            self.finish(trace)
+
+    def checked(self, trace, outcome=None):
+        if trace is None:
+            return
+        with self._lock:
+            if outcome is not None:
+                trace.outcome = outcome
+            else:
+                trace.hop("checked")
+            trace.checked = True
+            done = trace.pending <= 0
+        if done:
+            self.finish(trace)
+
+    def finish(self, trace):
+        with self._lock:
+            if trace not in self._live:
+                return
+            self._live.discard(trace)
+            record = trace.record()
+            self.recent.append(record)
+            if self._file is not None:
+                try:
+                    self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+                    now = time.monotonic()
+                    if now - self._last_flush >= self.flush_interval:
+                        self._file.flush()
+                        self._last_flush = now
+                except OSError as e:
+                    logger.error(f" EventTrace | finish | Note: Write Failed: {e}")
+
+    # ---------------------- Trace Log ----------------------------- #
+    def open(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+            self._file = open(path, "a", encoding="utf-8")
+        logger.info(f" EventTrace | open | Path: {path}")
+
+    def close(self):
+        # Runs still waiting on Discord are written as incomplete
+        with self._lock:
+            live = list(self._live)
+        for trace in live:
+            trace.outcome = "incomplete"
+            self.finish(trace)
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+event_traces = EventTracer()
+
+# ---------------------- Analyzer ----------------------------- #
+# Stage name -> (from hop, to hop); "received" is the trace origin (0 ms)
+segments = {
+    "debounce": ("received", "settled"),
+    "trigger": ("settled", "enqueued"),
+    "queue": ("enqueued", "dequeued"),
+    "load": ("dequeued", "loaded"),
+    "check": ("loaded", "checked"),
+    "delivery": ("submitted", "sent"),
+}
+
+def breakdown(record):
+    # {segment: ms} for one trace; first occurrence of the start hop, last of the end hop
+    first, last = {"received": 0.0}, {"received": 0.0}
+    for name, offset in record["hops"]:
+        first.setdefault(name, offset)
+        last[name] = offset
+    result = {}
+    for segment, (start, end) in segments.items():
+        if start in first and end in last:
+            result[segment] = round(last[end] - first[start], 2)
+    result["read_wait"] = record.get("waits", {}).get("read_wait", 0.0)
+    result["total"] = max((offset for _, offset in record["hops"]), default=0.0)
+    return result
+
+def load_records(paths):
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    records.append(json.loads(line))
+    return records
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(int(q * len(values)), len(values) - 1)] if values else 0.0
+
+def analyze(records, top=15, condition=None, session=None, out=sys.stdout):
+    if condition:
+        records = [record for record in records if record["condition"] == condition]
+    if session:
+        records = [record for record in records if time.strftime("%Y-%m-%d", time.localtime(record["at"])) == session]
+    if not records:
+        print(" EventTrace | analyze | Note: No Matching Traces", file=out)
+        return
+    columns = list(segments) + ["read_wait", "total"]
+    rows = [(record, breakdown(record)) for record in records]
+
+    print(f"Slowest {min(top, len(rows))} of {len(rows)} traces (ms)", file=out)
+    print(f"{'time':<9} {'condition':<12} {'file':<7} {'trace':<14} " + " ".join(f"{column:>9}" for column in columns) + "  outcome", file=out)
+    for record, parts in sorted(rows, key=lambda row: row[1]["total"], reverse=True)[:top]:
+        stamp = time.strftime("%H:%M:%S", time.localtime(record["at"]))
+        print(f"{stamp:<9} {record['condition']:<12} {record['file']:<7} {record['id']:<14} "
+              + " ".join(f"{parts.get(column, 0.0):>9.1f}" for column in columns)
+              + f"  {record['outcome']} {record.get('statuses') or ''}", file=out)
+
+    print(f"\nPer condition p50 / p95 (ms)", file=out)
+    print(f"{'condition':<12} {'runs':>5} " + " ".join(f"{column:>15}" for column in columns), file=out)
+    by_condition = {}
+    for record, parts in rows:
+        by_condition.setdefault(record["condition"], []).append(parts)
+    for name, parts_list in sorted(by_condition.items()):
+        cells = []
+        for column in columns:
+            values = [parts[column] for parts in parts_list if column in parts]
+            cells.append(f"{percentile(values, 0.5):>7.1f}/{percentile(values, 0.95):>7.1f}")
+        print(f"{name:<12} {len(parts_list):>5} " + " ".join(cells), file=out)
+
+def main():
+    parser = argparse.ArgumentParser(description="Slowest-path breakdowns from the event trace log")
+    parser.add_argument("paths", nargs="+", help="EventTraces*.jsonl files (one per process when sharded)")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--condition", default=None, help="e.g. PVAT_ES")
+    parser.add_argument("--session", default=None, help="Trading day, YYYY-MM-DD")
+    args = parser.parse_args()
+    analyze(load_records(args.paths), top=args.top, condition=args.condition, session=args.session)
+
+if __name__ == '__main__':
+    main()
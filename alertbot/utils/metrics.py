@@ -0,0 +1,212 @@
+import time
+import bisect
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# In-process metrics in Prometheus text format. Recording is a bisect plus a few additions
+# under a per-metric lock; everything else (rates, cache sizes, queue depths) is read from the
+# existing stats counters by callbacks, and only when /metrics is scraped.
+
+# Seconds: 1ms .. 30s
+default_buckets = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+def escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def format_labels(names, values, extra=None):
+    pairs = [f'{name}="{escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Histogram:
+    def __init__(self, name, documentation, labelnames=(), buckets=default_buckets):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, labels=()):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # [per-bucket counts..., +Inf count, sum]
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {labels: list(values) for labels, values in self._series.items()}
+        for labels, values in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), values[:-1]):
+                cumulative += count
+                bucket_labels = format_labels(self.labelnames, labels, 'le="%s"' % bound)
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{format_labels(self.labelnames, labels)} {values[-1]}")
+            lines.append(f"{self.name}_count{format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+class Counter:
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = dict(self._values)
+        for labels, value in sorted(values.items()):
+            lines.append(f"{self.name}{format_labels(self.labelnames, labels)} {value}")
+        return lines
+
+class CallbackMetric:
+    # Gauge or counter whose values come from function() -> {label values: value} at scrape time
+    def __init__(self, name, documentation, kind, labelnames, function):
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.function = function
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        try:
+            values = self.function()
+        except Exception as e:
+            logger.error(f" Metrics | render | Metric: {self.name} | Note: Callback Failed: {e}")
+            return lines
+        for labels, value in sorted(values.items()):
+            lines.append(f"{self.name}{format_labels(self.labelnames, labels)} {value}")
+        return lines
+
+class StageTimer:
+    __slots__ = ("registry", "stage", "product", "condition", "started")
+
+    def __init__(self, registry, stage, product, condition):
+        self.registry = registry
+        self.stage = stage
+        self.product = product
+        self.condition = condition
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.registry.observe_stage(self.stage, time.perf_counter() - self.started, self.product, self.condition)
+        return False
+
+# ---------------------- Registry ----------------------------- #
+class MetricsRegistry:
+    def __init__(self):
+        self.enabled = True
+        self.metrics = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._server = None
+        # File event -> Discord post, stage by stage:
+        #   receipt, debounce, queue, read_wait, parse, extract, check, embed, send, total
+        # where total runs to the webhook accepting each embed (to check() returning when none was sent)
+        self.stage_seconds = self.register(Histogram(
+            "alertbot_stage_seconds", "Latency of each pipeline stage in seconds", ("stage", "product", "condition")))
+        self.webhook_responses = self.register(Counter(
+            "alertbot_webhook_responses_total", "Discord webhook responses per embed by status code", ("status", "product", "condition")))
+
+    def register(self, metric):
+        with self._lock:
+            self.metrics[metric.name] = metric
+        return metric
+
+    def callback(self, name, documentation, kind, labelnames, function):
+        return self.register(CallbackMetric(name, documentation, kind, labelnames, function))
+
+    # ---------------------- Labels ----------------------------- #
+    def bind(self, product="", condition=""):
+        # Default product/condition labels for stages recorded on this thread (the condition lanes)
+        self._local.labels = (product, condition)
+
+    def unbind(self):
+        self._local.labels = ("", "")
+
+    def labels(self):
+        return getattr(self._local, "labels", ("", ""))
+
+    # ---------------------- Recording ----------------------------- #
+    def observe_stage(self, stage, seconds, product=None, condition=None):
+        if not self.enabled:
+            return
+        if product is None or condition is None:
+            bound_product, bound_condition = self.labels()
+            product = bound_product if product is None else product
+            condition = bound_condition if condition is None else condition
+        self.stage_seconds.observe(seconds, (stage, product, condition))
+
+    def stage(self, stage, product=None, condition=None):
+        return StageTimer(self, stage, product, condition)
+
+    def webhook_response(self, status, product="", condition=""):
+        if self.enabled:
+            self.webhook_responses.inc((str(status), product, condition))
+
+    # ---------------------- Exposition ----------------------------- #
+    def render(self):
+        with self._lock:
+            metrics = list(self.metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def serve(self, host="127.0.0.1", port=9464):
+        if self._server is not None:
+            return self._server
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        except OSError as e:
+            logger.error(f" Metrics | serve | Address: {host}:{port} | Note: Could Not Bind: {e}")
+            return None
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        logger.info(f" Metrics | serve | Note: Serving http://{host}:{port}/metrics")
+        return self._server
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+metrics = MetricsRegistry()
@@ -0,0 +1,114 @@
+import time
+import random
+import logging
+import threading
+from collections import deque
+from itertools import count
+
+logger = logging.getLogger(__name__)
+
+# Decision records are (timestamp, evaluation_id, playbook, product, direction, template, args, result).
+# Nothing is formatted when a criterion is recorded; text is only rendered by dump()/render().
+
+class Evaluation:
+    __slots__ = ("trace", "evaluation_id", "playbook", "product", "direction", "log")
+
+    def __init__(self, trace, evaluation_id, playbook, product, direction, log):
+        self.trace = trace
+        self.evaluation_id = evaluation_id
+        self.playbook = playbook
+        self.product = product
+        self.direction = direction
+        self.log = log
+
+    def __call__(self, condition, template, *args):
+        self.trace.records.append((time.time(), self.evaluation_id, self.playbook, self.product, self.direction, template, args, condition))
+        if self.log is not None:
+            message = template if args else template.replace('%', '%%')
+            self.log.debug(f"%s | input | Product: %s | Direction: %s | {message} --> %s", self.playbook, self.product, self.direction, *args, condition)
+        return condition
+
+def skip(condition, template, *args):
+    return condition
+
+class DecisionTrace:
+    def __init__(self, maxlen=20000):
+        self.records = deque(maxlen=maxlen)
+        self.default_enabled = True
+        self.default_sample_rate = 1.0
+        self.enabled = {}
+        self.sample_rates = {}
+        self.log_decisions = False
+        self.evaluations = 0
+        self._ids = count(1)
+        self._lock = threading.Lock()
+
+    # ---------------------- Controls ----------------------------- #
+    def configure(self, playbook=None, enabled=None, sample_rate=None):
+        with self._lock:
+            if playbook is None:
+                if enabled is not None:
+                    self.default_enabled = enabled
+                if sample_rate is not None:
+                    self.default_sample_rate = sample_rate
+                return
+            if enabled is not None:
+                self.enabled[playbook] = enabled
+            if sample_rate is not None:
+                self.sample_rates[playbook] = sample_rate
+
+    def is_enabled(self, playbook):
+        return self.enabled.get(playbook, self.default_enabled)
+
+    # ---------------------- Recording ----------------------------- #
+    def start(self, playbook, product, direction=None):
+        # Returns the log_condition callable for one evaluation: a recorder when traced, else a no-op
+        if not self.enabled.get(playbook, self.default_enabled):
+            return skip
+        sample_rate = self.sample_rates.get(playbook, self.default_sample_rate)
+        if sample_rate < 1.0 and random.random() >= sample_rate:
+            return skip
+        log = logging.getLogger(f"alertbot.alerts.conditional.{playbook.lower()}") if self.log_decisions else None
+        evaluation_id = next(self._ids)
+        self.evaluations = evaluation_id
+        return Evaluation(self, evaluation_id, playbook, product, direction, log)
+
+    # ---------------------- Consumption ----------------------------- #
+    def snapshot(self, playbook=None, product=None, limit=None):
+        records = [
+            record for record in list(self.records)
+            if (playbook is None or record[2] == playbook) and (product is None or record[3] == product)
+        ]
+        return records[-limit:] if limit else records
+
+    def render(self, record):
+        timestamp, evaluation_id, playbook, product, direction, template, args, result = record
+        try:
+            description = template % args if args else template
+        except (TypeError, ValueError):
+            description = f"{template} {args}"
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+        return f"{stamp} | #{evaluation_id} | {playbook} | Product: {product} | Direction: {direction} | {description} --> {result}"
+
+    def dump(self, path=None, playbook=None, product=None, limit=None):
+        lines = [self.render(record) for record in self.snapshot(playbook, product, limit)]
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + ("\n" if lines else ""))
+            logger.info(f" Trace | dump | Path: {path} | Records: {len(lines)}")
+        return lines
+
+    def stats(self):
+        return {"records": len(self.records), "capacity": self.records.maxlen, "evaluations": self.evaluations}
+
+decision_trace = DecisionTrace()
+
+def apply_trace_config(config):
+    # Playbook criteria go to the decision trace; per-criterion text logging is opt-in
+    logging.getLogger("alertbot.alerts.conditional").setLevel(logging.DEBUG if config.playbook_debug_logging else logging.INFO)
+    decision_trace.configure(enabled=config.trace_enabled)
+    decision_trace.log_decisions = config.playbook_debug_logging
+    for playbook, enabled in config.trace_playbooks.items():
+        decision_trace.configure(playbook, enabled=enabled)
+    for playbook, sample_rate in config.trace_sampling.items():
+        decision_trace.configure(playbook, sample_rate=sample_rate)
@@ -0,0 +1,70 @@
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+# Fails (exit 1) when importing main.py takes longer than the budget, or when a
+# module that should only load on first use is imported eagerly again.
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+deferred_modules = [
+    "gspread",
+    "google.oauth2",
+    "googleapiclient",
+    "investpy",
+    "alertbot.alerts.conditional.playbook",
+    "alertbot.alerts.conditional.contextual",
+]
+
+line_pattern = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+def measure(target, runs):
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+            cwd=root, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise SystemExit(f" ImportBudget | Note: import {target} failed\n{result.stderr[-2000:]}")
+        modules = {}
+        for line in result.stderr.splitlines():
+            match = line_pattern.match(line)
+            if match:
+                modules[match.group(4)] = int(match.group(2))
+        if target not in modules:
+            # Already imported by a parent package, so this run has no timing for it
+            continue
+        if best is None or modules[target] < best.get(target, float("inf")):
+            best = modules
+    if best is None:
+        raise SystemExit(f" ImportBudget | Note: No -X importtime line for {target} in {runs} run(s); cannot measure it")
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time budget check for the bot's entry point")
+    parser.add_argument("--target", default="main")
+    parser.add_argument("--budget-ms", type=float, default=1500.0)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    modules = measure(args.target, args.runs)
+    total_ms = modules[args.target] / 1000
+    print(f" ImportBudget | Target: {args.target} | Cumulative: {total_ms:.1f}ms | Budget: {args.budget_ms:.1f}ms")
+    for name, cumulative in sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"   {cumulative/1000:8.1f}ms  {name}")
+
+    eager = sorted(name for name in modules if any(name == prefix or name.startswith(prefix + ".") for prefix in deferred_modules))
+    failed = False
+    if eager:
+        print(f" ImportBudget | Note: Deferred modules imported at startup: {eager}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f" ImportBudget | Note: Over budget by {total_ms - args.budget_ms:.1f}ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
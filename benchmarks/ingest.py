@@ -0,0 +1,139 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import subprocess
+import statistics
+import pandas as pd
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from alertbot.source.startup import Initialization
+from alertbot.source.extraction import extract_variables
+from benchmarks.streamdata import generate_all
+
+# Times the ingest stages separately per file type and session length:
+#   parse   -> Initialization.read_raw (pd.read_csv + reset_index)
+#   clean   -> Initialization.clean_frame
+#   index   -> Initialization.index_frame
+#   extract -> extract_variables
+# Each run is appended to a JSONL history; the previous run with the same parameters is
+# the baseline for the regression check.
+stages = ("parse", "clean", "index", "extract")
+default_history = os.path.join(root, "benchmarks", "results", "ingest_history.jsonl")
+
+def time_task(task, repeats):
+    samples = {stage: [] for stage in stages}
+    for _ in range(repeats):
+        started = time.perf_counter()
+        data = Initialization.read_raw(task, task["filepath"])
+        parsed = time.perf_counter()
+        data = Initialization.clean_frame(task, data)
+        cleaned = time.perf_counter()
+        data = Initialization.index_frame(data)
+        indexed = time.perf_counter()
+        extract_variables(task, data)
+        extracted = time.perf_counter()
+        samples["parse"].append(parsed - started)
+        samples["clean"].append(cleaned - parsed)
+        samples["index"].append(indexed - cleaned)
+        samples["extract"].append(extracted - indexed)
+    return {stage: statistics.median(values) * 1000 for stage, values in samples.items()}
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+def run(days_list, interval_minutes, names, repeats):
+    results = []
+    with tempfile.TemporaryDirectory(prefix="alertbot-bench-") as out_dir:
+        for days in days_list:
+            tasks = generate_all(os.path.join(out_dir, f"{days}d"), days=days, interval_minutes=interval_minutes, names=names)
+            for task in tasks:
+                timings = time_task(task, repeats)
+                results.append({
+                    "task": task["name"],
+                    "header_row": task["header_row"],
+                    "days": days,
+                    "rows": task["rows"],
+                    **{f"{stage}_ms": round(value, 3) for stage, value in timings.items()},
+                    "total_ms": round(sum(timings.values()), 3),
+                })
+    return results
+
+def load_baseline(history_path, params):
+    if not os.path.exists(history_path):
+        return None
+    baseline = None
+    with open(history_path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if entry.get("params") == params:
+                baseline = entry
+    return baseline
+
+def report(results, baseline, threshold):
+    previous = {(row["task"], row["days"]): row for row in baseline["results"]} if baseline else {}
+    regressions = []
+    print(f"{'task':<7} {'hdr':>3} {'days':>5} {'rows':>6} " + " ".join(f"{stage + '_ms':>10}" for stage in stages) + f" {'total_ms':>10} {'vs_prev':>8}")
+    for row in results:
+        before = previous.get((row["task"], row["days"]))
+        change = ""
+        if before and before["total_ms"] > 0:
+            ratio = row["total_ms"] / before["total_ms"] - 1
+            change = f"{ratio * 100:+.0f}%"
+            if ratio > threshold:
+                regressions.append((row["task"], row["days"], before["total_ms"], row["total_ms"]))
+        print(f"{row['task']:<7} {row['header_row']:>3} {row['days']:>5} {row['rows']:>6} "
+              + " ".join(f"{row[stage + '_ms']:>10.3f}" for stage in stages)
+              + f" {row['total_ms']:>10.3f} {change:>8}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest benchmark on synthetic StreamData TSVs")
+    parser.add_argument("--days", type=int, nargs="+", default=[5, 20, 60], help="Session lengths (trading days per file)")
+    parser.add_argument("--interval", type=int, default=30, help="Bar size in minutes")
+    parser.add_argument("--tasks", nargs="*", default=None, help="Task names, e.g. ES_1 CL_2 (default: all)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--history", default=default_history)
+    parser.add_argument("--threshold", type=float, default=0.20, help="Relative slowdown that counts as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    params = {"days": args.days, "interval": args.interval, "tasks": args.tasks, "repeats": args.repeats}
+    baseline = load_baseline(args.history, params)
+    results = run(args.days, args.interval, args.tasks, args.repeats)
+    regressions = report(results, baseline, args.threshold)
+
+    if not args.no_save:
+        os.makedirs(os.path.dirname(args.history), exist_ok=True)
+        entry = {
+            "recorded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "machine": platform.node(),
+            "params": params,
+            "results": results,
+        }
+        with open(args.history, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    if regressions:
+        print(f"\n Benchmark | Note: {len(regressions)} Regression(s) Over {args.threshold * 100:.0f}% Against Revision {baseline.get('revision')}")
+        for name, days, before, after in regressions:
+            print(f"   {name} ({days}d): {before:.3f}ms -> {after:.3f}ms")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+import os
+import random
+from datetime import datetime, timedelta, time
+from alertbot.source.constants import files, columns_to_drop
+
+# Synthetic SierraChart StreamData exports: a title line, the column-name line, then one
+# row per bar, newest first, with the OHLCV study columns ahead of the task's own columns.
+
+sessions = {
+    'ES': (time(9, 30), time(16, 0)),
+    'NQ': (time(9, 30), time(16, 0)),
+    'RTY': (time(9, 30), time(16, 0)),
+    'CL': (time(9, 0), time(14, 30)),
+}
+base_prices = {'ES': 5200.0, 'NQ': 18200.0, 'RTY': 2050.0, 'CL': 74.0}
+ohlcv_columns = columns_to_drop[:6]
+
+def session_bars(product_name, day, interval_minutes=30):
+    open_time, close_time = sessions[product_name]
+    current = datetime.combine(day, open_time)
+    close = datetime.combine(day, close_time)
+    bars = []
+    while current <= close:
+        bars.append(current)
+        current += timedelta(minutes=interval_minutes)
+    return bars
+
+def trading_days(end_day, days):
+    result = []
+    day = end_day
+    while len(result) < days:
+        if day.weekday() < 5:
+            result.append(day)
+        day -= timedelta(days=1)
+    return result
+
+def generate(task, path, days=20, interval_minutes=30, end_day=None, seed=0):
+    product_name = task["name"].split('_')[0]
+    rnd = random.Random(f"{task['name']}-{seed}")
+    end_day = end_day or datetime(2025, 4, 10).date()
+    price = base_prices[product_name]
+    tick = 0.01 if product_name == 'CL' else 0.25
+    header = ['Date Time'] + ohlcv_columns + task["columns"]
+
+    rows = []
+    for day in reversed(trading_days(end_day, days)):
+        for stamp in session_bars(product_name, day, interval_minutes):
+            price = max(price + rnd.gauss(0, price * 0.0015), tick)
+            high = price + abs(rnd.gauss(0, price * 0.001))
+            low = price - abs(rnd.gauss(0, price * 0.001))
+            ohlcv = [price, high, low, price, rnd.randint(1000, 90000), rnd.randint(500, 40000)]
+            studies = [price + rnd.gauss(0, price * 0.004) for _ in task["columns"]]
+            rows.append((stamp, ohlcv + studies))
+
+    with open(path, "w", newline="") as f:
+        f.write("\t".join(f"StreamData {task['name']}" if i == 0 else "" for i in range(len(header))) + "\n")
+        f.write("\t".join(header) + "\n")
+        for stamp, values in reversed(rows):
+            f.write(stamp.strftime("%Y-%m-%d %H:%M:%S") + "\t" + "\t".join(f"{value:.2f}" for value in values) + "\n")
+    return len(rows)
+
+def generate_all(out_dir, days=20, interval_minutes=30, names=None, seed=0):
+    # Returns copies of the constants tasks pointed at the generated files
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = []
+    for task in files:
+        if names and task["name"] not in names:
+            continue
+        task = dict(task, filepath=os.path.join(out_dir, f"StreamData{task['name']}.tsv"))
+        task["rows"] = generate(task, task["filepath"], days, interval_minutes, seed=seed)
+        tasks.append(task)
+    return tasks
@@ -1,13 +1,18 @@
-from watchdog.observers import Observer
 from alertbot.source.filechange import *
 from alertbot.utils import config
 from alertbot.source.startup import *
+from alertbot.source.monitor import create_monitor
 from alertbot.alerts.periodic.ib_crude import IB_Crude_Alert
 from alertbot.alerts.periodic.ib_equity import IB_Equity_Alert
 from alertbot.alerts.periodic.economic import Economic
 from alertbot.alerts.periodic.gap_equity import Gap_Check_Equity
 from alertbot.alerts.periodic.gap_crude import Gap_Check_Crude
 from logs.Logging_Config import setup_logging
+from alertbot.alerts.delivery import discord_delivery
+from alertbot.utils.trace import decision_trace, apply_trace_config
+from alertbot.utils.metrics import metrics
+from alertbot.utils.event_trace import event_traces
+import signal
 from zoneinfo import ZoneInfo
 import time
 from datetime import timedelta
@@ -24,17 +29,23 @@ def main():
     start_time = time.time()
     setup_logging()
     logger = logging.getLogger(__name__)
+    apply_trace_config(config)
+    metrics.enabled = config.metrics_enabled
+    if config.metrics_enabled:
+        metrics.serve(config.metrics_host, config.metrics_port)
+    event_traces.enabled = config.event_trace_enabled
+    if config.event_trace_enabled and not config.process_shards:
+        event_traces.open(os.path.join(os.getcwd(), config.event_trace_path))
+    trace_path = os.path.join(os.getcwd(), 'logs', 'Decisions.log')
+    dump_signal = getattr(signal, "SIGUSR1", None) or getattr(signal, "SIGBREAK", None)
+    if dump_signal is not None:
+        # kill -USR1 (Ctrl+Break on Windows) writes the in-memory trace without stopping the bot
+        signal.signal(dump_signal, lambda signum, frame: decision_trace.dump(trace_path))
     initialization = Initialization()
     logger.debug(" Main | Note: Fetching External Data\n")
     # ------------------------- Startup Processes ------------------------------ #
-    es_impvol, nq_impvol, rty_impvol, cl_impvol = initialization.grab_impvol(external_impvol)
-    config.set_impvol(es_impvol, nq_impvol, rty_impvol, cl_impvol)
-    es_bias, nq_bias, rty_bias, cl_bias = initialization.grab_bias(external_bias)
-    config.set_bias(es_bias, nq_bias, rty_bias, cl_bias)
-    es_swing_bias, nq_swing_bias, rty_swing_bias, cl_swing_bias = initialization.grab_swing_bias(external_swing_bias)
-    config.set_swing_bias(es_swing_bias, nq_swing_bias, rty_swing_bias, cl_swing_bias)    
-    es_long_term_bias, nq_long_term_bias, rty_long_term_bias, cl_long_term_bias = initialization.grab_long_term_bias(external_long_term_bias)
-    config.set_long_term_bias(es_long_term_bias, nq_long_term_bias, rty_long_term_bias, cl_long_term_bias)     
+    # Snapshot from the last run when fresh (Sheets refresh runs in the background), else one batch-get per spreadsheet
+    initialization.load_external_data()
     # ---------------------- Publish Prep PDFs to Discord ------------------------ #
     ib_equity_alert = IB_Equity_Alert(files)
     ib_crude_alert = IB_Crude_Alert(files)
@@ -84,21 +95,25 @@ def main():
     # ---------------------- Start Monitoring Files ----------------------------- #
     logger.info(" Main | Note: Press Enter To Start Monitoring...")
     input("")
-    event_handler = FileChangeHandler(files, conditions, debounce_interval=1.0)
-    observer = Observer()
-    directories_to_watch = set(os.path.dirname(os.path.abspath(task["filepath"])) for task in files)
-    for directory in directories_to_watch:
-        observer.schedule(event_handler, path=directory, recursive=False)
-    observer.start()
+    # One in-process watcher, or a supervised process per product group (config.process_shards)
+    monitor = create_monitor()
+    monitor.start()
     logger.info(" Main | Note: Monitoring started. Press 'Ctrl+C' to stop.")
     try:
+        last_stats = time.time()
         while True:
             time.sleep(1) 
+            monitor.check()
+            if time.time() - last_stats >= 60:
+                logger.debug(f" Main | {monitor.stats()}")
+                last_stats = time.time()
     except KeyboardInterrupt:
         logger.info(" Main | Note: Shutting down...")
-        observer.stop()
+        monitor.stop()
         scheduler.shutdown()
-    observer.join()
+        discord_delivery.stop(timeout=10)
+        event_traces.close()
+        decision_trace.dump(trace_path)
     end_time = time.time()
     elapsed_time = timedelta(seconds=end_time - start_time)
     logger.info(f"\n Main | Note: Script ran for {elapsed_time}")